@@ -0,0 +1,408 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["pyyaml"]
+# ///
+"""
+Discovery Conflicts - find installed skills that compete for the same prompts.
+
+When two skills quote the same trigger phrase ('review this code'), which
+one a prompt invokes is a coin flip. This gathers every skill's quoted
+triggers across the catalog (ROOT, ~/.claude/skills and the installed
+plugins' newest cached versions) and reports:
+
+- collisions: one trigger quoted by several skills, after normalizing case,
+  punctuation and filler words ('review this code' / 'Review my code!')
+- near duplicates: triggers whose character 3-grams overlap past a Jaccard
+  threshold ('review code' / 'review codebase'), found through MinHash
+  signatures and LSH bands rather than comparing every pair
+- overlapping descriptions: each skill's nearest neighbours by TF-IDF cosine
+  over the description's words, found through an inverted index of terms, so
+  only skills sharing a word are ever scored against each other
+
+The description map is cached by catalog hash under
+~/.cache/trousse/description-neighbours: an unchanged catalog is not rescored.
+
+Usage:
+    discovery_conflicts.py [ROOT]                   # text report
+    discovery_conflicts.py [ROOT] --json
+    discovery_conflicts.py [ROOT] --threshold 0.7   # stricter near-duplicates
+    discovery_conflicts.py [ROOT] --similarity 0.4  # looser description overlap
+"""
+
+import time
+_T0 = time.perf_counter()  # --timing: first line of the script proper
+
+import argparse
+import bisect
+import hashlib
+import heapq
+import json
+import math
+import os
+import re
+import struct
+import sys
+from dataclasses import dataclass, field, asdict
+from functools import lru_cache
+from itertools import combinations
+from pathlib import Path
+from typing import Optional
+
+from lint_skill import CatalogEntry, SkillIndex, catalog_entries, report_timing
+from score_description import describe, prune_cache, trigger_phrases
+
+_T_IMPORTED = time.perf_counter()
+
+# MinHash over character 3-grams: NUM_BANDS bands of BAND_ROWS rows. Two triggers share a band (and
+# become a candidate pair) with probability 1 - (1 - J^rows)^bands for
+# Jaccard J: ~0.99 at J=0.6, ~0.93 at J=0.5, ~0.42 at J=0.3, ~0.15 at J=0.2.
+NUM_BANDS = 20
+BAND_ROWS = 3
+# 'review code' / 'review codebase' is ~0.6, 'run tests' / 'run test' ~0.7.
+NEAR_THRESHOLD = 0.5
+_SIGNATURE_FORMAT = struct.Struct(f'>{NUM_BANDS * BAND_ROWS}I')
+
+_NON_WORD_RE = re.compile(r'[\W_]+')
+# Dropped when normalizing, so 'review this code' and 'review my code' are one
+# trigger, and near-duplicate scores are not propped up by shared filler.
+FILLER_WORDS = frozenset({
+    'a', 'an', 'the', 'this', 'that', 'these', 'those', 'my', 'our', 'your', 'its',
+    'it', 'i', 'me', 'we', 'us', 'to', 'of', 'for', 'on', 'in', 'at', 'with', 'and', 'or',
+    'is', 'are', 'be', 'please',
+})
+
+# TF-IDF cosine past which two descriptions are reported as competing, and
+# how many neighbours each skill lists at most.
+SIMILARITY_THRESHOLD = 0.5
+NEIGHBOURS = 5
+# Words every description shares by convention, on top of the filler words;
+# left in, they would make every pair of skills look alike.
+DESCRIPTION_STOPWORDS = FILLER_WORDS | frozenset({
+    'use', 'used', 'uses', 'using', 'when', 'triggers', 'trigger', 'triggered', 'user',
+    'skill', 'skills', 'also', 'not', 'can', 'do', 'does', 'from', 'by', 'as', 'if',
+    'any', 'all', 'before', 'after', 'you', 'via',
+})
+_DESCRIPTION_WORD_RE = re.compile(r'[^\W_]{2,}')
+
+NEIGHBOUR_CACHE_DIR = (Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+                       / 'trousse' / 'description-neighbours')
+# Maps kept; the least recently used go first.
+NEIGHBOUR_CACHE_LIMIT = 16
+
+
+def normalize_trigger(phrase: str) -> str:
+    """Lowercase words without punctuation or filler, single-spaced.
+
+    A phrase made only of filler keeps its words rather than vanishing.
+    """
+    words = _NON_WORD_RE.sub(' ', phrase.lower()).split()
+    return ' '.join([w for w in words if w not in FILLER_WORDS] or words)
+
+
+def shingles(normalized: str, n: int = 3) -> frozenset[str]:
+    """Character n-grams of the phrase, padded so word edges count."""
+    padded = f" {normalized} "
+    return frozenset(padded[i:i + n] for i in range(max(1, len(padded) - n + 1)))
+
+
+@lru_cache(maxsize=None)
+def _permuted(shingle: str) -> tuple[int, ...]:
+    """The shingle's value under each of the signature's hash functions.
+
+    Each function is a 32-bit slice of one SHAKE-128 digest: stable across
+    runs and processes, unlike hash(). Character 3-grams repeat heavily
+    across a catalog, so each distinct one is hashed once.
+    """
+    digest = hashlib.shake_128(shingle.encode('utf-8')).digest(_SIGNATURE_FORMAT.size)
+    return _SIGNATURE_FORMAT.unpack(digest)
+
+
+def minhash(grams: frozenset[str]) -> tuple[int, ...]:
+    """MinHash signature: per hash function, the least value over the shingles."""
+    return tuple(map(min, zip(*map(_permuted, grams))))
+
+
+def jaccard(a: frozenset, b: frozenset) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+@dataclass
+class TriggerConflict:
+    """Skills quoting the same or a near-identical trigger phrase."""
+    triggers: list[str]  # the phrases as the skills spell them
+    skills: list[str]
+    similarity: float  # 1.0 when they normalize to the same trigger
+
+
+@dataclass
+class TriggerUse:
+    """Every skill quoting one normalized trigger, and how each spelled it."""
+    phrases: list[str] = field(default_factory=list)
+    skills: list[str] = field(default_factory=list)
+
+
+def unique_skills(entries: list[CatalogEntry]) -> list[CatalogEntry]:
+    """One entry per skill name.
+
+    A name seen under two roots (a checkout and the installed plugin, say)
+    counts once, as the first root has it — the same order alias lookup uses.
+    """
+    seen_names = set()
+    unique = []
+    for entry in entries:
+        if entry.name not in seen_names:
+            seen_names.add(entry.name)
+            unique.append(entry)
+    return unique
+
+
+def trigger_index(entries: list[CatalogEntry]) -> dict[str, TriggerUse]:
+    """Normalized trigger -> the skills quoting it."""
+    index: dict[str, TriggerUse] = {}
+    for entry in unique_skills(entries):
+        for phrase in trigger_phrases(describe(entry.description)):
+            key = normalize_trigger(phrase)
+            if not key:
+                continue
+            use = index.setdefault(key, TriggerUse())
+            if phrase not in use.phrases:
+                use.phrases.append(phrase)
+            if entry.name not in use.skills:
+                use.skills.append(entry.name)
+    return index
+
+
+def find_trigger_conflicts(entries: list[CatalogEntry],
+                           threshold: float = NEAR_THRESHOLD) -> list[TriggerConflict]:
+    """Exact and near-duplicate trigger collisions across skills.
+
+    Each distinct trigger is signed once; only triggers that land in the
+    same LSH bucket are compared, so the work grows with the number of
+    similar triggers, not with the square of the catalog.
+    """
+    index = trigger_index(entries)
+    conflicts = [TriggerConflict(triggers=use.phrases, skills=sorted(use.skills), similarity=1.0)
+                 for use in index.values() if len(use.skills) > 1]
+
+    uses = list(index.values())
+    grams = [shingles(key) for key in index]
+    bands: list[dict[tuple, list[int]]] = [{} for _ in range(NUM_BANDS)]
+    for i, gram_set in enumerate(grams):
+        rows = zip(*[iter(minhash(gram_set))] * BAND_ROWS)  # the signature, in bands
+        for bucket, band in zip(bands, rows):
+            bucket.setdefault(band, []).append(i)
+
+    candidates = set()
+    for bucket in bands:
+        for members in bucket.values():
+            if len(members) > 1:
+                candidates.update(combinations(members, 2))
+    for i, j in sorted(candidates):
+        first, second = uses[i], uses[j]
+        if len(first.skills) == 1 and first.skills == second.skills:
+            continue  # one skill's own variants of a phrase
+        similarity = jaccard(grams[i], grams[j])
+        if similarity >= threshold:
+            conflicts.append(TriggerConflict(
+                triggers=[first.phrases[0], second.phrases[0]],
+                skills=sorted(set(first.skills) | set(second.skills)),
+                similarity=round(similarity, 3)))
+    conflicts.sort(key=lambda c: (-c.similarity, c.triggers))
+    return conflicts
+
+
+def description_terms(description: str) -> dict[str, int]:
+    """Word -> count in the description, without filler or boilerplate words."""
+    counts: dict[str, int] = {}
+    for word in _DESCRIPTION_WORD_RE.findall(description.lower()):
+        if word not in DESCRIPTION_STOPWORDS:
+            counts[word] = counts.get(word, 0) + 1
+    return counts
+
+
+def tfidf_vectors(descriptions: list[str]) -> list[dict[str, float]]:
+    """Sparse, unit-length TF-IDF vectors, one per description.
+
+    Term frequency is sublinear (1 + ln tf) so a word repeated in one
+    description does not swamp it; IDF is smoothed, ln((1 + n) / (1 + df)) + 1,
+    so a word in every description still counts a little.
+    """
+    counts = [description_terms(d) for d in descriptions]
+    df: dict[str, int] = {}
+    for terms in counts:
+        for term in terms:
+            df[term] = df.get(term, 0) + 1
+    n = len(descriptions)
+    idf = {term: math.log((1 + n) / (1 + d)) + 1 for term, d in df.items()}
+    vectors = []
+    for terms in counts:
+        vector = {term: (1 + math.log(tf)) * idf[term] for term, tf in terms.items()}
+        norm = math.sqrt(sum(w * w for w in vector.values()))
+        vectors.append({term: w / norm for term, w in vector.items()} if norm else {})
+    return vectors
+
+
+def description_neighbours(entries: list[CatalogEntry],
+                           threshold: float = SIMILARITY_THRESHOLD,
+                           top: int = NEIGHBOURS) -> dict[str, list[tuple[str, float]]]:
+    """Skill -> up to top (other skill, cosine) pairs at or past threshold, most similar first.
+
+    Each row of the similarity matrix is accumulated from the postings of its
+    own terms only (the sparse product V·Vᵀ), so skills with no word in
+    common are never compared. Postings are in skill order and a row only
+    reads past its own skill, so each pair is scored once and credited to
+    both sides. Skills without neighbours are left out.
+    """
+    skills = unique_skills(entries)
+    vectors = tfidf_vectors([e.description for e in skills])
+    postings: dict[str, list[tuple[int, float]]] = {}
+    for i, vector in enumerate(vectors):
+        for term, weight in vector.items():
+            postings.setdefault(term, []).append((i, weight))
+
+    found: list[list[tuple[float, int]]] = [[] for _ in skills]
+    for i, vector in enumerate(vectors):
+        scores: dict[int, float] = {}
+        for term, weight in vector.items():
+            posting = postings[term]
+            for j, other in posting[bisect.bisect_right(posting, (i, math.inf)):]:
+                scores[j] = scores.get(j, 0.0) + weight * other
+        for j, score in scores.items():
+            if score >= threshold - 1e-9:  # float sums of an exact threshold hit
+                found[i].append((score, j))
+                found[j].append((score, i))
+
+    neighbours = {}
+    for i, pairs in enumerate(found):
+        if pairs:
+            best = heapq.nlargest(top, pairs, key=lambda pair: (pair[0], -pair[1]))
+            neighbours[skills[i].name] = [(skills[j].name, round(s, 3)) for s, j in best]
+    return neighbours
+
+
+def cached_description_neighbours(entries: list[CatalogEntry],
+                                  threshold: float = SIMILARITY_THRESHOLD,
+                                  top: int = NEIGHBOURS,
+                                  cache_dir: Optional[Path] = NEIGHBOUR_CACHE_DIR
+                                  ) -> dict[str, list[tuple[str, float]]]:
+    """description_neighbours, cached under cache_dir by catalog hash.
+
+    The key covers every skill's name and description, the threshold and
+    top, and this file, so any edit to the catalog or the scorer rescores.
+    A hit refreshes the entry's mtime; past NEIGHBOUR_CACHE_LIMIT entries,
+    the least recently used are deleted.
+    """
+    if cache_dir is None:
+        return description_neighbours(entries, threshold, top)
+    catalog = [(e.name, e.description) for e in unique_skills(entries)]
+    key = hashlib.blake2b(json.dumps([catalog, threshold, top]).encode('utf-8')
+                          + Path(__file__).read_bytes(), digest_size=16).hexdigest()
+    cache_file = cache_dir / f"{key}.json"
+    try:
+        cached = json.loads(cache_file.read_text())
+        neighbours = {skill: [tuple(pair) for pair in pairs] for skill, pairs in cached.items()}
+    except (OSError, ValueError, TypeError, AttributeError):
+        pass
+    else:
+        try:
+            os.utime(cache_file)
+        except OSError:
+            pass
+        return neighbours
+
+    neighbours = description_neighbours(entries, threshold, top)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(neighbours, separators=(',', ':')))
+        os.replace(tmp, cache_file)
+    except OSError:
+        pass
+    prune_cache(cache_dir, NEIGHBOUR_CACHE_LIMIT)
+    return neighbours
+
+
+def format_conflicts(conflicts: list[TriggerConflict], skills: int,
+                     format_type: str = "text",
+                     neighbours: Optional[dict[str, list[tuple[str, float]]]] = None) -> str:
+    neighbours = neighbours or {}
+    if format_type == "json":
+        return json.dumps({
+            "skills": skills,
+            "trigger_conflicts": [asdict(c) for c in conflicts],
+            "description_neighbours": {
+                skill: [{"skill": other, "similarity": s} for other, s in pairs]
+                for skill, pairs in neighbours.items()
+            },
+        }, indent=2)
+    lines = [
+        f"\n{'='*60}",
+        f"DISCOVERY CONFLICTS: {skills} skills",
+        f"{'='*60}",
+    ]
+    if not conflicts:
+        lines.append("No shared or near-duplicate trigger phrases")
+    for c in conflicts:
+        if c.similarity == 1.0:
+            kind, quoted = "same trigger", " / ".join(f"'{t}'" for t in c.triggers)
+        else:
+            kind, quoted = f"near {c.similarity:.2f}", " ~ ".join(f"'{t}'" for t in c.triggers)
+        lines.append(f"  [{kind}] {quoted}: {', '.join(c.skills)}")
+
+    lines.append("")
+    if not neighbours:
+        lines.append("No overlapping descriptions")
+    else:
+        lines.append(f"Overlapping descriptions ({len(neighbours)} skills):")
+        for skill, pairs in sorted(neighbours.items(), key=lambda kv: (-kv[1][0][1], kv[0])):
+            listed = ", ".join(f"{other} {s:.2f}" for other, s in pairs)
+            lines.append(f"  {skill}: {listed}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Find skills whose triggers compete for the same prompts"
+    )
+    parser.add_argument("root", type=Path, nargs="?",
+                        help="Skills root to include ahead of ~/.claude/skills and plugins")
+    parser.add_argument("--threshold", type=float, default=NEAR_THRESHOLD,
+                        help=f"Jaccard similarity for near-duplicate triggers "
+                             f"(default: {NEAR_THRESHOLD})")
+    parser.add_argument("--similarity", type=float, default=SIMILARITY_THRESHOLD,
+                        help=f"TF-IDF cosine for overlapping descriptions "
+                             f"(default: {SIMILARITY_THRESHOLD})")
+    parser.add_argument("--top", type=int, default=NEIGHBOURS,
+                        help=f"Neighbours listed per skill (default: {NEIGHBOURS})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Rebuild the description map instead of reading the cache")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--timing", action="store_true",
+                        help="Print a startup/imports/work/output breakdown to stderr")
+    args = parser.parse_args()
+    marks = [("start", _T0), ("imports", _T_IMPORTED), ("args", time.perf_counter())]
+
+    index = SkillIndex()
+    roots = list(index.global_roots)
+    if args.root is not None:
+        root = args.root.expanduser().resolve()
+        if not root.is_dir():
+            print(f"Error: Not a directory: {root}")
+            sys.exit(1)
+        roots.insert(0, root)
+    entries = catalog_entries(roots, index)
+    conflicts = find_trigger_conflicts(entries, args.threshold)
+    neighbours = cached_description_neighbours(entries, args.similarity, args.top,
+                                               None if args.no_cache else NEIGHBOUR_CACHE_DIR)
+    marks.append(("work", time.perf_counter()))
+
+    print(format_conflicts(conflicts, len({e.name for e in entries}),
+                           "json" if args.json else "text", neighbours))
+    if args.timing:
+        report_timing(marks + [("output", time.perf_counter())])
+    sys.exit(0 if not conflicts and not neighbours else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -18,17 +18,32 @@ Usage:
     lint_skill.py <skill-path>
     lint_skill.py <skill-path> --json
     lint_skill.py <skill-path> --fix  # Auto-fix where possible
+    lint_skill.py --all <skills-root> [--workers N]  # Every */SKILL.md, one report
+    lint_skill.py --all <skills-root> --format ndjson  # One line per skill as it finishes
+    lint_skill.py --changed [--base REF] <skills-root>  # Only skills changed vs REF
+    lint_skill.py <skill-path> --only structure,resources  # Or --skip register
+    lint_skill.py --watch <skill-path>  # Re-lint on save, print what changed
 """
 
+import time
+_T0 = time.perf_counter()  # --timing: first line of the script proper
+
 import argparse
+import hashlib
 import json
+import os
+import posixpath
 import re
 import sys
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, asdict, replace
+from functools import cached_property
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Iterator, Optional
+
+from score_description import describe, prune_cache
+from timing import report_timing
 
-import yaml
+_T_IMPORTED = time.perf_counter()
 
 
 @dataclass
@@ -52,19 +67,57 @@ class LintResult:
     errors: int = 0
     warnings: int = 0
     score: int = 100  # Start at 100, deduct for issues
+    timings: dict[str, float] = field(default_factory=dict)  # check -> wall ms
+
+
+FRONTMATTER_RE = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+CODE_BLOCK_RE = re.compile(r'```.*?```', re.DOTALL)
+
+# content digest -> (frontmatter, error); shared by every script that imports
+# this module, so a SKILL.md is YAML-parsed once per process.
+_frontmatter_memo: dict[bytes, tuple[Optional[dict], Optional[str]]] = {}
+
+# Entries kept in each content-keyed memo. skill_lsp.py lives for a whole
+# editing session and every keystroke is new content; oldest entries go first.
+MEMO_LIMIT = 1024
+
+
+def _memo_store(memo: dict, key, value):
+    """memo[key] = value, evicting the oldest entry once memo holds MEMO_LIMIT."""
+    while len(memo) >= MEMO_LIMIT:
+        del memo[next(iter(memo))]
+    memo[key] = value
+    return value
 
 
 def extract_frontmatter(content: str) -> tuple[Optional[dict], Optional[str]]:
-    """Extract YAML frontmatter from SKILL.md content."""
+    """Extract YAML frontmatter from SKILL.md content.
+
+    Memoized on the content's hash; callers get their own shallow copy.
+    """
+    key = hashlib.blake2b(content.encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+    cached = _frontmatter_memo.get(key)
+    if cached is None:
+        cached = _memo_store(_frontmatter_memo, key, _parse_frontmatter(content))
+    frontmatter, error = cached
+    return (dict(frontmatter) if frontmatter is not None else None), error
+
+
+def _parse_frontmatter(content: str) -> tuple[Optional[dict], Optional[str]]:
     if not content.startswith('---'):
         return None, "No YAML frontmatter found (must start with ---)"
 
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+    match = FRONTMATTER_RE.match(content)
     if not match:
         return None, "Invalid frontmatter format (missing closing ---)"
 
+    # Deferred: importing yaml is a third of this module's cold start, and
+    # score_description --text never needs it. libyaml's C loader when PyYAML
+    # was built with it — same documents, a fraction of the pure-Python time.
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
     try:
-        frontmatter = yaml.safe_load(match.group(1))
+        frontmatter = yaml.load(match.group(1), Loader=loader)
         if not isinstance(frontmatter, dict):
             return None, "Frontmatter must be a YAML dictionary"
         return frontmatter, None
@@ -72,9 +125,159 @@ def extract_frontmatter(content: str) -> tuple[Optional[dict], Optional[str]]:
         return None, f"Invalid YAML: {e}"
 
 
-def check_frontmatter_fields(frontmatter: dict) -> list[Check]:
+@dataclass
+class SkillDocument:
+    """A SKILL.md parsed once, shared by every check.
+
+    Frontmatter YAML, the frontmatter-free body, the code-free body, headings
+    and line offsets are all derived here, so no check re-splits or re-strips
+    the raw content. ``files`` lists the skill directory (paths relative to
+    it, POSIX-style, files only) the first time a check asks for it, from
+    the same walk that records each file's mode in ``tree``.
+    """
+    skill_dir: Path
+    content: str
+    frontmatter: Optional[dict]
+    frontmatter_error: Optional[str]
+    body: str  # content after the frontmatter block (all of it if none)
+    code_free_body: str  # body with ``` fenced blocks removed
+    lines: list[str]  # content split on newlines
+    line_offsets: list[int]  # character offset of each line in content
+    headings: list[tuple[int, int, str]]  # (line index, level, text), outside fences
+    fences: list[tuple[int, int]]  # content offsets of the body's ``` blocks, in order
+
+    @classmethod
+    def parse(cls, skill_dir: Path, content: str) -> "SkillDocument":
+        frontmatter, error = extract_frontmatter(content)
+        match = FRONTMATTER_RE.match(content)
+        body = content[match.end():] if match else content
+
+        # One fence rule for the whole document: the spans CODE_BLOCK_RE
+        # strips from code_free_body are the spans headings are not read from.
+        fences = [m.span() for m in CODE_BLOCK_RE.finditer(content, len(content) - len(body))]
+        lines = content.split('\n')
+        offsets = []
+        pos = 0
+        headings = []
+        fence = 0
+        for i, line in enumerate(lines):
+            offsets.append(pos)
+            while fence < len(fences) and fences[fence][1] <= pos:
+                fence += 1
+            in_fence = fence < len(fences) and fences[fence][0] <= pos
+            if not in_fence and line.startswith('#'):
+                hashes = len(line) - len(line.lstrip('#'))
+                headings.append((i, hashes, line[hashes:].strip()))
+            pos += len(line) + 1
+
+        return cls(
+            skill_dir=skill_dir,
+            content=content,
+            frontmatter=frontmatter,
+            frontmatter_error=error,
+            body=body,
+            code_free_body=CODE_BLOCK_RE.sub('', body),
+            lines=lines,
+            line_offsets=offsets,
+            headings=headings,
+            fences=fences,
+        )
+
+    @cached_property
+    def tree(self) -> dict[str, int]:
+        """Relative path -> st_mode for every file, walked on first use."""
+        return walk_skill_files(self.skill_dir)
+
+    @cached_property
+    def files(self) -> list[str]:
+        """The skill directory listing, sorted."""
+        return list(self.tree)
+
+    @cached_property
+    def top_dirs(self) -> frozenset[str]:
+        return frozenset(f.split('/', 1)[0] for f in self.files if '/' in f)
+
+    def has_dir(self, name: str) -> bool:
+        """True if the top-level dir ``name`` exists, even empty.
+
+        The walk only lists files, so an empty directory costs one stat.
+        """
+        return name in self.top_dirs or (self.skill_dir / name).exists()
+
+    @cached_property
+    def references(self) -> dict[str, str]:
+        """Text of each top-level references/*.md, read on first use."""
+        texts = {}
+        for rel in self.files:
+            if rel.startswith('references/') and rel.endswith('.md') and rel.count('/') == 1:
+                try:
+                    texts[rel] = (self.skill_dir / rel).read_text(errors='replace')
+                except OSError:
+                    continue
+        return texts
+
+
+# Never part of what a skill ships; not descended into.
+WALK_PRUNE_DIRS = frozenset({'.git', '__pycache__', 'node_modules', '.venv', '.pytest_cache'})
+
+# Files whose mode or contents some check or the cache key reads. Everything
+# else only needs to be listed, which the directory entry does without a stat.
+STAT_PREFIXES = ('references/', 'scripts/')
+
+
+def needs_stat(rel: str) -> bool:
+    """True if rel's stat (mode, mtime) matters to a check or the cache key."""
+    return (rel == 'SKILL.md' or rel.startswith(STAT_PREFIXES)
+            or rel.rsplit('/', 1)[-1] in TEMPLATE_FILE_NAMES)
+
+
+def walk_skill_files(skill_dir: Path) -> dict[str, int]:
+    """Every file under skill_dir -> its st_mode, in sorted path order.
+
+    One scandir walk serves the resource, structure and reference-depth
+    checks and the cache key alike: file type comes from the directory
+    entry, and only files needs_stat() picks are stat'ed; the rest map to
+    mode 0. Symlinked directories are not followed; WALK_PRUNE_DIRS are
+    skipped whole.
+    """
+    return stat_modes(walk_skill_stats(skill_dir))
+
+
+def stat_modes(stats: dict[str, Optional[os.stat_result]]) -> dict[str, int]:
+    """walk_skill_stats' results as walk_skill_files' path -> st_mode."""
+    return {rel: st.st_mode if st else 0 for rel, st in stats.items()}
+
+
+def walk_skill_stats(skill_dir: Path) -> dict[str, Optional[os.stat_result]]:
+    """walk_skill_files with the whole stat result (--watch needs mtimes).
+
+    Files needs_stat() passes over map to None.
+    """
+    tree = {}
+    stack = [('', str(skill_dir))]
+    while stack:
+        prefix, path = stack.pop()
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    rel = prefix + entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in WALK_PRUNE_DIRS:
+                                stack.append((rel + '/', entry.path))
+                        elif entry.is_file():
+                            tree[rel] = entry.stat() if needs_stat(rel) else None
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return dict(sorted(tree.items()))
+
+
+def check_frontmatter_fields(doc: SkillDocument) -> list[Check]:
     """Validate frontmatter has required fields and no extras."""
     checks = []
+    frontmatter = doc.frontmatter
 
     ALLOWED_FIELDS = {'name', 'description', 'license', 'allowed-tools', 'metadata', 'user-invocable'}
 
@@ -115,10 +318,11 @@ def check_frontmatter_fields(frontmatter: dict) -> list[Check]:
     return checks
 
 
-def check_name(frontmatter: dict, skill_dir: Path) -> list[Check]:
+def check_name(doc: SkillDocument) -> list[Check]:
     """Validate skill name conventions."""
     checks = []
-    name = frontmatter.get('name', '')
+    skill_dir = doc.skill_dir
+    name = doc.frontmatter.get('name', '')
 
     if not isinstance(name, str):
         checks.append(Check(
@@ -204,10 +408,10 @@ def check_name(frontmatter: dict, skill_dir: Path) -> list[Check]:
     return checks
 
 
-def check_description(frontmatter: dict) -> list[Check]:
+def check_description(doc: SkillDocument) -> list[Check]:
     """Validate description content and patterns."""
     checks = []
-    desc = frontmatter.get('description', '')
+    desc = doc.frontmatter.get('description', '')
 
     if not isinstance(desc, str):
         checks.append(Check(
@@ -218,32 +422,34 @@ def check_description(frontmatter: dict) -> list[Check]:
         ))
         return checks
 
-    desc = desc.strip()
+    # The same feature record score_description's CSO components read, so a
+    # lint-and-score pass over one description analyses it once.
+    features = describe(desc.strip())
 
     # Length check
-    if len(desc) > 1024:
+    if features.length > 1024:
         checks.append(Check(
             name="description_length",
             passed=False,
-            message=f"Description too long ({len(desc)} chars, max 1024)",
+            message=f"Description too long ({features.length} chars, max 1024)",
             severity="error"
         ))
-    elif len(desc) < 50:
+    elif features.length < 50:
         checks.append(Check(
             name="description_length",
             passed=False,
-            message=f"Description too short ({len(desc)} chars, aim for 100-500)",
+            message=f"Description too short ({features.length} chars, aim for 100-500)",
             severity="warning"
         ))
     else:
         checks.append(Check(
             name="description_length",
             passed=True,
-            message=f"Description length OK ({len(desc)} chars)"
+            message=f"Description length OK ({features.length} chars)"
         ))
 
     # Angle brackets
-    if '<' in desc or '>' in desc:
+    if features.has_angle_brackets:
         checks.append(Check(
             name="description_brackets",
             passed=False,
@@ -252,7 +458,7 @@ def check_description(frontmatter: dict) -> list[Check]:
         ))
 
     # Third person check (should NOT start with "Use" or "Invoke")
-    first_word = desc.split()[0] if desc else ""
+    first_word = features.first_word
     if first_word.lower() in ('use', 'invoke', 'call', 'run'):
         checks.append(Check(
             name="description_third_person",
@@ -263,9 +469,7 @@ def check_description(frontmatter: dict) -> list[Check]:
         ))
 
     # Timing patterns (CSO)
-    timing_patterns = ['before', 'first', 'mandatory', 'after', 'when']
-    has_timing = any(p in desc.lower() for p in timing_patterns)
-    if has_timing:
+    if features.gates & {'before', 'first', 'mandatory', 'after', 'when'}:
         checks.append(Check(
             name="description_timing",
             passed=True,
@@ -281,12 +485,11 @@ def check_description(frontmatter: dict) -> list[Check]:
         ))
 
     # Trigger phrases in quotes
-    trigger_phrases = re.findall(r"'[^']+?'", desc)
-    if trigger_phrases:
+    if features.single_quoted:
         checks.append(Check(
             name="description_triggers",
             passed=True,
-            message=f"Has {len(trigger_phrases)} trigger phrase(s) in quotes"
+            message=f"Has {len(features.single_quoted)} trigger phrase(s) in quotes"
         ))
     else:
         checks.append(Check(
@@ -298,7 +501,7 @@ def check_description(frontmatter: dict) -> list[Check]:
         ))
 
     # (user) tag check
-    if desc.endswith('(user)'):
+    if features.has_user_tag:
         checks.append(Check(
             name="description_user_tag",
             passed=True,
@@ -316,15 +519,15 @@ def check_description(frontmatter: dict) -> list[Check]:
 
     # Vague pattern detection
     # "Provides" is only vague when not followed by specific content
-    vague_patterns = [
-        (r'\bhelps? with\b', "'Helps with' is vague"),
-        (r'\bassists?\b', "'Assists' is vague"),
-        (r'\bprovides?\s+(?:a\s+)?(?:way|tool|method)\b', "'Provides a way/tool/method' is vague - name the thing"),
-        (r'\bcan be used\b', "Passive voice - use active"),
+    vague_messages = [
+        ('helps_with', "'Helps with' is vague"),
+        ('assists', "'Assists' is vague"),
+        ('provides_a_way', "'Provides a way/tool/method' is vague - name the thing"),
+        ('can_be_used', "Passive voice - use active"),
     ]
 
-    for pattern, msg in vague_patterns:
-        if re.search(pattern, desc, re.IGNORECASE):
+    for key, msg in vague_messages:
+        if key in features.vague:
             checks.append(Check(
                 name="description_vague",
                 passed=False,
@@ -335,10 +538,10 @@ def check_description(frontmatter: dict) -> list[Check]:
     return checks
 
 
-def check_structure(skill_dir: Path, content: str) -> list[Check]:
+def check_structure(doc: SkillDocument) -> list[Check]:
     """Check SKILL.md structure and organization."""
     checks = []
-    lines = content.split('\n')
+    lines = doc.lines
 
     # Line count
     if len(lines) > 500:
@@ -365,10 +568,11 @@ def check_structure(skill_dir: Path, content: str) -> list[Check]:
 
     # Anti-patterns are less important for methodology/reference skills
     # (those with references/ dirs — they're cookbooks, not process gates)
-    has_references = (skill_dir / 'references').exists()
+    has_references = doc.has_dir('references')
+    heading_lines = [lines[i] for i, _level, _text in doc.headings]
 
     for section, pattern in section_patterns.items():
-        found = any(re.match(pattern, line, re.IGNORECASE) for line in lines)
+        found = any(re.match(pattern, line, re.IGNORECASE) for line in heading_lines)
         if not found and section == 'anti_patterns' and has_references:
             severity = "info"  # Downgrade for reference-heavy skills
         else:
@@ -381,15 +585,15 @@ def check_structure(skill_dir: Path, content: str) -> list[Check]:
         ))
 
     # Reference depth check
-    refs_dir = skill_dir / 'references'
-    if refs_dir.exists():
-        nested = list(refs_dir.glob('**/*.md'))
-        too_deep = [f for f in nested if len(f.relative_to(refs_dir).parts) > 1]
+    if has_references:
+        nested = [f[len('references/'):] for f in doc.files
+                  if f.startswith('references/') and f.endswith('.md')]
+        too_deep = [f for f in nested if '/' in f]
         if too_deep:
             checks.append(Check(
                 name="reference_depth",
                 passed=False,
-                message=f"Nested references found: {[str(f.relative_to(refs_dir)) for f in too_deep[:3]]}",
+                message=f"Nested references found: {too_deep[:3]}",
                 severity="warning",
                 suggestion="Keep references one level deep from SKILL.md"
             ))
@@ -403,48 +607,351 @@ def check_structure(skill_dir: Path, content: str) -> list[Check]:
     return checks
 
 
-def check_resources(skill_dir: Path) -> list[Check]:
+# Files the skill-creator template ships; left in place they are flagged.
+TEMPLATE_FILE_NAMES = ('example.py', 'example_asset.txt', 'api_reference.md')
+
+# Template leftovers announce themselves early; a fixture that happens to
+# share a template's name is not read past this.
+TEMPLATE_READ_LIMIT = 64 * 1024
+
+
+def read_template_head(path: Path) -> Optional[bytes]:
+    """The first TEMPLATE_READ_LIMIT bytes of path, or None if unreadable."""
+    try:
+        with open(path, 'rb') as f:
+            return f.read(TEMPLATE_READ_LIMIT)
+    except OSError:
+        return None
+
+
+def check_resources(doc: SkillDocument) -> list[Check]:
     """Check scripts, references, assets organization."""
     checks = []
+    skill_dir = doc.skill_dir
+
+    templates = {name: [] for name in TEMPLATE_FILE_NAMES}
+    for rel, mode in doc.tree.items():
+        name = rel.rsplit('/', 1)[-1]
+        if name in templates:
+            templates[name].append(rel)
+
+        # Scripts should be executable
+        is_script = rel.startswith('scripts/') and rel.endswith('.py') and rel.count('/') == 1
+        if is_script and not mode & 0o111:
+            script = skill_dir / rel
+            checks.append(Check(
+                name="script_executable",
+                passed=False,
+                message=f"{script.name} is not executable",
+                severity="warning",
+                auto_fixable=True,
+                suggestion=f"chmod +x {script}"
+            ))
 
-    # Scripts should be executable
-    scripts_dir = skill_dir / 'scripts'
-    if scripts_dir.exists():
-        py_files = list(scripts_dir.glob('*.py'))
-        for script in py_files:
-            if not script.stat().st_mode & 0o111:
+    # Check for example files that should be deleted
+    for found in templates.values():
+        for rel in found:
+            # Check if it's still template content
+            head = read_template_head(skill_dir / rel)
+            if head is None:
+                continue
+            content = head.decode('utf-8', errors='replace')
+            if 'TODO' in content or 'placeholder' in content.lower():
                 checks.append(Check(
-                    name="script_executable",
+                    name="template_files",
                     passed=False,
-                    message=f"{script.name} is not executable",
+                    message=f"Template file not customized: {rel}",
                     severity="warning",
-                    auto_fixable=True,
-                    suggestion=f"chmod +x {script}"
+                    suggestion="Customize or delete template files"
                 ))
 
-    # Check for example files that should be deleted
-    example_patterns = ['example.py', 'example_asset.txt', 'api_reference.md']
-    for pattern in example_patterns:
-        found = list(skill_dir.rglob(pattern))
-        for f in found:
-            # Check if it's still template content
-            try:
-                content = f.read_text()
-                if 'TODO' in content or 'placeholder' in content.lower():
-                    checks.append(Check(
-                        name="template_files",
-                        passed=False,
-                        message=f"Template file not customized: {f.relative_to(skill_dir)}",
-                        severity="warning",
-                        suggestion="Customize or delete template files"
-                    ))
-            except:
-                pass
+    return checks
+
 
+# [text](target "title") — the target, minus any <> wrapping.
+MD_LINK_RE = re.compile(r'\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+# `scripts/foo.py` — skill-root-relative by convention, in SKILL.md and references alike.
+BACKTICK_PATH_RE = re.compile(r'`((?:references|scripts|assets)/[\w./-]+)`')
+# references/foo.md in running text (definitionally skill-local).
+BARE_REFERENCE_RE = re.compile(r'(?<![`\w/])references/[\w.-]+\.md(?![`\w])')
+
+
+def _link_targets(text: str, code_free: str, base: str) -> list[tuple[str, str, str]]:
+    """(kind, as written, skill-relative path) for every local path in text.
+
+    Markdown links resolve against base (the linking file's directory);
+    backtick and bare paths are skill-root-relative. External URLs, anchors,
+    absolute and ~/$-paths, placeholders and template names are skipped.
+    """
+    found = []
+    for target in MD_LINK_RE.findall(code_free):
+        target = target.split('#', 1)[0].split('?', 1)[0]
+        if not target or ':' in target or target[0] in '/~$<{':
+            continue
+        found.append(("link", target, posixpath.normpath(posixpath.join(base, target))))
+    for path in BACKTICK_PATH_RE.findall(code_free):
+        found.append(("path", path, posixpath.normpath(path)))
+    # Fenced examples name references too; those are still the skill's own.
+    for path in BARE_REFERENCE_RE.findall(text):
+        found.append(("path", path, path))
+    return [(kind, raw, rel) for kind, raw, rel in found
+            if not rel.startswith('../') and rel != '..'
+            and not any(t in rel for t in ('api_reference.md', 'example'))]
+
+
+def check_links(doc: SkillDocument) -> list[Check]:
+    """Resolve every local link and path against the skill's own file set.
+
+    SKILL.md and, one level down, each references/*.md are scanned. Lookups
+    are set membership against doc.files (plus their parent directories), so
+    a catalog costs one listing per skill and no stat per link. Broken
+    markdown links and references/ paths are warnings; a missing scripts/ or
+    assets/ path is info, since skills also name tools that ship elsewhere
+    (skill-creator's init_skill.py, say).
+    """
+    checks = []
+    files = set(doc.files)
+    dirs = {f.rsplit('/', 1)[0] for f in files if '/' in f}
+    sources = [('SKILL.md', doc.content, doc.code_free_body, '')]
+    sources += [(rel, text, CODE_BLOCK_RE.sub('', text), 'references')
+                for rel, text in doc.references.items()]
+
+    total = 0
+    broken = {}
+    for source, text, code_free, base in sources:
+        for kind, raw, rel in _link_targets(text, code_free, base):
+            total += 1
+            if rel in files or rel in dirs or (source, rel) in broken:
+                continue
+            broken[(source, rel)] = (kind, raw)
+
+    for (source, rel), (kind, raw) in broken.items():
+        local = kind == "link" or rel.startswith('references/')
+        checks.append(Check(
+            name="link_broken" if local else "path_missing",
+            passed=False,
+            message=f"{source}: '{raw}' not found in skill" + (f" (-> {rel})" if raw != rel else ""),
+            severity="warning" if local else "info",
+            suggestion=None if local else "Fine if the script ships elsewhere; otherwise fix the path",
+        ))
+    if not broken:
+        checks.append(Check(
+            name="links",
+            passed=True,
+            message=f"All {total} local links and paths resolve"
+        ))
     return checks
 
 
-def check_register(content: str) -> list[Check]:
+# A word or run of punctuation costs a token per 4 characters, rounded up:
+# offline and close enough to rank and budget by, not to bill by.
+_TOKEN_PIECE_RE = re.compile(r"\w+|[^\w\s]+")
+_token_memo: dict[bytes, int] = {}
+
+# Past this, the always-loaded part of a skill is heavy...
+HEAVY_BODY_TOKENS = 4000
+# ...and if its references hold less than this share of it, the detail that
+# could load on demand is loading every time instead.
+THIN_REFERENCE_RATIO = 0.5
+PATH_SEARCH_LIMIT = 10000
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of text, memoized on the content's hash."""
+    key = hashlib.blake2b(text.encode('utf-8', errors='surrogatepass'), digest_size=16).digest()
+    tokens = _token_memo.get(key)
+    if tokens is None:
+        tokens = _memo_store(_token_memo, key, sum((len(piece) + 3) // 4
+                                                   for piece in _TOKEN_PIECE_RE.findall(text)))
+    return tokens
+
+
+@dataclass
+class ContextCost:
+    """Estimated tokens a skill puts into context, by when they load."""
+    body: int  # SKILL.md, loaded whenever the skill fires
+    references: dict[str, int] = field(default_factory=dict)  # loaded when followed
+    worst_path: list[str] = field(default_factory=list)  # references, in link order
+    worst_path_tokens: int = 0  # body plus every reference on worst_path
+
+    @property
+    def top_heavy(self) -> bool:
+        """Heavy always-loaded body, thin on-demand references."""
+        return (self.body > HEAVY_BODY_TOKENS
+                and sum(self.references.values()) < self.body * THIN_REFERENCE_RATIO)
+
+
+def context_cost(doc: SkillDocument) -> ContextCost:
+    """Token weight of the body, each reference, and the heaviest link chain.
+
+    The chain starts at SKILL.md and follows links between top-level
+    references (each visited once per chain), so it is the most an agent
+    reading every link it meets could pull in. Densely cross-linked
+    references are searched up to PATH_SEARCH_LIMIT steps; past that the
+    heaviest chain found so far stands.
+    """
+    refs = {rel: estimate_tokens(text) for rel, text in doc.references.items()}
+    links = {}
+    sources = [('SKILL.md', doc.content, doc.code_free_body, '')]
+    sources += [(rel, text, CODE_BLOCK_RE.sub('', text), 'references')
+                for rel, text in doc.references.items()]
+    for source, text, code_free, base in sources:
+        targets = [rel for _, _, rel in _link_targets(text, code_free, base) if rel in refs]
+        links[source] = list(dict.fromkeys(t for t in targets if t != source))
+
+    budget = [PATH_SEARCH_LIMIT]
+
+    def heaviest(node: str, seen: frozenset) -> tuple[int, list[str]]:
+        best = (0, [])
+        for nxt in links.get(node, ()):
+            if nxt not in seen and budget[0] > 0:
+                budget[0] -= 1
+                tokens, path = heaviest(nxt, seen | {nxt})
+                if tokens + refs[nxt] > best[0]:
+                    best = (tokens + refs[nxt], [nxt] + path)
+        return best
+
+    body = estimate_tokens(doc.content)
+    path_tokens, path = heaviest('SKILL.md', frozenset())
+    return ContextCost(body=body, references=refs, worst_path=path,
+                       worst_path_tokens=body + path_tokens)
+
+
+def check_context_cost(doc: SkillDocument) -> list[Check]:
+    """Flag a heavy always-loaded SKILL.md whose references are thin."""
+    cost = context_cost(doc)
+    in_refs = sum(cost.references.values())
+    if cost.top_heavy:
+        return [Check(
+            name="context_heavy_body",
+            passed=False,
+            message=f"SKILL.md loads ~{cost.body} tokens every time it fires; "
+                    f"references hold only ~{in_refs}",
+            severity="info",
+            suggestion="Move detail the agent needs only sometimes into references/"
+        )]
+    return [Check(
+        name="context_cost",
+        passed=True,
+        message=f"~{cost.body} tokens on load, ~{in_refs} in references "
+                f"(worst path ~{cost.worst_path_tokens})"
+    )]
+
+
+# Common abbreviations — ALL CAPS but not emphasis.
+REGISTER_ABBREVIATIONS = frozenset({
+    # Protocols and standards
+    'API', 'CLI', 'SQL', 'URL', 'CSS', 'HTML', 'JSON', 'YAML', 'XML',
+    'SSH', 'HTTP', 'HTTPS', 'SVG', 'PNG', 'PDF', 'CSV', 'TSV', 'JSONL',
+    'GTD', 'MCP', 'CSO', 'CDP', 'EOF', 'PII', 'CRDT', 'DOT', 'PWA',
+    'WCAG', 'OWASP', 'TTY', 'UUID', 'SDK', 'IDE', 'GCP', 'AWS', 'CDN',
+    'DNS', 'TLS', 'RGB', 'HEX', 'HSL', 'ANSI', 'POSIX', 'NVM',
+    # Data types and formats
+    'SPSS', 'DOCX', 'XLSX', 'PPTX', 'LLM', 'BQ', 'BOOL', 'INT',
+    'STRING', 'FLOAT', 'DATE', 'TIMESTAMP', 'BYTES', 'STRUCT',
+    'NUMERIC', 'COLUMNS', 'NULL', 'TRUE', 'FALSE',
+    # SQL keywords (often appear in ALL CAPS by convention)
+    'SELECT', 'FROM', 'WHERE', 'JOIN', 'LEFT', 'RIGHT', 'INNER',
+    'GROUP', 'ORDER', 'LIMIT', 'INSERT', 'UPDATE', 'DELETE', 'CREATE',
+    'DROP', 'ALTER', 'INDEX', 'TABLE', 'VIEW', 'UNION', 'CASE', 'WHEN',
+    'THEN', 'ELSE', 'END', 'COUNT', 'SUM', 'AVG', 'MIN', 'MAX',
+    'DISTINCT', 'HAVING', 'PARTITION', 'OVER', 'CAST',
+    # SQL / BigQuery aggregation and analytic terms
+    'AGG', 'ARRAY', 'UNNEST', 'COALESCE', 'NULLIF', 'IFNULL', 'IIF',
+    'EXCEPT', 'INTERSECT', 'PIVOT', 'UNPIVOT', 'QUALIFY',
+    # Spreadsheet function names (Excel / Sheets)
+    'COUNTIF', 'COUNTIFS', 'SUMIF', 'SUMIFS', 'AVERAGEIF', 'AVERAGEIFS',
+    'VLOOKUP', 'HLOOKUP', 'XLOOKUP', 'INDEX', 'MATCH', 'LOOKUP',
+    'IFERROR', 'ISBLANK', 'ISNA', 'ISNUMBER', 'ISTEXT',
+    # Column / field abbreviations common in data analysis
+    'RLD', 'REC', 'AGE', 'SEX', 'DOB', 'DOD', 'REF', 'OBS', 'ADM',
+    # Environment / shell conventions
+    'HOME', 'PATH', 'LANG', 'USER',
+    # Platform / tool names
+    'CLAUDE', 'CLAUDECODE', 'TUI', 'SKILL',
+    # Security / package management
+    'SHA', 'CVE', 'PKG', 'GPG', 'PGP', 'HMAC',
+    # Common short words that appear in ALL CAPS in technical docs
+    'ONE', 'TWO', 'NOT', 'AND', 'FOR', 'THE', 'ALL',
+})
+
+# Prohibitions and positive framings. Single words are matched against the
+# sets; two-word prohibitions are matched as adjacent token pairs.
+NEGATION_TERMS = frozenset({"don't", "dont", "never", "avoid", "cannot", "shouldn't", "shouldnt"})
+NEGATION_PHRASES = frozenset({("do", "not"), ("must", "not"), ("should", "not")})
+POSITIVE_TERMS = frozenset({
+    "use", "prefer", "ensure", "produce", "always", "consider", "verify", "check",
+})
+THREAT_OPENERS = ('warning', 'critical', 'danger', 'never', 'do not', 'must not', 'failure')
+
+# A word, plus the non-word run before it (to tell "do not" from "do, not")
+_WORD_RE = re.compile(r"(\W*)(\w+(?:'\w+)*)")
+
+
+@dataclass
+class RegisterMetrics:
+    """Everything the register check measures, from one pass over the text."""
+    emphatic_caps: list[str] = field(default_factory=list)
+    negations: int = 0
+    positives: int = 0
+    opening_threats: list[str] = field(default_factory=list)
+
+
+def analyze_register(text: str) -> RegisterMetrics:
+    """Measure the register of (code- and frontmatter-free) skill text.
+
+    One split into lines picks out the body (headings excluded) and the
+    opening lines; one tokenizing pass over the body then classifies every
+    word against the frozen sets. Words joined by an apostrophe ("API's")
+    are classified segment by segment, as a regex word boundary would.
+    """
+    metrics = RegisterMetrics()
+    body_lines = []
+    opening_lines = []
+    for line in text.split('\n'):
+        if not line.startswith('#'):
+            body_lines.append(line)
+        if len(opening_lines) < 3:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                opening_lines.append(line)
+    body_text = '\n'.join(body_lines)
+
+    # One pass: each word with the non-word run before it (for phrases)
+    prev = None  # previous word (its last apostrophe segment), lower-cased
+    for gap, token in _WORD_RE.findall(body_text):
+        lower = token.lower()
+        if token.isupper() or ("'" in token and not token.islower()):
+            for seg in token.split("'"):
+                if len(seg) >= 3 and seg.isascii() and seg.isalpha() and seg.isupper() \
+                        and seg not in REGISTER_ABBREVIATIONS:
+                    metrics.emphatic_caps.append(seg)
+        if lower in NEGATION_TERMS:
+            metrics.negations += 1
+        elif lower in POSITIVE_TERMS:
+            metrics.positives += 1
+        elif "'" in lower:
+            segments = lower.split("'")
+            for seg in segments:
+                if seg in NEGATION_TERMS:
+                    metrics.negations += 1
+                elif seg in POSITIVE_TERMS:
+                    metrics.positives += 1
+            if (prev, segments[0]) in NEGATION_PHRASES and gap.isspace():
+                metrics.negations += 1
+            prev = segments[-1]
+            continue
+        # "do not" / "must not" / "should not", across any whitespace
+        if lower == "not" and (prev, lower) in NEGATION_PHRASES and gap.isspace():
+            metrics.negations += 1
+        prev = lower
+
+    opening_text = ' '.join(opening_lines).lower()
+    metrics.opening_threats = [t for t in THREAT_OPENERS if t in opening_text]
+    return metrics
+
+
+def check_register(doc: SkillDocument) -> list[Check]:
     """Check emotional register of skill content.
 
     Skills with calmer, more positive framing produce better outputs.
@@ -453,51 +960,9 @@ def check_register(content: str) -> list[Check]:
     """
     checks = []
 
-    # Strip code blocks and frontmatter before analysis
-    stripped = re.sub(r'```.*?```', '', content, flags=re.DOTALL)
-    stripped = re.sub(r'^---\n.*?\n---', '', stripped, flags=re.DOTALL)
-
-    # Count ALL CAPS words (3+ chars, outside headings)
-    lines_no_headings = [l for l in stripped.split('\n') if not l.startswith('#')]
-    body_text = '\n'.join(lines_no_headings)
-    caps_words = re.findall(r'\b[A-Z]{3,}\b', body_text)
-    # Filter out common abbreviations
-    abbreviations = {
-        # Protocols and standards
-        'API', 'CLI', 'SQL', 'URL', 'CSS', 'HTML', 'JSON', 'YAML', 'XML',
-        'SSH', 'HTTP', 'HTTPS', 'SVG', 'PNG', 'PDF', 'CSV', 'TSV', 'JSONL',
-        'GTD', 'MCP', 'CSO', 'CDP', 'EOF', 'PII', 'CRDT', 'DOT', 'PWA',
-        'WCAG', 'OWASP', 'TTY', 'UUID', 'SDK', 'IDE', 'GCP', 'AWS', 'CDN',
-        'DNS', 'TLS', 'RGB', 'HEX', 'HSL', 'ANSI', 'POSIX', 'NVM',
-        # Data types and formats
-        'SPSS', 'DOCX', 'XLSX', 'PPTX', 'LLM', 'BQ', 'BOOL', 'INT',
-        'STRING', 'FLOAT', 'DATE', 'TIMESTAMP', 'BYTES', 'STRUCT',
-        'NUMERIC', 'COLUMNS', 'NULL', 'TRUE', 'FALSE',
-        # SQL keywords (often appear in ALL CAPS by convention)
-        'SELECT', 'FROM', 'WHERE', 'JOIN', 'LEFT', 'RIGHT', 'INNER',
-        'GROUP', 'ORDER', 'LIMIT', 'INSERT', 'UPDATE', 'DELETE', 'CREATE',
-        'DROP', 'ALTER', 'INDEX', 'TABLE', 'VIEW', 'UNION', 'CASE', 'WHEN',
-        'THEN', 'ELSE', 'END', 'COUNT', 'SUM', 'AVG', 'MIN', 'MAX',
-        'DISTINCT', 'HAVING', 'PARTITION', 'OVER', 'CAST',
-        # SQL / BigQuery aggregation and analytic terms
-        'AGG', 'ARRAY', 'UNNEST', 'COALESCE', 'NULLIF', 'IFNULL', 'IIF',
-        'EXCEPT', 'INTERSECT', 'PIVOT', 'UNPIVOT', 'QUALIFY',
-        # Spreadsheet function names (Excel / Sheets)
-        'COUNTIF', 'COUNTIFS', 'SUMIF', 'SUMIFS', 'AVERAGEIF', 'AVERAGEIFS',
-        'VLOOKUP', 'HLOOKUP', 'XLOOKUP', 'INDEX', 'MATCH', 'LOOKUP',
-        'IFERROR', 'ISBLANK', 'ISNA', 'ISNUMBER', 'ISTEXT',
-        # Column / field abbreviations common in data analysis
-        'RLD', 'REC', 'AGE', 'SEX', 'DOB', 'DOD', 'REF', 'OBS', 'ADM',
-        # Environment / shell conventions
-        'HOME', 'PATH', 'LANG', 'USER',
-        # Platform / tool names
-        'CLAUDE', 'CLAUDECODE', 'TUI', 'SKILL',
-        # Security / package management
-        'SHA', 'CVE', 'PKG', 'GPG', 'PGP', 'HMAC',
-        # Common short words that appear in ALL CAPS in technical docs
-        'ONE', 'TWO', 'NOT', 'AND', 'FOR', 'THE', 'ALL',
-    }
-    emphatic_caps = [w for w in caps_words if w not in abbreviations]
+    # Analysis runs on the body with code blocks and frontmatter stripped
+    metrics = analyze_register(doc.code_free_body)
+    emphatic_caps = metrics.emphatic_caps
 
     if len(emphatic_caps) > 5:
         checks.append(Check(
@@ -514,18 +979,8 @@ def check_register(content: str) -> list[Check]:
             message=f"{len(emphatic_caps)} ALL CAPS word(s) — within range"
         ))
 
-    # Negation ratio: count prohibitions vs positive framings
-    negation_patterns = [
-        r"\bdon'?t\b", r"\bnever\b", r"\bavoid\b", r"\bdo not\b",
-        r"\bmust not\b", r"\bcannot\b", r"\bshould not\b", r"\bshouldn'?t\b",
-    ]
-    positive_patterns = [
-        r"\buse\b", r"\bprefer\b", r"\bensure\b", r"\bproduce\b",
-        r"\balways\b", r"\bconsider\b", r"\bverify\b", r"\bcheck\b",
-    ]
-
-    neg_count = sum(len(re.findall(p, body_text, re.IGNORECASE)) for p in negation_patterns)
-    pos_count = sum(len(re.findall(p, body_text, re.IGNORECASE)) for p in positive_patterns)
+    neg_count = metrics.negations
+    pos_count = metrics.positives
     total = neg_count + pos_count
 
     if total > 0:
@@ -545,20 +1000,7 @@ def check_register(content: str) -> list[Check]:
                 message=f"Balanced framing: {neg_count} prohibitions, {pos_count} positive ({neg_ratio:.0%} negative)"
             ))
 
-    # Opening register — first 3 non-blank, non-heading lines after frontmatter
-    body_lines = stripped.strip().split('\n')
-    opening_lines = []
-    for line in body_lines:
-        line = line.strip()
-        if not line or line.startswith('#'):
-            continue
-        opening_lines.append(line)
-        if len(opening_lines) >= 3:
-            break
-
-    opening_text = ' '.join(opening_lines).lower()
-    threat_openers = ['warning', 'critical', 'danger', 'never', 'do not', 'must not', 'failure']
-    found_threats = [t for t in threat_openers if t in opening_text]
+    found_threats = metrics.opening_threats
     if found_threats:
         checks.append(Check(
             name="register_opening",
@@ -577,6 +1019,49 @@ def check_register(content: str) -> list[Check]:
     return checks
 
 
+@dataclass(frozen=True)
+class CheckSpec:
+    """A registered check and what of the SkillDocument it reads.
+
+    requires names the document parts: "frontmatter" (skipped when the YAML
+    is invalid), "body" (SKILL.md text) and "files" (the directory walk).
+    """
+    name: str
+    func: Callable[[SkillDocument], list[Check]]
+    requires: frozenset[str]
+
+
+# Run in this order. Append a CheckSpec to add a check; --only/--skip select
+# by name.
+CHECKS: list[CheckSpec] = [
+    CheckSpec("frontmatter", check_frontmatter_fields, frozenset({"frontmatter"})),
+    CheckSpec("name", check_name, frozenset({"frontmatter"})),
+    CheckSpec("description", check_description, frozenset({"frontmatter"})),
+    CheckSpec("structure", check_structure, frozenset({"body", "files"})),
+    CheckSpec("resources", check_resources, frozenset({"files"})),
+    CheckSpec("links", check_links, frozenset({"body", "files"})),
+    CheckSpec("context", check_context_cost, frozenset({"body", "files"})),
+    CheckSpec("register", check_register, frozenset({"body"})),  # emotional tone
+]
+
+
+def select_checks(only: Optional[list[str]] = None,
+                  skip: Optional[list[str]] = None) -> list[CheckSpec]:
+    """The registered checks named by only (default: all), minus skip."""
+    known = {spec.name for spec in CHECKS}
+    unknown = sorted((set(only or []) | set(skip or [])) - known)
+    if unknown:
+        raise ValueError(f"Unknown check(s): {', '.join(unknown)} "
+                         f"(known: {', '.join(spec.name for spec in CHECKS)})")
+    return [spec for spec in CHECKS
+            if (only is None or spec.name in only) and spec.name not in (skip or [])]
+
+
+def check_selection(checks: Optional[list[CheckSpec]]) -> tuple[str, ...]:
+    """Names of a selection, for cache and memo keys; () means all."""
+    return () if checks is None else tuple(spec.name for spec in checks)
+
+
 def detect_alias(content: str, frontmatter: Optional[dict]) -> Optional[str]:
     """Detect if skill is an alias and return target skill name."""
     # Check description for "Alias for X"
@@ -597,25 +1082,110 @@ def detect_alias(content: str, frontmatter: Optional[dict]) -> Optional[str]:
     return None
 
 
-def find_skill_path(skill_name: str, search_paths: list[Path]) -> Optional[Path]:
-    """Find skill directory by name in common locations."""
-    for base in search_paths:
-        candidate = base / skill_name
-        if candidate.exists() and (candidate / 'SKILL.md').exists():
-            return candidate
-    return None
+PLUGIN_CACHE_DIR = Path.home() / '.claude' / 'plugins' / 'cache'
 
 
-def lint_skill(skill_path: Path, follow_aliases: bool = True, _alias_chain: list[str] = None) -> LintResult:
+def version_key(version: str) -> tuple:
+    """Sort key for version strings: numeric runs compare as numbers.
+
+    The Python twin of the `sort -V` in the ardoise/hublot script fallbacks —
+    lexicographic order once put 1.8.7 above 1.66.0 (trousse-jiluru).
+    """
+    return tuple((0, int(part), '') if part.isdigit() else (1, 0, part)
+                 for part in re.split(r'(\d+)', version) if part)
+
+
+def plugin_skill_roots(cache_dir: Path = PLUGIN_CACHE_DIR) -> list[Path]:
+    """skills/ of the newest cached version of each installed plugin.
+
+    Layout: <cache>/<marketplace>/<plugin>/<version>/skills/<skill>/SKILL.md.
+    Older versions linger in the cache after an update; only the newest counts.
+    """
+    roots = []
+    for plugin in sorted(cache_dir.glob('*/*')):
+        try:
+            versions = [v for v in plugin.iterdir() if (v / 'skills').is_dir()]
+        except OSError:
+            continue
+        if versions:
+            roots.append(max(versions, key=lambda v: version_key(v.name)) / 'skills')
+    return roots
+
+
+class SkillIndex:
+    """Skill name -> directory across every alias search root, for one run.
+
+    A target resolves by priority: the alias's own directory's siblings, then
+    ~/.claude/skills, then installed plugins (newest cached version). Each
+    root is listed once, the first time a lookup reaches it, so resolving an
+    alias is a dict lookup rather than a probe per root. The global roots
+    themselves are discovered only when a lookup misses the siblings, so a
+    run with no aliases never globs the plugin cache. Lint results are
+    memoized per resolved path here too: in a batch, `review` and the
+    `titans` it aliases share one lint of titans. With keep_results off (a
+    streaming run), only results reached through an alias are memoized, so
+    memory holds the alias targets rather than the whole catalog.
+    """
+
+    def __init__(self, global_roots: Optional[list[Path]] = None, keep_results: bool = True):
+        if global_roots is not None:
+            self.global_roots = global_roots  # shadows the discovering property
+        self.keep_results = keep_results
+        self.results: dict[tuple[Path, bool, tuple[str, ...]], LintResult] = {}
+        self._listings: dict[Path, dict[str, Path]] = {}
+
+    @cached_property
+    def global_roots(self) -> list[Path]:
+        """~/.claude/skills, then each installed plugin's newest skills dir."""
+        return [Path.home() / '.claude' / 'skills', *plugin_skill_roots()]
+
+    def listing(self, root: Path) -> dict[str, Path]:
+        """Name -> path for every */SKILL.md directly under root."""
+        names = self._listings.get(root)
+        if names is None:
+            names = {}
+            try:
+                with os.scandir(root) as entries:
+                    for entry in entries:
+                        if entry.is_dir() and os.path.isfile(os.path.join(entry.path, 'SKILL.md')):
+                            names[entry.name] = root / entry.name
+            except OSError:
+                pass
+            self._listings[root] = names
+        return names
+
+    def resolve(self, name: str, near: Path) -> Optional[Path]:
+        """Directory of skill `name` as seen from a skill in directory `near`."""
+        path = self.listing(near).get(name)
+        if path is not None:
+            return path
+        for root in self.global_roots:
+            path = self.listing(root).get(name)
+            if path is not None:
+                return path
+        return None
+
+
+def lint_skill(skill_path: Path, follow_aliases: bool = True, _alias_chain: list[Path] = None,
+               index: Optional[SkillIndex] = None,
+               checks: Optional[list[CheckSpec]] = None) -> LintResult:
     """Run all checks on a skill.
 
     Args:
         skill_path: Path to skill directory
         follow_aliases: If True, detect aliases and lint target skill instead
         _alias_chain: Internal tracking to prevent infinite loops
+        index: Alias resolution index (and result memo) shared across a run
+        checks: Registered checks to run (default: all of CHECKS)
     """
     if _alias_chain is None:
         _alias_chain = []
+    if index is None:
+        index = SkillIndex()
+    memo_key = (skill_path, follow_aliases, check_selection(checks))
+    memo = index.results.get(memo_key)
+    if memo is not None:
+        return replace(memo, checks=list(memo.checks))
 
     result = LintResult(
         skill_path=str(skill_path),
@@ -656,32 +1226,30 @@ def lint_skill(skill_path: Path, follow_aliases: bool = True, _alias_chain: list
         result.errors = 1
         return result
 
+    t = time.perf_counter()
+    doc = SkillDocument.parse(skill_path, content)
+    result.timings["parse"] = round((time.perf_counter() - t) * 1000, 3)
+
     # Check for alias and follow if enabled
     if follow_aliases:
-        # Quick frontmatter parse just for alias detection
-        fm, _ = extract_frontmatter(content)
-        target_name = detect_alias(content, fm)
+        target_name = detect_alias(content, doc.frontmatter)
 
         if target_name:
+            target_path = index.resolve(target_name, skill_path.parent)
+
             # Prevent infinite loops
-            if target_name in _alias_chain:
+            if target_path is not None and target_path in _alias_chain:
+                chain = [p.name for p in _alias_chain] + [skill_path.name, target_name]
                 result.checks.append(Check(
                     name="alias_loop",
                     passed=False,
-                    message=f"Alias loop detected: {' -> '.join(_alias_chain + [target_name])}",
+                    message=f"Alias loop detected: {' -> '.join(chain)}",
                     severity="error"
                 ))
                 result.valid = False
                 result.errors = 1
                 return result
 
-            # Find target skill
-            search_paths = [
-                skill_path.parent,  # Same directory (skills/)
-                Path.home() / '.claude' / 'skills',  # Global skills
-            ]
-            target_path = find_skill_path(target_name, search_paths)
-
             if target_path:
                 # Record alias relationship
                 result.checks.append(Check(
@@ -695,7 +1263,9 @@ def lint_skill(skill_path: Path, follow_aliases: bool = True, _alias_chain: list
                 target_result = lint_skill(
                     target_path,
                     follow_aliases=True,
-                    _alias_chain=_alias_chain + [skill_path.name]
+                    _alias_chain=_alias_chain + [skill_path],
+                    index=index,
+                    checks=checks,
                 )
 
                 # Merge results but keep alias context
@@ -706,6 +1276,12 @@ def lint_skill(skill_path: Path, follow_aliases: bool = True, _alias_chain: list
                 result.warnings = target_result.warnings
                 result.score = target_result.score
                 result.valid = target_result.valid
+                result.timings = target_result.timings
+                # A loop error depends on the chain that reached it; anything
+                # else is a property of the skill alone.
+                if not any(c.name == "alias_loop" for c in result.checks) \
+                        and (index.keep_results or _alias_chain):
+                    index.results[memo_key] = result
                 return result
             else:
                 result.checks.append(Check(
@@ -718,13 +1294,12 @@ def lint_skill(skill_path: Path, follow_aliases: bool = True, _alias_chain: list
                 result.errors = 1
                 return result
 
-    # Extract and validate frontmatter
-    frontmatter, error = extract_frontmatter(content)
-    if error:
+    # Validate frontmatter
+    if doc.frontmatter_error:
         result.checks.append(Check(
             name="frontmatter_valid",
             passed=False,
-            message=error,
+            message=doc.frontmatter_error,
             severity="error"
         ))
         result.valid = False
@@ -735,19 +1310,21 @@ def lint_skill(skill_path: Path, follow_aliases: bool = True, _alias_chain: list
             message="Frontmatter is valid YAML"
         ))
 
-        # Run checks that need frontmatter
-        result.checks.extend(check_frontmatter_fields(frontmatter))
-        result.checks.extend(check_name(frontmatter, skill_path))
-        result.checks.extend(check_description(frontmatter))
+    for spec in CHECKS if checks is None else checks:
+        if "frontmatter" in spec.requires and doc.frontmatter_error:
+            continue
+        t = time.perf_counter()
+        result.checks.extend(spec.func(doc))
+        result.timings[spec.name] = round((time.perf_counter() - t) * 1000, 3)
 
-    # Structure checks
-    result.checks.extend(check_structure(skill_path, content))
-    result.checks.extend(check_resources(skill_path))
+    tally_result(result)
+    if index.keep_results or _alias_chain:
+        index.results[memo_key] = result
+    return result
 
-    # Register checks (emotional tone)
-    result.checks.extend(check_register(content))
 
-    # Calculate results
+def tally_result(result: LintResult) -> None:
+    """Count errors and warnings and deduct the score for failed checks."""
     for check in result.checks:
         if not check.passed:
             if check.severity == "error":
@@ -762,22 +1339,619 @@ def lint_skill(skill_path: Path, follow_aliases: bool = True, _alias_chain: list
     result.score = max(0, result.score)
     result.valid = result.errors == 0
 
-    return result
 
+# Persistent LintResult cache, content-addressed (see skill_cache_key).
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'trousse' / 'lint-skill'
+# Results kept on disk; the least recently used go first. Pruned at the first
+# write in a process, so a run adds at most its own skills on top.
+CACHE_LIMIT = 2048
+_pruned_cache_dirs: set[Path] = set()
 
-def format_result(result: LintResult, format_type: str = "text") -> str:
-    """Format lint result for output."""
+# In-process layer over the disk cache: key -> result dict.
+_result_memo: dict[str, dict] = {}
+_linter_version: Optional[str] = None
+
+
+def linter_version() -> str:
+    """Digest of this file and the description analysis it imports.
+
+    Any edit to either invalidates the cache.
+    """
+    global _linter_version
+    if _linter_version is None:
+        h = hashlib.blake2b(digest_size=8)
+        for source in (__file__, sys.modules[describe.__module__].__file__):
+            h.update(Path(source).read_bytes())
+        _linter_version = h.hexdigest()
+    return _linter_version
+
+
+def skill_cache_key(skill_path: Path, follow_aliases: bool = True,
+                    _alias_chain: tuple[Path, ...] = (),
+                    index: Optional[SkillIndex] = None,
+                    checks: Optional[list[CheckSpec]] = None) -> str:
+    """Content address of everything a lint of skill_path depends on.
+
+    Covers the linter version, SKILL.md's bytes, the skill's file listing
+    with modes (structure, reference-depth and executable checks read it),
+    the bytes of template-named files and of top-level references/*.md
+    (their content is checked), the check selection, and — for an alias —
+    the resolved target's own key.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{linter_version()}\0{skill_path}\0{follow_aliases}\0".encode())
+    h.update(f"{','.join(check_selection(checks))}\0".encode())
+    skill_md = skill_path / 'SKILL.md'
+    try:
+        content = skill_md.read_bytes()
+    except OSError:
+        h.update(b"no-skill-md")
+        return h.hexdigest()
+    h.update(hashlib.blake2b(content).digest())
+
+    # An empty references/ still downgrades the anti-patterns check.
+    h.update(f"references\0{(skill_path / 'references').exists()}\0".encode())
+    for rel, mode in walk_skill_files(skill_path).items():
+        h.update(f"{rel}\0{mode:o}\0".encode())
+        if rel.rsplit('/', 1)[-1] in TEMPLATE_FILE_NAMES:
+            h.update(hashlib.blake2b(read_template_head(skill_path / rel) or b'').digest())
+        elif rel.startswith('references/') and rel.endswith('.md') and rel.count('/') == 1:
+            try:
+                h.update(hashlib.blake2b((skill_path / rel).read_bytes()).digest())
+            except OSError:
+                pass
+
+    text = content.decode('utf-8', errors='replace')
+    lowered = text.lower()
+    # detect_alias can only fire on one of these words; skip the YAML parse
+    # for the common, non-alias case.
+    if follow_aliases and ('alias' in lowered or 'immediately' in lowered):
+        target_name = detect_alias(text, extract_frontmatter(text)[0])
+        if target_name:
+            if index is None:
+                index = SkillIndex()
+            target_path = index.resolve(target_name, skill_path.parent)
+            if target_path is None or target_path in _alias_chain + (skill_path,):
+                h.update(f"alias-unresolved\0{target_name}".encode())
+            else:
+                h.update(skill_cache_key(target_path, True, _alias_chain + (skill_path,),
+                                         index, checks).encode())
+    return h.hexdigest()
+
+
+def result_from_dict(data: dict) -> LintResult:
+    """Inverse of result_to_dict."""
+    return LintResult(
+        skill_path=data["skill_path"],
+        skill_name=data["skill_name"],
+        valid=data["valid"],
+        checks=[Check(**c) for c in data["checks"]],
+        errors=data["errors"],
+        warnings=data["warnings"],
+        score=data["score"],
+        timings=data.get("timings", {}),
+    )
+
+
+def lint_skill_cached(skill_path: Path, follow_aliases: bool = True,
+                      cache_dir: Optional[Path] = CACHE_DIR,
+                      index: Optional[SkillIndex] = None,
+                      checks: Optional[list[CheckSpec]] = None) -> LintResult:
+    """lint_skill, answered from the content-addressed cache when possible.
+
+    A hit costs one hash of the skill's inputs; a miss lints and stores.
+    ``cache_dir=None`` keeps the cache in memory only. A hit reports the
+    timings of the lint that produced it, and refreshes the entry's mtime;
+    past CACHE_LIMIT entries, the least recently used are deleted.
+    """
+    if index is None:
+        index = SkillIndex()
+    key = skill_cache_key(skill_path, follow_aliases, index=index, checks=checks)
+    data = _result_memo.get(key)
+    entry = cache_dir / key[:2] / f"{key}.json" if cache_dir else None
+    if data is None and entry is not None:
+        try:
+            data = json.loads(entry.read_text())
+        except (OSError, ValueError):
+            data = None
+        else:
+            try:
+                os.utime(entry)
+            except OSError:
+                pass
+    if data is None:
+        data = result_to_dict(lint_skill(skill_path, follow_aliases=follow_aliases, index=index,
+                                         checks=checks))
+        if entry is not None:
+            try:
+                entry.parent.mkdir(parents=True, exist_ok=True)
+                tmp = entry.with_suffix(f".{os.getpid()}.tmp")
+                tmp.write_text(json.dumps(data))
+                tmp.replace(entry)
+            except OSError:
+                pass  # an unwritable cache only costs speed
+            if cache_dir not in _pruned_cache_dirs:
+                _pruned_cache_dirs.add(cache_dir)
+                prune_cache(cache_dir, CACHE_LIMIT, '*/*.json')
+    if index.keep_results:
+        _result_memo[key] = data
+    return result_from_dict(data)
+
+
+def discover_skills(root: Path) -> list[Path]:
+    """Skill directories directly under root — every */SKILL.md."""
+    return sorted(p.parent for p in root.glob('*/SKILL.md'))
+
+
+# Each pool worker builds its own index once (see _init_worker).
+_worker_index: Optional[SkillIndex] = None
+
+
+def _init_worker(keep_results: bool = True) -> None:
+    global _worker_index
+    _worker_index = SkillIndex(keep_results=keep_results)
+
+
+def _lint_one(skill_path: Path, follow_aliases: bool, cache_dir: Optional[Path],
+              checks: Optional[list[CheckSpec]] = None,
+              index: Optional[SkillIndex] = None) -> LintResult:
+    """Top-level (picklable) worker for the batch pool."""
+    index = index or _worker_index
+    if cache_dir is None:
+        return lint_skill(skill_path, follow_aliases=follow_aliases, index=index, checks=checks)
+    return lint_skill_cached(skill_path, follow_aliases=follow_aliases, cache_dir=cache_dir,
+                             index=index, checks=checks)
+
+
+def git_changed_paths(root: Path, base: str = "HEAD") -> list[Path]:
+    """Paths under root that differ from base: committed since it, staged,
+    unstaged or untracked. Deleted paths are kept — a skill that lost a
+    reference has changed. Raises ValueError outside git or for an unknown ref.
+    """
+    import subprocess  # only --changed pays for it
+
+    def git(*args):
+        try:
+            r = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True,
+                               timeout=30)
+        except (OSError, subprocess.TimeoutExpired) as e:
+            raise ValueError(f"git failed: {e}")
+        if r.returncode != 0:
+            raise ValueError(r.stderr.strip() or f"git {args[0]} failed")
+        return r.stdout
+
+    try:
+        git("rev-parse", "--verify", "--quiet", f"{base}^{{commit}}")
+    except ValueError:
+        raise ValueError(f"Unknown git ref (or not a git repo): {base}")
+    # -z: NUL-separated and unquoted; without it git quotes non-ASCII paths.
+    names: set[str] = set()
+    for args in (("diff", "-z", "--name-only", "--relative", base),
+                 ("diff", "-z", "--name-only", "--relative", "--cached", base),
+                 ("ls-files", "-z", "--others", "--exclude-standard")):
+        names.update(n for n in git(*args).split("\0") if n)
+    return [root / n for n in sorted(names)]
+
+
+def changed_skills(root: Path, base: str = "HEAD",
+                   index: Optional[SkillIndex] = None) -> list[Path]:
+    """Skills under root with files changed against base, plus the aliases
+    under root that resolve to one of them (through any number of hops)."""
+    skills = discover_skills(root)
+    skill_set = set(skills)
+    changed = set()
+    for path in git_changed_paths(root, base):
+        rel = path.relative_to(root).parts
+        if len(rel) > 1 and (root / rel[0]) in skill_set:
+            changed.add(root / rel[0])
+
+    if index is None:
+        index = SkillIndex()
+    targets = {}
+    for skill in skills:
+        text = (skill / 'SKILL.md').read_text(errors='replace')
+        lowered = text.lower()
+        if 'alias' in lowered or 'immediately' in lowered:  # cheap gate, as in the cache key
+            target_name = detect_alias(text, extract_frontmatter(text)[0])
+            if target_name:
+                targets[skill] = index.resolve(target_name, skill.parent)
+    grew = True
+    while grew:
+        grew = False
+        for alias, target in targets.items():
+            if alias not in changed and target in changed:
+                changed.add(alias)
+                grew = True
+    return sorted(changed)
+
+
+def iter_lint_all(root: Path, follow_aliases: bool = True, workers: int = 1,
+                  cache_dir: Optional[Path] = None,
+                  checks: Optional[list[CheckSpec]] = None,
+                  skills: Optional[list[Path]] = None,
+                  keep_results: bool = True) -> Iterator[tuple[Path, LintResult]]:
+    """Lint every skill under root (or just `skills`), yielding as each finishes.
+
+    Yields (skill directory, result) pairs: in discovery order in-process,
+    in completion order across a worker pool — a slow skill holds up only
+    its own line. With a cache_dir, unchanged skills come from the lint cache.
+    keep_results=False memoizes only alias targets (see SkillIndex), for a
+    caller that consumes each result and drops it.
+    """
+    if skills is None:
+        skills = discover_skills(root)
+    if workers <= 1 or len(skills) <= 1:
+        index = SkillIndex(keep_results=keep_results)
+        for s in skills:
+            yield s, _lint_one(s, follow_aliases, cache_dir, checks, index)
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed  # only --workers pays
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(keep_results,)) as pool:
+        futures = {pool.submit(_lint_one, s, follow_aliases, cache_dir, checks): s
+                   for s in skills}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def lint_all(root: Path, follow_aliases: bool = True, workers: int = 1,
+             cache_dir: Optional[Path] = None,
+             checks: Optional[list[CheckSpec]] = None,
+             skills: Optional[list[Path]] = None) -> list[LintResult]:
+    """Lint every skill under root in this process, or across a worker pool.
+
+    Results come back in discovery (sorted) order either way.
+    """
+    if skills is None:
+        skills = discover_skills(root)
+    done = dict(iter_lint_all(root, follow_aliases, workers, cache_dir, checks, skills))
+    return [done[s] for s in skills]
+
+
+# Tokens of skill listing a session can carry before it is worth trimming.
+DESCRIPTION_BUDGET_TOKENS = 4000
+
+
+@dataclass
+class CatalogEntry:
+    """One installed skill's share of the listing every session starts with."""
+    name: str
+    path: Path
+    root: Path  # the search root it was found under
+    tokens: int  # estimated, for its "- name: description" listing line
+    description: str = ""
+
+
+def catalog_entries(roots: list[Path], index: Optional[SkillIndex] = None) -> list[CatalogEntry]:
+    """Every skill under roots, heaviest description first.
+
+    A skill reachable from two roots (~/.claude/skills symlinked into a
+    checkout, say) is listed once, under the first root that has it.
+    """
+    index = index or SkillIndex(global_roots=[])
+    seen = set()
+    entries = []
+    for root in roots:
+        for dirname, path in sorted(index.listing(root).items()):
+            real = path.resolve()
+            if real in seen:
+                continue
+            seen.add(real)
+            try:
+                frontmatter, _ = extract_frontmatter((path / 'SKILL.md').read_text())
+            except OSError:
+                continue
+            frontmatter = frontmatter or {}
+            name = str(frontmatter.get('name') or dirname)
+            description = frontmatter.get('description')
+            description = description.strip() if isinstance(description, str) else ''
+            entries.append(CatalogEntry(name=name, path=path, root=root,
+                                        tokens=estimate_tokens(f"- {name}: {description}\n"),
+                                        description=description))
+    entries.sort(key=lambda e: (-e.tokens, e.name))
+    return entries
+
+
+class SkillWatcher:
+    """A skill's parsed document and per-check results, kept between edits.
+
+    relint() re-runs only the registered checks a change can reach: an edit
+    to SKILL.md re-parses it and re-runs the frontmatter and body checks; any
+    other file re-runs the checks that read the directory listing.
+    """
+
+    def __init__(self, skill_path: Path, checks: Optional[list[CheckSpec]] = None):
+        self.skill_path = skill_path
+        self.specs = CHECKS if checks is None else checks
+        self.stats: dict[str, Optional[os.stat_result]] = {}
+        self.doc: Optional[SkillDocument] = None
+        self.results: dict[str, list[Check]] = {}
+        self.timings: dict[str, float] = {}
+
+    @staticmethod
+    def signature(stats: dict[str, Optional[os.stat_result]]) -> dict[str, tuple[int, ...]]:
+        # Not the whole stat: our own reads may touch atime. Unstat'ed files
+        # only ever matter by being added or removed.
+        return {rel: (st.st_mtime_ns, st.st_size, st.st_mode) if st else ()
+                for rel, st in stats.items()}
+
+    def changed_since(self, stats: dict[str, Optional[os.stat_result]]) -> set[str]:
+        """Paths added, removed or modified between self.stats and stats."""
+        old, new = self.signature(self.stats), self.signature(stats)
+        return {rel for rel in old.keys() | new.keys() if old.get(rel) != new.get(rel)}
+
+    def relint(self, stats: dict[str, Optional[os.stat_result]],
+               changed: Optional[set[str]] = None,
+               content: Optional[str] = None) -> LintResult:
+        """Bring the results up to date with stats; changed=None re-runs all.
+
+        content, when given, is SKILL.md's text as an editor holds it; the
+        file on disk is then not read (and need not exist yet).
+        """
+        body_changed = changed is None or 'SKILL.md' in changed
+        files_changed = changed is None or bool(changed - {'SKILL.md'})
+        self.stats = stats
+        if content is None and 'SKILL.md' not in stats:
+            self.doc = None
+            self.results.clear()
+            return lint_skill(self.skill_path, follow_aliases=False, checks=self.specs)
+
+        if body_changed or self.doc is None:
+            if content is None:
+                content = (self.skill_path / 'SKILL.md').read_text()
+            previous = self.doc
+            self.doc = SkillDocument.parse(self.skill_path, content)
+            if previous is not None and not files_changed and 'references' in previous.__dict__:
+                self.doc.references = previous.references  # a keystroke needn't re-read them
+        else:
+            self.doc = replace(self.doc)  # fresh instance: drops the cached listing
+        # Seed the listing from the poll's own walk rather than walking again.
+        self.doc.tree = stat_modes(stats)
+
+        for spec in self.specs:
+            if "frontmatter" in spec.requires and self.doc.frontmatter_error:
+                self.results.pop(spec.name, None)
+                continue
+            reads_body = bool(spec.requires & {"frontmatter", "body"})
+            if spec.name in self.results and not (
+                    (reads_body and body_changed) or ("files" in spec.requires and files_changed)):
+                continue
+            t = time.perf_counter()
+            self.results[spec.name] = spec.func(self.doc)
+            self.timings[spec.name] = round((time.perf_counter() - t) * 1000, 3)
+        return self.assemble()
+
+    def assemble(self) -> LintResult:
+        """The current results as one LintResult, in registry order."""
+        result = LintResult(skill_path=str(self.skill_path), skill_name=self.skill_path.name,
+                            valid=True)
+        result.checks.append(Check(name="skill_md_exists", passed=True, message="SKILL.md found"))
+        if self.doc.frontmatter_error:
+            result.checks.append(Check(name="frontmatter_valid", passed=False,
+                                       message=self.doc.frontmatter_error, severity="error"))
+        else:
+            result.checks.append(Check(name="frontmatter_valid", passed=True,
+                                       message="Frontmatter is valid YAML"))
+        for spec in self.specs:
+            if spec.name in self.results:
+                result.checks.extend(self.results[spec.name])
+                result.timings[spec.name] = self.timings[spec.name]
+        tally_result(result)
+        return result
+
+
+def status_changes(old: LintResult, new: LintResult) -> list[str]:
+    """Lines for checks that started or stopped failing between two results.
+
+    A check's status is whether it fails and at what severity (the worst,
+    when it fails more than once); its message is not part of it, so a
+    failure whose count changed (caps words, lines, tokens) stays quiet.
+    """
+    rank = {"error": 0, "warning": 1, "info": 2}
+
+    def failing(result):
+        worst = {}
+        for c in result.checks:
+            if not c.passed and (c.name not in worst
+                                 or rank[c.severity] < rank[worst[c.name].severity]):
+                worst[c.name] = c
+        return worst
+    before, after = failing(old), failing(new)
+    lines = [f"  fixed   [{name}] {c.message}" for name, c in before.items() if name not in after]
+    lines += [f"  {c.severity:7} [{name}] {c.message}" for name, c in after.items()
+              if name not in before or before[name].severity != c.severity]
+    return sorted(lines, key=lambda line: line.split('[', 1)[1])
+
+
+def watch(skill_path: Path, checks: Optional[list[CheckSpec]] = None,
+          follow_aliases: bool = True, interval: float = 0.5, debounce: float = 0.3,
+          out=print, stop=None) -> None:
+    """Re-lint skill_path whenever its files change, printing what changed.
+
+    Polls (no watcher dependency) every `interval` seconds; once a change is
+    seen, waits until the tree holds still for `debounce` seconds so a burst
+    of saves is linted once. An alias is watched through to its target.
+    `stop` is an optional threading.Event.
+    """
+    def sleep(seconds):
+        if stop is not None:
+            stop.wait(seconds)
+        else:
+            time.sleep(seconds)
+
+    skill_md = skill_path / 'SKILL.md'
+    if follow_aliases and skill_md.is_file():
+        content = skill_md.read_text()
+        target_name = detect_alias(content, extract_frontmatter(content)[0])
+        target_path = target_name and SkillIndex().resolve(target_name, skill_path.parent)
+        if target_path:
+            out(f"{skill_path.name} is an alias for '{target_name}'; watching {target_path}")
+            skill_path = target_path
+
+    watcher = SkillWatcher(skill_path, checks)
+    result = watcher.relint(walk_skill_stats(skill_path))
+    out(format_result(result, "brief"))
+    out(f"\nWatching {skill_path} (Ctrl-C to stop)")
+    while stop is None or not stop.is_set():
+        sleep(interval)
+        stats = walk_skill_stats(skill_path)
+        if not watcher.changed_since(stats):
+            continue
+        while True:  # debounce
+            sleep(debounce)
+            settled = walk_skill_stats(skill_path)
+            if watcher.signature(settled) == watcher.signature(stats):
+                break
+            stats = settled
+        changed = watcher.changed_since(stats)
+        previous, result = result, watcher.relint(stats, changed)
+        lines = status_changes(previous, result)
+        if lines or previous.score != result.score:
+            names = ", ".join(sorted(changed)[:3]) + (" ..." if len(changed) > 3 else "")
+            out(f"\n[{time.strftime('%H:%M:%S')}] {names}: score {previous.score} -> "
+                f"{result.score} ({'PASS' if result.valid else 'FAIL'})")
+            for line in lines:
+                out(line)
+
+
+def result_to_dict(result: LintResult) -> dict:
+    """JSON-ready form of a lint result."""
+    return {
+        "skill_path": result.skill_path,
+        "skill_name": result.skill_name,
+        "valid": result.valid,
+        "score": result.score,
+        "errors": result.errors,
+        "warnings": result.warnings,
+        "checks": [asdict(c) for c in result.checks],
+        "timings": result.timings,
+    }
+
+
+def summarize(results, summary: Optional[dict] = None) -> dict:
+    """Batch counts over results, added onto a running summary if given."""
+    summary = summary or {"skills": 0, "passed": 0, "failed": 0, "errors": 0, "warnings": 0}
+    for r in results:
+        summary["skills"] += 1
+        summary["passed" if r.valid else "failed"] += 1
+        summary["errors"] += r.errors
+        summary["warnings"] += r.warnings
+    return summary
+
+
+def format_ndjson(result: LintResult) -> str:
+    """One compact JSON line for a lint result (--format ndjson)."""
+    return json.dumps(result_to_dict(result), separators=(',', ':'))
+
+
+def format_batch(root: Path, results: list[LintResult], format_type: str = "text") -> str:
+    """Format a batch lint run as one aggregate report."""
+    summary = summarize(results)
     if format_type == "json":
         return json.dumps({
-            "skill_path": result.skill_path,
-            "skill_name": result.skill_name,
-            "valid": result.valid,
-            "score": result.score,
-            "errors": result.errors,
-            "warnings": result.warnings,
-            "checks": [asdict(c) for c in result.checks]
+            "root": str(root),
+            "summary": summary,
+            "skills": [result_to_dict(r) for r in results],
         }, indent=2)
 
+    width = max([len(r.skill_name) for r in results] + [5])
+    lines = [
+        f"\n{'='*60}",
+        f"LINT ALL: {root}",
+        f"{'='*60}",
+        f"  {'SKILL':{width}}  SCORE  STATUS  ERRORS  WARNINGS",
+    ]
+    for r in results:
+        lines.append(f"  {r.skill_name:{width}}  {r.score:5}  "
+                     f"{'PASS' if r.valid else 'FAIL':6}  {r.errors:6}  {r.warnings:8}")
+
+    # Failures in full; infos and passes stay in the per-skill report.
+    for r in results:
+        problems = [c for c in r.checks
+                    if not c.passed and c.severity in ("error", "warning")]
+        if problems:
+            lines.append(f"\n--- {r.skill_name} ---")
+            for c in problems:
+                lines.append(f"  [{c.severity}] [{c.name}] {c.message}")
+                if c.suggestion and format_type != "brief":
+                    lines.append(f"    -> {c.suggestion}")
+
+    lines.append(f"\n{summary['skills']} skills: {summary['passed']} passed, "
+                 f"{summary['failed']} failed "
+                 f"({summary['errors']} errors, {summary['warnings']} warnings)")
+    return "\n".join(lines)
+
+
+def format_context_cost(costs: dict[str, ContextCost], format_type: str = "text") -> str:
+    """Format context-cost estimates keyed by skill name, heaviest body first."""
+    if format_type == "json":
+        return json.dumps({name: asdict(cost) for name, cost in costs.items()}, indent=2)
+
+    ranked = sorted(costs.items(), key=lambda item: -item[1].body)
+    width = max([len(name) for name in costs] + [5])
+    lines = [
+        f"\n{'='*60}",
+        "CONTEXT COST (estimated tokens)",
+        f"{'='*60}",
+        f"  {'SKILL':{width}}  {'ON LOAD':>7}  {'REFS':>7}  {'WORST':>7}",
+    ]
+    for name, cost in ranked:
+        flag = "  heavy body, thin references" if cost.top_heavy else ""
+        lines.append(f"  {name:{width}}  {cost.body:7}  {sum(cost.references.values()):7}  "
+                     f"{cost.worst_path_tokens:7}{flag}")
+    if len(costs) == 1:
+        cost = ranked[0][1]
+        for rel, tokens in sorted(cost.references.items(), key=lambda item: -item[1]):
+            lines.append(f"    {tokens:7}  {rel}")
+        if cost.worst_path:
+            lines.append(f"  Worst path: {' -> '.join(['SKILL.md'] + cost.worst_path)}")
+    return "\n".join(lines)
+
+
+def format_catalog(entries: list[CatalogEntry], budget: int = DESCRIPTION_BUDGET_TOKENS,
+                   format_type: str = "text", top: int = 20) -> str:
+    """Format the catalog's description cost, biggest contributors first."""
+    total = sum(e.tokens for e in entries)
+    if format_type == "json":
+        return json.dumps({
+            "skills": len(entries),
+            "tokens": total,
+            "budget": budget,
+            "over_budget": total > budget,
+            "entries": [{"name": e.name, "path": str(e.path), "root": str(e.root),
+                         "tokens": e.tokens} for e in entries],
+        }, indent=2)
+
+    shown = entries if top <= 0 else entries[:top]
+    width = max([len(e.name) for e in shown] + [5])
+    lines = [
+        f"\n{'='*60}",
+        f"DESCRIPTION BUDGET: {len(entries)} skills, ~{total} tokens per session "
+        f"(budget {budget})",
+        f"{'='*60}",
+        f"  {'TOKENS':>6}  {'SHARE':>5}  {'SKILL':{width}}  ROOT",
+    ]
+    for e in shown:
+        share = f"{100 * e.tokens / total:.0f}%" if total else "-"
+        lines.append(f"  {e.tokens:6}  {share:>5}  {e.name:{width}}  {e.root}")
+    if len(shown) < len(entries):
+        rest = entries[len(shown):]
+        lines.append(f"  {sum(e.tokens for e in rest):6}  {'':5}  "
+                     f"... {len(rest)} more")
+    if total > budget:
+        lines.append(f"\nWARNING: skill descriptions cost ~{total} tokens, "
+                     f"{total - budget} over the {budget}-token budget")
+        if format_type != "brief":
+            lines.append("  -> Shorten the descriptions at the top of this list, "
+                         "or uninstall skills you no longer use")
+    return "\n".join(lines)
+
+
+def format_result(result: LintResult, format_type: str = "text") -> str:
+    """Format lint result for output."""
+    if format_type == "json":
+        return json.dumps(result_to_dict(result), indent=2)
+
     # Text format
     lines = [
         f"\n{'='*60}",
@@ -826,12 +2000,133 @@ def main():
     parser = argparse.ArgumentParser(
         description="Lint Claude Code skills for quality issues"
     )
-    parser.add_argument("skill_path", type=Path, help="Path to skill directory")
-    parser.add_argument("--json", action="store_true", help="Output as JSON")
-    parser.add_argument("--brief", action="store_true", help="Show only failures")
+    parser.add_argument("skill_path", type=Path, nargs="?", help="Path to skill directory")
+    parser.add_argument("--all", type=Path, metavar="ROOT",
+                        help="Lint every */SKILL.md under ROOT in one process")
+    parser.add_argument("--changed", action="store_true",
+                        help="Lint only skills under ROOT (the skill_path argument, default .) "
+                             "with files changed against --base, and aliases of them")
+    parser.add_argument("--base", default="HEAD", metavar="REF",
+                        help="Git ref --changed compares against (default: HEAD)")
+    parser.add_argument("--watch", type=Path, metavar="PATH",
+                        help="Re-lint PATH on every change, printing checks whose status changed")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for --all (default: 1, in-process)")
+    parser.add_argument("--format", choices=["text", "brief", "json", "ndjson"],
+                        help="Output format; ndjson streams one line per skill, "
+                             "then a summary line")
+    parser.add_argument("--json", action="store_true", help="Output as JSON (--format json)")
+    parser.add_argument("--brief", action="store_true",
+                        help="Show only failures (--format brief)")
     parser.add_argument("--no-follow-aliases", action="store_true",
                         help="Don't follow alias skills to their targets")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"Always re-lint; skip the result cache in {CACHE_DIR}")
+    check_names = ", ".join(spec.name for spec in CHECKS)
+    parser.add_argument("--only", metavar="CHECKS",
+                        help=f"Comma-separated checks to run (of: {check_names})")
+    parser.add_argument("--skip", metavar="CHECKS", help="Comma-separated checks to leave out")
+    parser.add_argument("--catalog", action="store_true",
+                        help="Report the per-session token cost of every installed skill's "
+                             "description: ROOT (the skill_path argument, if given), "
+                             "~/.claude/skills and the plugin caches")
+    parser.add_argument("--budget", type=int, default=DESCRIPTION_BUDGET_TOKENS,
+                        metavar="TOKENS",
+                        help=f"Warn when --catalog passes this (default: "
+                             f"{DESCRIPTION_BUDGET_TOKENS})")
+    parser.add_argument("--top", type=int, default=20, metavar="N",
+                        help="Rows --catalog lists (default: 20; 0 for all)")
+    parser.add_argument("--context-cost", action="store_true",
+                        help="Report estimated tokens on load, in references and on the "
+                             "heaviest reference path instead of linting")
+    parser.add_argument("--timing", action="store_true",
+                        help="Print a startup/imports/work/output breakdown to stderr")
     args = parser.parse_args()
+    marks = [("start", _T0), ("imports", _T_IMPORTED), ("args", time.perf_counter())]
+
+    format_type = args.format or ("json" if args.json else ("brief" if args.brief else "text"))
+
+    checks = None
+    if args.only or args.skip:
+        try:
+            checks = select_checks(
+                args.only.split(",") if args.only else None,
+                args.skip.split(",") if args.skip else None)
+        except ValueError as e:
+            parser.error(str(e))
+
+    if args.watch:
+        watch_path = args.watch.expanduser().resolve()
+        if not watch_path.is_dir():
+            print(f"Error: Not a directory: {watch_path}")
+            sys.exit(1)
+        try:
+            watch(watch_path, checks=checks, follow_aliases=not args.no_follow_aliases)
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+
+    if args.catalog:
+        index = SkillIndex()
+        roots = list(index.global_roots)
+        if args.skill_path is not None:
+            root = args.skill_path.expanduser().resolve()
+            if not root.is_dir():
+                print(f"Error: Not a directory: {root}")
+                sys.exit(1)
+            roots.insert(0, root)
+        print(format_catalog(catalog_entries(roots, index), args.budget, format_type, args.top))
+        sys.exit(0)
+
+    if args.all or args.changed:
+        root = (args.all or args.skill_path or Path('.')).expanduser().resolve()
+        if not root.is_dir():
+            print(f"Error: Not a directory: {root}")
+            sys.exit(1)
+        if args.changed:
+            # Nothing changed is a clean run, not an error: the hook passes.
+            try:
+                skills = changed_skills(root, args.base)
+            except ValueError as e:
+                print(f"Error: {e}")
+                sys.exit(1)
+        else:
+            skills = discover_skills(root)
+            if not skills:
+                print(f"Error: No */SKILL.md found under {root}")
+                sys.exit(1)
+        if args.context_cost:
+            costs = {skill.name: context_cost(
+                         SkillDocument.parse(skill, (skill / 'SKILL.md').read_text()))
+                     for skill in skills}
+            print(format_context_cost(costs, format_type))
+            sys.exit(0)
+        lint_kwargs = dict(follow_aliases=not args.no_follow_aliases, workers=args.workers,
+                           cache_dir=None if args.no_cache else CACHE_DIR, checks=checks,
+                           skills=skills)
+        if format_type == "ndjson":
+            # Stream: each line goes out as its skill finishes. Past the running
+            # counts, only alias targets' results stay in memory (for the
+            # aliases still to come); every other result is dropped once printed.
+            summary = summarize([])
+            for _, result in iter_lint_all(root, **lint_kwargs, keep_results=False):
+                print(format_ndjson(result), flush=True)
+                summarize([result], summary)
+            marks.append(("work+output", time.perf_counter()))
+            print(json.dumps({"root": str(root), "summary": summary}, separators=(',', ':')))
+            if args.timing:
+                report_timing(marks)
+            sys.exit(0 if summary["failed"] == 0 else 1)
+
+        results = lint_all(root, **lint_kwargs)
+        marks.append(("work", time.perf_counter()))
+        print(format_batch(root, results, format_type))
+        if args.timing:
+            report_timing(marks + [("output", time.perf_counter())])
+        sys.exit(0 if all(r.valid for r in results) else 1)
+
+    if args.skill_path is None:
+        parser.error("a skill path, --all ROOT or --watch PATH is required")
 
     skill_path = args.skill_path.expanduser().resolve()
 
@@ -843,10 +2138,31 @@ def main():
         print(f"Error: Path is not a directory: {skill_path}")
         sys.exit(1)
 
-    result = lint_skill(skill_path, follow_aliases=not args.no_follow_aliases)
-
-    format_type = "json" if args.json else ("brief" if args.brief else "text")
-    print(format_result(result, format_type))
+    if args.context_cost:
+        if not (skill_path / 'SKILL.md').is_file():
+            print(f"Error: No SKILL.md in {skill_path}")
+            sys.exit(1)
+        doc = SkillDocument.parse(skill_path, (skill_path / 'SKILL.md').read_text())
+        costs = {skill_path.name: context_cost(doc)}
+        print(format_context_cost(costs, format_type))
+        sys.exit(0)
+
+    if args.no_cache:
+        result = lint_skill(skill_path, follow_aliases=not args.no_follow_aliases, checks=checks)
+    else:
+        result = lint_skill_cached(skill_path, follow_aliases=not args.no_follow_aliases,
+                                   checks=checks)
+    marks.append(("work", time.perf_counter()))
+
+    if format_type == "ndjson":
+        print(format_ndjson(result))
+        # Same summary line as --all, with the skill's parent as the root.
+        print(json.dumps({"root": str(skill_path.parent), "summary": summarize([result])},
+                         separators=(',', ':')))
+    else:
+        print(format_result(result, format_type))
+    if args.timing:
+        report_timing(marks + [("output", time.perf_counter())])
 
     sys.exit(0 if result.valid else 1)
 
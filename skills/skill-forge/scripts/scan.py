@@ -14,6 +14,9 @@ Scans for:
 - Common secret patterns (API keys, tokens)
 """
 
+import time
+_T0 = time.perf_counter()  # --timing: first line of the script proper
+
 import argparse
 import json
 import os
@@ -24,8 +27,10 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
 
+_T_IMPORTED = time.perf_counter()
 
-@dataclass
+
+@dataclass(slots=True)
 class Finding:
     """A single privacy/security finding."""
     category: str  # email, path, company_term, secret, git_history
@@ -44,6 +49,11 @@ class ScanResult:
     findings: list[Finding] = field(default_factory=list)
     files_scanned: int = 0
     errors: list[str] = field(default_factory=list)
+    # Matches past the caps: (file, category, risk) -> count. Counted, never
+    # stored, so a pathological file costs a counter rather than a Finding
+    # (and a context string) per match.
+    suppressed: dict[tuple[str, str, str], int] = field(default_factory=dict)
+    since_ref: Optional[str] = None  # set for incremental (--since-ref) scans
 
 
 # Default patterns - can be overridden via config
@@ -69,7 +79,12 @@ DEFAULT_CONFIG = {
     "include_extensions": [
         ".md", ".py", ".js", ".ts", ".json", ".yaml", ".yml",
         ".sh", ".bash", ".toml", ".txt", ".html", ".css"
-    ]
+    ],
+    # Findings stored per file, and per category within a file. Past either
+    # cap, matches are counted and reported as "N more matches of X in file".
+    # High-risk findings are exempt and always listed.
+    "max_findings_per_file": 200,
+    "max_findings_per_category": 50,
 }
 
 
@@ -78,6 +93,10 @@ DEFAULT_CONFIG = {
 # absent, this path is tried so the gate hardens itself once per machine.
 DEFAULT_CONFIG_PATH = Path.home() / ".claude" / "sharing-scan.json"
 
+# Last fully scanned commit per repo, keyed by resolved scan root. Lets
+# `--since-ref last` pick up where the previous scan of that repo stopped.
+SCAN_STATE_PATH = Path.home() / ".claude" / "sharing-scan-state.json"
+
 # Categories that detect nothing until the config names personal terms.
 PERSONAL_LIST_KEYS = (
     "email_domains_high_risk", "path_usernames", "company_terms", "person_names"
@@ -98,34 +117,108 @@ def load_config(config_path: Optional[Path] = None) -> dict:
     return config
 
 
-def should_scan_file(path: Path, config: dict, root: Path) -> bool:
-    """Check if file should be scanned based on config."""
-    # Excluded directories are matched RELATIVE to the scan root. Matching on
-    # the absolute path's parts silently excluded everything under ~/.claude/
-    # (".claude" is itself an exclude), so scanning a skill there reported a
-    # clean bill from zero files (trousse-bujuta).
-    try:
-        rel_parts = path.relative_to(root).parts
-    except ValueError:
-        rel_parts = path.parts
-    for part in rel_parts[:-1]:
-        if part in config["exclude_dirs"]:
+def _glob_to_regex(glob: str) -> str:
+    """Translate one glob to a regex where wildcards stop at '/'.
+
+    Same per-segment semantics as ``PurePath.match``: ``*`` and ``?`` never
+    cross a directory separator; ``[...]`` is a character class.
+    """
+    out = []
+    i, n = 0, len(glob)
+    while i < n:
+        c = glob[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            j = glob.find("]", i + 1 if i < n and glob[i] in "!]" else i)
+            if j == -1:
+                out.append(r"\[")
+                continue
+            body = glob[i:j].replace("\\", r"\\")
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = j + 1
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+class PathFilter:
+    """Exclude/include rules compiled once per scan.
+
+    Directory excludes become a frozenset, every ``exclude_files`` glob is
+    folded into one alternation, and extensions into a frozenset — so the
+    per-path cost is a few set lookups and at most two regex matches, however
+    many rules the config names. Globs without '/' match the file name;
+    globs with '/' match the trailing segments of the root-relative path.
+    """
+    __slots__ = ("exclude_dirs", "name_re", "path_re", "include_extensions")
+
+    def __init__(self, config: dict):
+        self.exclude_dirs = frozenset(config["exclude_dirs"])
+        name_globs = [g for g in config["exclude_files"] if "/" not in g]
+        path_globs = [g.lstrip("/") for g in config["exclude_files"] if "/" in g]
+        self.name_re = (re.compile("(?:%s)" % "|".join(map(_glob_to_regex, name_globs)))
+                        if name_globs else None)
+        self.path_re = (re.compile("(?:^|/)(?:%s)$" % "|".join(map(_glob_to_regex, path_globs)))
+                        if path_globs else None)
+        self.include_extensions = frozenset(e.lower() for e in config["include_extensions"])
+
+    def accepts_file(self, rel: str, name: str) -> bool:
+        """Decide for a regular file already known to lie outside excluded dirs."""
+        if self.name_re is not None and self.name_re.fullmatch(name):
             return False
-
-    # Check excluded file patterns
-    for pattern in config["exclude_files"]:
-        if path.match(pattern):
+        if self.path_re is not None and self.path_re.search(rel):
             return False
-
-    # Check included extensions
-    if path.suffix.lower() in config["include_extensions"]:
-        return True
-
-    # Include extensionless files that might be scripts
-    if not path.suffix and path.is_file():
-        return True
-
-    return False
+        # PurePath.suffix semantics: dotfiles and trailing dots have none.
+        dot = name.rfind(".")
+        suffix = name[dot:] if 0 < dot < len(name) - 1 else ""
+        # Extensionless files might be scripts
+        return not suffix or suffix.lower() in self.include_extensions
+
+    def matches(self, path: Path, root: Path) -> bool:
+        """Full check for one path: excluded dirs, file globs, extensions."""
+        # Excluded directories are matched RELATIVE to the scan root. Matching on
+        # the absolute path's parts silently excluded everything under ~/.claude/
+        # (".claude" is itself an exclude), so scanning a skill there reported a
+        # clean bill from zero files (trousse-bujuta).
+        try:
+            rel_parts = path.relative_to(root).parts
+        except ValueError:
+            rel_parts = path.parts
+        if not self.exclude_dirs.isdisjoint(rel_parts[:-1]):
+            return False
+        return path.is_file() and self.accepts_file("/".join(rel_parts), path.name)
+
+    def walk(self, root: Path):
+        """Yield scannable files under root, pruning excluded dirs unvisited.
+
+        One scandir per directory; the DirEntry type cache answers is-dir and
+        is-file without a second stat. Symlinked directories are not
+        followed (as with rglob).
+        """
+        stack = [(str(root), "")]
+        while stack:
+            dir_path, rel_dir = stack.pop()
+            try:
+                with os.scandir(dir_path) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                rel = f"{rel_dir}{entry.name}"
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in self.exclude_dirs:
+                            stack.append((entry.path, rel + "/"))
+                    elif entry.is_file() and self.accepts_file(rel, entry.name):
+                        yield Path(entry.path)
+                except OSError:
+                    continue
 
 
 def get_context(lines: list[str], line_num: int, context_size: int = 1) -> str:
@@ -135,9 +228,48 @@ def get_context(lines: list[str], line_num: int, context_size: int = 1) -> str:
     return "\n".join(lines[start:end]).strip()
 
 
-def scan_file(path: Path, config: dict) -> list[Finding]:
-    """Scan a single file for privacy/security issues."""
+class _FindingCap:
+    """Per-file admission gate for findings.
+
+    Stores up to ``per_file`` findings in total and ``per_category`` per
+    category; everything past that is tallied by (category, risk) so the
+    report can still say how much was left out. High-risk findings are
+    always stored and never count against either cap: a secret after 200
+    emails must still be listed with its location.
+    """
+    __slots__ = ("per_file", "per_category", "stored", "by_category", "overflow")
+
+    def __init__(self, config: dict):
+        self.per_file = config.get("max_findings_per_file", 200)
+        self.per_category = config.get("max_findings_per_category", 50)
+        self.stored = 0
+        self.by_category: dict[str, int] = {}
+        self.overflow: dict[tuple[str, str], int] = {}
+
+    def admit(self, category: str, risk: str) -> bool:
+        if risk == "high":
+            return True
+        kept = self.by_category.get(category, 0)
+        if self.stored >= self.per_file or kept >= self.per_category:
+            key = (category, risk)
+            self.overflow[key] = self.overflow.get(key, 0) + 1
+            return False
+        self.stored += 1
+        self.by_category[category] = kept + 1
+        return True
+
+
+def scan_file(path: Path, config: dict,
+              overflow: Optional[dict[tuple[str, str], int]] = None) -> list[Finding]:
+    """Scan a single file for privacy/security issues.
+
+    Stored findings are capped per file and per category (see
+    ``max_findings_per_file`` / ``max_findings_per_category``). Matches past
+    the caps are counted into ``overflow`` as (category, risk) -> count
+    when a dict is passed, and dropped otherwise.
+    """
     findings = []
+    cap = _FindingCap(config)
 
     try:
         content = path.read_text(encoding="utf-8", errors="ignore")
@@ -171,6 +303,8 @@ def scan_file(path: Path, config: dict) -> list[Finding]:
             if any(x in email.lower() for x in ["example.com", "test.", "@test", "placeholder"]):
                 continue
 
+            if not cap.admit("email", risk):
+                continue
             findings.append(Finding(
                 category="email",
                 risk=risk,
@@ -186,6 +320,8 @@ def scan_file(path: Path, config: dict) -> list[Finding]:
         pattern = rf'/Users/{username}|/home/{username}|GoogleDrive-[^/]*{username}'
         for i, line in enumerate(lines, 1):
             for match in re.finditer(pattern, line, re.IGNORECASE):
+                if not cap.admit("path", "medium"):
+                    continue
                 findings.append(Finding(
                     category="path",
                     risk="medium",
@@ -208,6 +344,8 @@ def scan_file(path: Path, config: dict) -> list[Finding]:
 
         for i, line in enumerate(lines, 1):
             for match in re.finditer(pattern, line, flags):
+                if not cap.admit("company_term", "low"):
+                    continue
                 findings.append(Finding(
                     category="company_term",
                     risk="low",
@@ -225,6 +363,8 @@ def scan_file(path: Path, config: dict) -> list[Finding]:
             for match in re.finditer(pattern, line, re.IGNORECASE):
                 # Higher risk if it's not just a common word
                 risk = "high" if " " in name else "medium"  # Full names are higher risk
+                if not cap.admit("person_name", risk):
+                    continue
                 findings.append(Finding(
                     category="person_name",
                     risk=risk,
@@ -239,6 +379,8 @@ def scan_file(path: Path, config: dict) -> list[Finding]:
     for pattern in config["secret_patterns"]:
         for i, line in enumerate(lines, 1):
             for match in re.finditer(pattern, line):
+                if not cap.admit("secret", "high"):
+                    continue
                 findings.append(Finding(
                     category="secret",
                     risk="high",
@@ -249,12 +391,75 @@ def scan_file(path: Path, config: dict) -> list[Finding]:
                     reason="Potential secret/API key pattern"
                 ))
 
+    if overflow is not None:
+        for key, count in cap.overflow.items():
+            overflow[key] = overflow.get(key, 0) + count
+
     return findings
 
 
-def scan_git_history(repo_path: Path, config: dict) -> list[Finding]:
-    """Check git history for potentially sensitive files."""
+def _git(repo_path: Path, *args: str) -> Optional[str]:
+    """Run a git command in repo_path; stdout on success, None on failure."""
+    try:
+        r = subprocess.run(["git", *args], cwd=repo_path,
+                           capture_output=True, text=True, timeout=30)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return r.stdout if r.returncode == 0 else None
+
+
+def changed_files(repo_path: Path, since_ref: str) -> Optional[list[Path]]:
+    """Files under repo_path changed between since_ref and the working tree.
+
+    Covers commits in since_ref..HEAD plus staged, unstaged and untracked
+    changes. Deleted files are dropped. Returns None if the ref is unknown.
+    """
+    if _git(repo_path, "rev-parse", "--verify", "--quiet", f"{since_ref}^{{commit}}") is None:
+        return None
+    # -z: NUL-separated and unquoted, so a non-ASCII name comes back as
+    # itself rather than as "caf\303\251.md", which no file answers to.
+    names: set[str] = set()
+    for args in (("diff", "-z", "--name-only", "--relative", since_ref),
+                 ("diff", "-z", "--name-only", "--relative", "--cached", since_ref),
+                 ("ls-files", "-z", "--others", "--exclude-standard")):
+        out = _git(repo_path, *args)
+        if out:
+            names.update(n for n in out.split("\0") if n)
+    files = [repo_path / n for n in sorted(names)]
+    return [f for f in files if f.is_file()]
+
+
+def load_scan_state() -> dict:
+    """Read the last-fully-scanned-commit map; empty if absent or unreadable."""
+    try:
+        return json.loads(SCAN_STATE_PATH.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def record_scanned_commit(repo_path: Path) -> None:
+    """Remember HEAD as fully scanned for repo_path (no-op outside git)."""
+    head = _git(repo_path, "rev-parse", "HEAD")
+    if not head:
+        return
+    state = load_scan_state()
+    state[str(repo_path)] = head.strip()
+    try:
+        SCAN_STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        SCAN_STATE_PATH.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n")
+    except OSError as e:
+        print(f"note: could not record scan state: {e}", file=sys.stderr)
+
+
+def scan_git_history(repo_path: Path, config: dict,
+                     since_ref: Optional[str] = None) -> list[Finding]:
+    """Check git history for potentially sensitive files.
+
+    With since_ref, only files added in since_ref..HEAD are considered;
+    otherwise every file ever added on any ref.
+    """
     findings = []
+    rev_range = [f"{since_ref}..HEAD"] if since_ref else ["--all"]
 
     sensitive_files = [
         "credentials.json", "token.json", ".env", "secrets.",
@@ -263,7 +468,7 @@ def scan_git_history(repo_path: Path, config: dict) -> list[Finding]:
 
     try:
         result = subprocess.run(
-            ["git", "log", "--all", "--pretty=format:", "--name-only", "--diff-filter=A"],
+            ["git", "log", *rev_range, "--pretty=format:", "--name-only", "--diff-filter=A"],
             cwd=repo_path,
             capture_output=True,
             text=True,
@@ -313,9 +518,25 @@ def scan_git_history(repo_path: Path, config: dict) -> list[Finding]:
     return findings
 
 
-def scan_repo(repo_path: Path, config: dict) -> ScanResult:
-    """Scan an entire repository."""
-    result = ScanResult(repo=str(repo_path))
+def _scan_into(result: ScanResult, path: Path, config: dict) -> None:
+    """Scan one file and fold its findings and capped overflow into result."""
+    result.files_scanned += 1
+    overflow: dict[tuple[str, str], int] = {}
+    try:
+        result.findings.extend(scan_file(path, config, overflow))
+    except Exception as e:
+        result.errors.append(f"Error scanning {path}: {e}")
+    for (category, risk), count in overflow.items():
+        result.suppressed[(str(path), category, risk)] = count
+
+
+def scan_repo(repo_path: Path, config: dict, since_ref: Optional[str] = None) -> ScanResult:
+    """Scan an entire repository.
+
+    With since_ref, scan only files changed since that ref (committed or
+    not) and only the history added since it.
+    """
+    result = ScanResult(repo=str(repo_path), since_ref=since_ref)
 
     if not repo_path.exists():
         result.errors.append(f"Path does not exist: {repo_path}")
@@ -324,43 +545,59 @@ def scan_repo(repo_path: Path, config: dict) -> ScanResult:
     # An explicit file argument means scan exactly that file — rglob on a
     # file path yields nothing, which used to read as a clean 0-file pass.
     if repo_path.is_file():
-        result.files_scanned += 1
-        try:
-            result.findings.extend(scan_file(repo_path, config))
-        except Exception as e:
-            result.errors.append(f"Error scanning {repo_path}: {e}")
+        _scan_into(result, repo_path, config)
         return result
 
+    path_filter = PathFilter(config)
+    if since_ref:
+        changed = changed_files(repo_path, since_ref)
+        if changed is None:
+            result.errors.append(f"Unknown git ref: {since_ref}")
+            return result
+        paths = (p for p in changed if path_filter.matches(p, repo_path))
+    else:
+        paths = path_filter.walk(repo_path)
+
     # Scan files
-    for path in repo_path.rglob("*"):
-        if path.is_file() and should_scan_file(path, config, repo_path):
-            result.files_scanned += 1
-            try:
-                findings = scan_file(path, config)
-                result.findings.extend(findings)
-            except Exception as e:
-                result.errors.append(f"Error scanning {path}: {e}")
+    for path in paths:
+        _scan_into(result, path, config)
 
     # Scan git history
     if (repo_path / ".git").exists():
-        git_findings = scan_git_history(repo_path, config)
+        git_findings = scan_git_history(repo_path, config, since_ref)
         result.findings.extend(git_findings)
 
     return result
 
 
+def _display_path(file: str, repo: str) -> str:
+    """file relative to the scan root; its name when the root is the file itself."""
+    path, root = Path(file), Path(repo)
+    try:
+        return str(path.relative_to(root)) if path != root else path.name
+    except ValueError:
+        return str(path)
+
+
 def format_findings(result: ScanResult, format_type: str = "text") -> str:
     """Format scan results for output."""
     if format_type == "json":
         return json.dumps({
             "repo": result.repo,
+            "since_ref": result.since_ref,
             "files_scanned": result.files_scanned,
             "findings": [asdict(f) for f in result.findings],
+            "suppressed": [
+                {"file": file, "category": category, "risk": risk, "count": count}
+                for (file, category, risk), count in result.suppressed.items()
+            ],
             "errors": result.errors
         }, indent=2)
 
     # Text format
     lines = [f"\n{'='*60}", f"SCAN: {result.repo}", f"{'='*60}"]
+    if result.since_ref:
+        lines.append(f"Since: {result.since_ref} (changed files only)")
     lines.append(f"Files scanned: {result.files_scanned}")
 
     if result.errors:
@@ -373,8 +610,20 @@ def format_findings(result: ScanResult, format_type: str = "text") -> str:
     medium = [f for f in result.findings if f.risk == "medium"]
     low = [f for f in result.findings if f.risk == "low"]
 
-    lines.append(f"\nFindings: {len(result.findings)} total")
-    lines.append(f"  HIGH: {len(high)}  MEDIUM: {len(medium)}  LOW: {len(low)}")
+    capped = {"high": 0, "medium": 0, "low": 0}
+    for (_file, _category, risk), count in result.suppressed.items():
+        capped[risk] = capped.get(risk, 0) + count
+
+    def tally(found: list[Finding], risk: str) -> str:
+        return f"{len(found)} (+{capped[risk]} capped)" if capped.get(risk) else str(len(found))
+
+    total = len(result.findings)
+    if result.suppressed:
+        lines.append(f"\nFindings: {total} total (+{sum(capped.values())} capped)")
+    else:
+        lines.append(f"\nFindings: {total} total")
+    lines.append(f"  HIGH: {tally(high, 'high')}  MEDIUM: {tally(medium, 'medium')}  "
+                 f"LOW: {tally(low, 'low')}")
 
     for risk_level, findings in [("HIGH", high), ("MEDIUM", medium), ("LOW", low)]:
         if findings:
@@ -395,6 +644,16 @@ def format_findings(result: ScanResult, format_type: str = "text") -> str:
                 lines.append(f"    Match: {f.match}")
                 lines.append(f"    Reason: {f.reason}")
 
+    if result.suppressed:
+        # Fold risks together: the cap is per category, so is the summary.
+        per_file: dict[tuple[str, str], int] = {}
+        for (file, category, _risk), count in result.suppressed.items():
+            per_file[(file, category)] = per_file.get((file, category), 0) + count
+        lines.append(f"\n--- CAPPED ({sum(per_file.values())} matches not listed) ---")
+        for (file, category), count in sorted(per_file.items()):
+            lines.append(f"  {count} more matches of {category} in "
+                         f"{_display_path(file, result.repo)}")
+
     return "\n".join(lines)
 
 
@@ -406,7 +665,15 @@ def main():
     parser.add_argument("--format", choices=["text", "json"], default="text")
     parser.add_argument("--risk", choices=["all", "high", "medium"], default="all",
                         help="Minimum risk level to report")
+    parser.add_argument("--since-ref", metavar="REF",
+                        help="Scan only files changed since REF (plus working-tree changes) "
+                             "and history added since it; 'last' = the last fully scanned "
+                             f"commit recorded in {SCAN_STATE_PATH}")
+    parser.add_argument("--timing", action="store_true",
+                        help="Print a startup/imports/work/output breakdown to stderr")
     args = parser.parse_args()
+    marks = [("start", _T0), ("imports", _T_IMPORTED), ("args", time.perf_counter())]
+    output_s = 0.0  # reports print per path, between scans
 
     config_path = args.config
     if config_path is None and DEFAULT_CONFIG_PATH.exists():
@@ -422,19 +689,44 @@ def main():
               f"Personal terms live in --config or {DEFAULT_CONFIG_PATH}.",
               file=sys.stderr)
 
+    state = load_scan_state() if args.since_ref == "last" else {}
     all_results = []
     for path_str in args.paths:
         path = Path(path_str).expanduser().resolve()
-        result = scan_repo(path, config)
+        since_ref = args.since_ref
+        if since_ref == "last":
+            since_ref = state.get(str(path))
+            if since_ref is None:
+                print(f"note: no recorded scan for {path}; scanning in full.", file=sys.stderr)
+        if since_ref and not path.is_dir():
+            since_ref = None  # a single file is always scanned whole
+        result = scan_repo(path, config, since_ref)
+
+        # Every file up to HEAD has now been looked at — the full tree, or the
+        # changes on top of the commit the previous scan recorded. An
+        # arbitrary --since-ref never scanned what came before it, so it
+        # must not become the base a later `last` resumes from.
+        if path.is_dir() and not result.errors and args.since_ref in (None, "last"):
+            record_scanned_commit(path)
 
         # Filter by risk level
         if args.risk == "high":
             result.findings = [f for f in result.findings if f.risk == "high"]
+            result.suppressed = {k: v for k, v in result.suppressed.items() if k[2] == "high"}
         elif args.risk == "medium":
             result.findings = [f for f in result.findings if f.risk in ["high", "medium"]]
+            result.suppressed = {k: v for k, v in result.suppressed.items()
+                                 if k[2] in ["high", "medium"]}
 
         all_results.append(result)
+        t = time.perf_counter()
         print(format_findings(result, args.format))
+        output_s += time.perf_counter() - t
+
+    if args.timing:
+        from timing import report_timing
+        end = time.perf_counter()
+        report_timing(marks + [("work", end - output_s), ("output", end)])
 
     # Exit with error if high-risk findings
     high_count = sum(len([f for f in r.findings if f.risk == "high"]) for r in all_results)
@@ -444,7 +736,10 @@ def main():
 
     # A scanner that saw nothing must never look like a scanner that found
     # nothing: zero files is an instrument failure, not a clean bill.
-    zero = [r for r in all_results if r.files_scanned == 0]
+    # An incremental scan with nothing changed is legitimately empty; one that
+    # could not resolve its ref is not.
+    zero = [r for r in all_results
+            if r.files_scanned == 0 and (r.since_ref is None or r.errors)]
     if zero:
         for r in zero:
             print(f"\n⚠️  SCANNER FAILURE: 0 files scanned in {r.repo} — NOT a clean bill. "
@@ -20,17 +20,26 @@ Usage:
     score_description.py <skill-path>
     score_description.py <skill-path> --json
     score_description.py --text "description text"
+    score_description.py --corpus skills.jsonl --workers 4   # NDJSON, one line per record
+    score_description.py --corpus skills.jsonl --weights w.json   # re-score, no regex
 """
 
+import time
+_T0 = time.perf_counter()  # --timing: first line of the script proper
+
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 
-import yaml
+_T_IMPORTED = time.perf_counter()
 
 
 @dataclass
@@ -54,6 +63,146 @@ class CSOScore:
     overall_suggestions: list[str] = field(default_factory=list)
 
 
+# Everything the CSO components and lint_skill's description checks look for.
+# describe() finds all of it once per description; both read the resulting
+# DescriptionFeatures instead of re-scanning the text.
+GATE_TERMS = ('before', 'first', 'required', 'always',
+              'after', 'when', 'during', 'triggers on', 'mandatory', 'must')
+
+# "before" followed by a specific noun phrase, not just "before" alone
+SPECIFIC_BEFORE_RE = re.compile(
+    r'\bbefore\s+(?:any\s+|writing\s+|loading\s+|running\s+|using\s+|proposing\s+)\w+')
+
+# (pattern, needle, label). The needle is a lowercase literal every match
+# contains; describe() runs a pattern only when its needle is in the
+# lowercased text, so most patterns cost one substring test.
+# Matched case-insensitively:
+METHOD_PATTERNS = [
+    (r'\d+-step', '-step', "numbered steps"),
+    (r'\d+-phase', '-phase', "numbered phases"),
+    (r'framework', 'framework', "framework"),
+    (r'workflow', 'workflow', "workflow"),
+    (r'checklist', 'checklist', "checklist"),
+    (r'process', 'process', "process"),
+    (r'pattern', 'pattern', "pattern"),
+    (r'approach', 'approach', "approach"),
+    (r'method', 'method', "method"),
+    (r'template', 'template', "template"),
+]
+VALUE_PATTERNS = [
+    (r'ensures?', 'ensure', "ensures outcome"),
+    (r'prevents?', 'prevent', "prevents problem"),
+    (r'validates?', 'validate', "validates"),
+    (r'guides?', 'guide', "guides"),
+    (r'provides?', 'provide', "provides"),
+]
+# Labelled by key; each consumer words its own message.
+VAGUE_PATTERNS = [
+    (r'\bhelps? with\b', 'help', 'helps_with'),
+    (r'\bassists?\b', 'assist', 'assists'),
+    (r'\bprovides?\s+(?:a\s+)?(?:way|tool|method)\b', 'provide', 'provides_a_way'),
+    (r'\bcan be used\b', 'can be used', 'can_be_used'),
+    (r'\bmay be\b', 'may be', 'may_be'),
+    (r'\bvarious\b', 'various', 'various'),
+    (r'\bgeneral\b', 'general', 'general'),
+    (r'\bsimply\b', 'simply', 'simply'),
+    (r'\bjust\b', 'just', 'just'),
+    (r'\bbasically\b', 'basically', 'basically'),
+]
+# Matched case-sensitively:
+SPECIFIC_PATTERNS = [
+    (r'\b\d+\b', None, "includes numbers"),
+    (r'\([^)]+\)', '(', "has parenthetical detail"),
+    (r':', ':', "uses colon for structure"),
+]
+
+# The only non-ASCII characters IGNORECASE matches to an ASCII letter
+# (İ ı ſ and the Kelvin sign). Their lowercase is not that letter, so a
+# description containing one skips the needle test and runs every pattern.
+CASE_FOLD_EXTRAS_RE = re.compile('[\u0130\u0131\u017f\u212a]')
+
+
+def _compile_table(table: list[tuple], flags: int = 0) -> list[tuple]:
+    return [(re.compile(pattern, flags), needle, label) for pattern, needle, label in table]
+
+
+# Compiled once at import; re.search(str, ...) would look each up again
+# in re's cache on every call.
+_METHOD_TABLE = _compile_table(METHOD_PATTERNS, re.IGNORECASE)
+_VALUE_TABLE = _compile_table(VALUE_PATTERNS, re.IGNORECASE)
+_VAGUE_TABLE = _compile_table(VAGUE_PATTERNS, re.IGNORECASE)
+_SPECIFIC_TABLE = _compile_table(SPECIFIC_PATTERNS)
+_SINGLE_QUOTED_RE = re.compile(r"'([^']+)'")
+_DOUBLE_QUOTED_RE = re.compile(r'"([^"]+)"')
+
+
+def _labels_found(table: list[tuple], desc: str, lower: Optional[str]) -> Iterator[str]:
+    """Labels of the table's patterns that match desc, in table order.
+
+    lower is desc.lower(), or None to skip the needle prefilter.
+    """
+    for regex, needle, label in table:
+        if (lower is None or needle is None or needle in lower) and regex.search(desc):
+            yield label
+
+
+# Weak/imperative verbs (Claude might not invoke)
+WEAK_STARTERS = ('use', 'invoke', 'call', 'run', 'apply', 'help')
+# Strong third-person verbs (best for discovery)
+STRONG_VERBS = (
+    'orchestrates', 'validates', 'guides', 'tracks', 'manages',
+    'analyzes', 'transforms', 'generates', 'synthesizes', 'integrates',
+    'coordinates', 'calibrates', 'enforces', 'automates'
+)
+
+
+@dataclass(frozen=True)
+class DescriptionFeatures:
+    """What a description contains, as the scorers and lint checks see it."""
+    text: str
+    length: int
+    first_word: str  # as written; compare lowercased
+    has_angle_brackets: bool
+    has_user_tag: bool  # ends with "(user)"
+    gates: frozenset[str]  # GATE_TERMS present, as substrings of the lowercased text
+    specific_before: bool
+    single_quoted: tuple[str, ...]
+    double_quoted: tuple[str, ...]
+    methods: tuple[str, ...]  # METHOD_PATTERNS labels found, in table order
+    values: tuple[str, ...]
+    vague: frozenset[str]  # VAGUE_PATTERNS keys found
+    specifics: tuple[str, ...]
+    strong_verbs: tuple[str, ...]  # STRONG_VERBS present, in table order
+    opens_strong: bool  # starts with one of STRONG_VERBS
+    dash_opener: bool  # "—" or " - " in the first 80 chars
+
+
+@lru_cache(maxsize=1024)
+def describe(desc: str) -> DescriptionFeatures:
+    """Analyse a description once; memoized, so every consumer shares it."""
+    lower = desc.lower()
+    words = desc.split()
+    needles = None if CASE_FOLD_EXTRAS_RE.search(desc) else lower
+    return DescriptionFeatures(
+        text=desc,
+        length=len(desc),
+        first_word=words[0] if words else "",
+        has_angle_brackets='<' in desc or '>' in desc,
+        has_user_tag=desc.endswith('(user)'),
+        gates=frozenset(term for term in GATE_TERMS if term in lower),
+        specific_before='before' in lower and bool(SPECIFIC_BEFORE_RE.search(lower)),
+        single_quoted=tuple(_SINGLE_QUOTED_RE.findall(desc)),
+        double_quoted=tuple(_DOUBLE_QUOTED_RE.findall(desc)),
+        methods=tuple(_labels_found(_METHOD_TABLE, desc, needles)),
+        values=tuple(_labels_found(_VALUE_TABLE, desc, needles)),
+        vague=frozenset(_labels_found(_VAGUE_TABLE, desc, needles)),
+        specifics=tuple(_labels_found(_SPECIFIC_TABLE, desc, needles)),
+        strong_verbs=tuple(verb for verb in STRONG_VERBS if verb in lower),
+        opens_strong=lower.startswith(STRONG_VERBS),
+        dash_opener='—' in desc[:80] or ' - ' in desc[:80],
+    )
+
+
 def score_timing_gates(desc: str) -> ScoreComponent:
     """Score timing-related language that creates invocation gates.
 
@@ -66,7 +215,8 @@ def score_timing_gates(desc: str) -> ScoreComponent:
     details = []
     suggestions = []
 
-    desc_lower = desc.lower()
+    features = describe(desc)
+    gates = features.gates
 
     # Lifecycle positioning — clear "when in the workflow" signal
     positioning_gates = {
@@ -85,27 +235,27 @@ def score_timing_gates(desc: str) -> ScoreComponent:
     }
 
     # Bonus: "before" followed by a specific noun phrase (not just "before" alone)
-    if re.search(r'\bbefore\s+(?:any\s+|writing\s+|loading\s+|running\s+|using\s+|proposing\s+)\w+', desc_lower):
+    if features.specific_before:
         score += 3
         details.append("Specific lifecycle context")
 
     # Legacy: treat "mandatory" and "must" same as their calmer equivalents
     # (no extra points for using ALL CAPS or command-register words)
-    if 'mandatory' in desc_lower and 'before' not in desc_lower:
+    if 'mandatory' in gates and 'before' not in gates:
         score += positioning_gates['before']  # Same as 'before'
-    if 'must' in desc_lower and 'required' not in desc_lower:
+    if 'must' in gates and 'required' not in gates:
         score += positioning_gates['required']  # Same as 'required'
 
     found_positioning = []
     found_context = []
 
     for gate, points in positioning_gates.items():
-        if gate in desc_lower:
+        if gate in gates:
             found_positioning.append(gate)
             score += points
 
     for gate, points in context_gates.items():
-        if gate in desc_lower:
+        if gate in gates:
             found_context.append(gate)
             score += points
 
@@ -131,6 +281,12 @@ def score_timing_gates(desc: str) -> ScoreComponent:
     )
 
 
+def trigger_phrases(features: DescriptionFeatures) -> list[str]:
+    """Quoted phrases that read as triggers, not URLs or quoted prose."""
+    return [t for t in features.single_quoted + features.double_quoted
+            if len(t) < 50 and not t.startswith('http')]
+
+
 def score_trigger_phrases(desc: str) -> ScoreComponent:
     """Score explicit trigger phrases in quotes."""
     max_points = 20
@@ -138,16 +294,12 @@ def score_trigger_phrases(desc: str) -> ScoreComponent:
     details = []
     suggestions = []
 
-    # Find phrases in single quotes
-    single_quoted = re.findall(r"'([^']+)'", desc)
-    # Find phrases in double quotes (but not YAML strings)
-    double_quoted = re.findall(r'"([^"]+)"', desc)
-
-    all_triggers = single_quoted + double_quoted
+    # Phrases in single quotes, then double quotes (but not YAML strings)
+    features = describe(desc)
+    all_triggers = features.single_quoted + features.double_quoted
 
     if all_triggers:
-        # Filter out likely non-trigger content
-        real_triggers = [t for t in all_triggers if len(t) < 50 and not t.startswith('http')]
+        real_triggers = trigger_phrases(features)
 
         if real_triggers:
             # Score: 5 points per trigger, up to 4 triggers
@@ -172,46 +324,37 @@ def score_trigger_phrases(desc: str) -> ScoreComponent:
 def score_method_preview(desc: str) -> ScoreComponent:
     """Score whether description previews the method/approach."""
     max_points = 15
-    score = 0
     details = []
     suggestions = []
 
     # Method indicators
-    method_patterns = [
-        (r'\d+-step', 5, "numbered steps"),
-        (r'\d+-phase', 5, "numbered phases"),
-        (r'framework', 4, "framework"),
-        (r'workflow', 4, "workflow"),
-        (r'checklist', 4, "checklist"),
-        (r'process', 3, "process"),
-        (r'pattern', 3, "pattern"),
-        (r'approach', 3, "approach"),
-        (r'method', 3, "method"),
-        (r'template', 3, "template"),
-    ]
+    method_points = {
+        "numbered steps": 5,
+        "numbered phases": 5,
+        "framework": 4,
+        "workflow": 4,
+        "checklist": 4,
+        "process": 3,
+        "pattern": 3,
+        "approach": 3,
+        "method": 3,
+        "template": 3,
+    }
 
     # Value indicators (what user gets)
-    value_patterns = [
-        (r'ensures?', 4, "ensures outcome"),
-        (r'prevents?', 4, "prevents problem"),
-        (r'validates?', 3, "validates"),
-        (r'guides?', 2, "guides"),
-        (r'provides?', 2, "provides"),
-    ]
-
-    found_methods = []
-    found_values = []
-
-    for pattern, points, label in method_patterns:
-        if re.search(pattern, desc, re.IGNORECASE):
-            found_methods.append(label)
-            score += points
-
-    for pattern, points, label in value_patterns:
-        if re.search(pattern, desc, re.IGNORECASE):
-            found_values.append(label)
-            score += points
+    value_points = {
+        "ensures outcome": 4,
+        "prevents problem": 4,
+        "validates": 3,
+        "guides": 2,
+        "provides": 2,
+    }
 
+    features = describe(desc)
+    found_methods = list(features.methods)
+    found_values = list(features.values)
+    score = sum(method_points[m] for m in found_methods) + \
+        sum(value_points[v] for v in found_values)
     score = min(score, max_points)
 
     if found_methods:
@@ -243,38 +386,35 @@ def score_specificity(desc: str) -> ScoreComponent:
     details = []
     suggestions = []
 
-    # Vague patterns (deduct points)
-    vague_patterns = [
-        (r'\bhelps? with\b', -5, "'helps with' is vague"),
-        (r'\bassists?\b', -4, "'assists' is passive"),
-        (r'\bcan be used\b', -5, "passive voice"),
-        (r'\bmay be\b', -3, "uncertain language"),
-        (r'\bvarious\b', -3, "'various' is vague"),
-        (r'\bgeneral\b', -3, "'general' lacks specificity"),
-        (r'\bsimply\b', -2, "'simply' adds nothing"),
-        (r'\bjust\b', -2, "'just' minimizes value"),
-        (r'\bbasically\b', -2, "'basically' is filler"),
+    # Vague patterns (deduct points), by VAGUE_PATTERNS key
+    vague_penalties = [
+        ('helps_with', -5, "'helps with' is vague"),
+        ('assists', -4, "'assists' is passive"),
+        ('can_be_used', -5, "passive voice"),
+        ('may_be', -3, "uncertain language"),
+        ('various', -3, "'various' is vague"),
+        ('general', -3, "'general' lacks specificity"),
+        ('simply', -2, "'simply' adds nothing"),
+        ('just', -2, "'just' minimizes value"),
+        ('basically', -2, "'basically' is filler"),
     ]
 
     # Specific patterns (bonus points)
-    specific_patterns = [
-        (r'\b\d+\b', 2, "includes numbers"),
-        (r'\([^)]+\)', 2, "has parenthetical detail"),
-        (r':', 1, "uses colon for structure"),
-    ]
+    specific_points = {
+        "includes numbers": 2,
+        "has parenthetical detail": 2,
+        "uses colon for structure": 1,
+    }
 
+    features = describe(desc)
     found_vague = []
-    found_specific = []
-
-    for pattern, points, label in vague_patterns:
-        if re.search(pattern, desc, re.IGNORECASE):
+    for key, points, label in vague_penalties:
+        if key in features.vague:
             found_vague.append(label)
             score += points  # points are negative
 
-    for pattern, points, label in specific_patterns:
-        if re.search(pattern, desc):
-            found_specific.append(label)
-            score += points
+    found_specific = list(features.specifics)
+    score += sum(specific_points[s] for s in found_specific)
 
     score = max(0, min(score, max_points))
 
@@ -304,29 +444,18 @@ def score_action_verbs(desc: str) -> ScoreComponent:
     details = []
     suggestions = []
 
-    # Strong third-person verbs (best for discovery)
-    strong_verbs = [
-        'orchestrates', 'validates', 'guides', 'tracks', 'manages',
-        'analyzes', 'transforms', 'generates', 'synthesizes', 'integrates',
-        'coordinates', 'calibrates', 'enforces', 'automates'
-    ]
-
-    # Weak/imperative verbs (Claude might not invoke)
-    weak_starters = ['use', 'invoke', 'call', 'run', 'apply', 'help']
-
-    first_word = desc.split()[0].lower() if desc else ""
+    features = describe(desc)
+    first_word = features.first_word.lower()
 
     # Check first word — domain-noun openers (e.g. "BigQuery data analysis —") are
     # valid for methodology/reference skills, scored same as strong verbs
-    has_dash_separator = '—' in desc[:80] or ' - ' in desc[:80]
-
-    if first_word in weak_starters:
+    if first_word in WEAK_STARTERS:
         details.append(f"Starts with weak verb '{first_word}'")
         suggestions.append(f"Change '{first_word.capitalize()}...' to third-person: 'Orchestrates...', 'Validates...'")
-    elif any(desc.lower().startswith(v) for v in strong_verbs):
+    elif features.opens_strong:
         score += 7
         details.append("Starts with strong third-person verb")
-    elif has_dash_separator:
+    elif features.dash_opener:
         score += 5
         details.append("Domain-noun opener with qualifier")
     else:
@@ -334,7 +463,7 @@ def score_action_verbs(desc: str) -> ScoreComponent:
         score += 3
 
     # Check for strong verbs anywhere
-    strong_found = [v for v in strong_verbs if v in desc.lower()]
+    strong_found = features.strong_verbs
     if strong_found:
         score += min(len(strong_found) * 2, 5)
         details.append(f"Strong verbs: {', '.join(strong_found[:3])}")
@@ -353,7 +482,7 @@ def score_action_verbs(desc: str) -> ScoreComponent:
 def score_length(desc: str) -> ScoreComponent:
     """Score description length (not too short, not too long)."""
     max_points = 10
-    length = len(desc)
+    length = describe(desc).length
     details = []
     suggestions = []
 
@@ -433,38 +562,370 @@ def score_description(desc: str) -> CSOScore:
     )
 
 
+# Feature vectors: each component's score is base + weights · x, clipped to
+# [0, max_points]. Under DEFAULT_WEIGHTS this reproduces the score_*
+# functions exactly (tests hold them together); --weights swaps in others
+# and re-scores a cached corpus matrix without running a regex.
+POSITIONING_GATES = ('before', 'first', 'required', 'always')
+CONTEXT_GATES = ('after', 'when', 'during', 'triggers on')
+LENGTH_BUCKETS = ('length<50', 'length<100', 'length<=500', 'length<=800', 'length>800')
+
+FEATURE_NAMES = (
+    'specific_before', 'mandatory_without_before', 'must_without_required',
+    *(f'gate:{gate}' for gate in POSITIONING_GATES + CONTEXT_GATES),
+    'triggers',
+    *(f'method:{label}' for _, _, label in METHOD_PATTERNS),
+    *(f'value:{label}' for _, _, label in VALUE_PATTERNS),
+    *(f'vague:{key}' for _, _, key in VAGUE_PATTERNS),
+    *(f'specific:{label}' for _, _, label in SPECIFIC_PATTERNS),
+    'opener:weak', 'opener:strong', 'opener:dash', 'opener:neutral',
+    # min(2 * strong verbs, 5) as steps, so it stays linear
+    'strong_verbs>=1', 'strong_verbs>=2', 'strong_verbs>=3',
+    *LENGTH_BUCKETS,
+)
+_FEATURE_INDEX = {name: i for i, name in enumerate(FEATURE_NAMES)}
+
+DEFAULT_WEIGHTS = {
+    "timing_gates": {"max_points": 25, "base": 0, "weights": {
+        'specific_before': 3, 'mandatory_without_before': 8, 'must_without_required': 6,
+        'gate:before': 8, 'gate:first': 8, 'gate:required': 6, 'gate:always': 5,
+        'gate:after': 4, 'gate:when': 4, 'gate:during': 3, 'gate:triggers on': 5,
+    }},
+    "trigger_phrases": {"max_points": 20, "base": 0, "weights": {'triggers': 5}},
+    "method_preview": {"max_points": 15, "base": 0, "weights": {
+        'method:numbered steps': 5, 'method:numbered phases': 5, 'method:framework': 4,
+        'method:workflow': 4, 'method:checklist': 4, 'method:process': 3,
+        'method:pattern': 3, 'method:approach': 3, 'method:method': 3, 'method:template': 3,
+        'value:ensures outcome': 4, 'value:prevents problem': 4, 'value:validates': 3,
+        'value:guides': 2, 'value:provides': 2,
+    }},
+    "specificity": {"max_points": 20, "base": 20, "weights": {
+        'vague:helps_with': -5, 'vague:assists': -4, 'vague:can_be_used': -5,
+        'vague:may_be': -3, 'vague:various': -3, 'vague:general': -3,
+        'vague:simply': -2, 'vague:just': -2, 'vague:basically': -2,
+        'specific:includes numbers': 2, 'specific:has parenthetical detail': 2,
+        'specific:uses colon for structure': 1,
+    }},
+    "action_verbs": {"max_points": 10, "base": 0, "weights": {
+        'opener:strong': 7, 'opener:dash': 5, 'opener:neutral': 3,
+        'strong_verbs>=1': 2, 'strong_verbs>=2': 2, 'strong_verbs>=3': 1,
+    }},
+    "length": {"max_points": 10, "base": 0, "weights": {
+        'length<50': 2, 'length<100': 5, 'length<=500': 10, 'length<=800': 7, 'length>800': 4,
+    }},
+}
+
+
+def feature_vector(desc: str) -> list[int]:
+    """The description's FEATURE_NAMES values, from its (memoized) features."""
+    f = describe(desc)
+    x = [0] * len(FEATURE_NAMES)
+
+    def put(name, value=1):
+        x[_FEATURE_INDEX[name]] = int(value)
+
+    put('specific_before', f.specific_before)
+    put('mandatory_without_before', 'mandatory' in f.gates and 'before' not in f.gates)
+    put('must_without_required', 'must' in f.gates and 'required' not in f.gates)
+    for gate in POSITIONING_GATES + CONTEXT_GATES:
+        put(f'gate:{gate}', gate in f.gates)
+    put('triggers', len(trigger_phrases(f)))
+    for label in f.methods:
+        put(f'method:{label}')
+    for label in f.values:
+        put(f'value:{label}')
+    for key in f.vague:
+        put(f'vague:{key}')
+    for label in f.specifics:
+        put(f'specific:{label}')
+    if f.first_word.lower() in WEAK_STARTERS:
+        put('opener:weak')
+    elif f.opens_strong:
+        put('opener:strong')
+    elif f.dash_opener:
+        put('opener:dash')
+    else:
+        put('opener:neutral')
+    for n in (1, 2, 3):
+        put(f'strong_verbs>={n}', len(f.strong_verbs) >= n)
+    bucket = (0 if f.length < 50 else 1 if f.length < 100 else 2 if f.length <= 500
+              else 3 if f.length <= 800 else 4)
+    put(LENGTH_BUCKETS[bucket])
+    return x
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def load_weights(path: Path) -> dict:
+    """DEFAULT_WEIGHTS with a JSON file's overrides applied.
+
+    The file maps component -> any of {"max_points", "base", "weights"},
+    where "weights" maps feature name -> weight; anything left out keeps
+    its default. Raises ValueError, naming the key, for unknown components,
+    keys or features, a non-object where an object belongs, or a
+    non-numeric value.
+    """
+    overrides = json.loads(Path(path).read_text())
+    if not isinstance(overrides, dict):
+        raise ValueError("Expected an object of component -> overrides")
+    weights = {name: {**spec, "weights": dict(spec["weights"])}
+               for name, spec in DEFAULT_WEIGHTS.items()}
+    for component, spec in overrides.items():
+        if component not in weights:
+            raise ValueError(f"Unknown component: {component}")
+        if not isinstance(spec, dict):
+            raise ValueError(f"{component}: expected an object, got {type(spec).__name__}")
+        for key, value in spec.items():
+            if key not in ("max_points", "base", "weights"):
+                raise ValueError(f"{component}: unknown key: {key}")
+            if key != "weights" and not _is_number(value):
+                raise ValueError(f"{component}.{key}: expected a number, got {value!r}")
+        features = spec.get("weights", {})
+        if not isinstance(features, dict):
+            raise ValueError(f"{component}.weights: expected an object of feature -> weight")
+        unknown = set(features) - set(FEATURE_NAMES)
+        if unknown:
+            raise ValueError(f"Unknown feature(s) for {component}: {', '.join(sorted(unknown))}")
+        for feature, weight in features.items():
+            if not _is_number(weight):
+                raise ValueError(f"{component}.weights.{feature}: expected a number, "
+                                 f"got {weight!r}")
+        weights[component].update({k: v for k, v in spec.items() if k != "weights"})
+        weights[component]["weights"].update(features)
+    return weights
+
+
+def _plain(value: float):
+    """An int when the weights kept it whole, else rounded for output."""
+    return int(value) if float(value).is_integer() else round(float(value), 2)
+
+
+def score_vectors(rows: list[list[int]], weights: dict = DEFAULT_WEIGHTS,
+                  use_numpy: Optional[bool] = None) -> list[dict]:
+    """Component scores, total and grade for each feature row.
+
+    The plain-Python loop is the real path: under `uv run --script` the
+    script's only dependency is PyYAML. NumPy is used when the interpreter
+    already has it (use_numpy=None), and gives the same numbers.
+    """
+    if use_numpy is None or use_numpy:
+        try:
+            import numpy as np
+        except ImportError:
+            if use_numpy:
+                raise
+            np = None
+    else:
+        np = None
+
+    names = list(weights)
+    max_score = sum(weights[name]["max_points"] for name in names)
+    # Whole-number weights give whole-number scores: no per-value rounding.
+    whole = all(isinstance(v, int)
+                for spec in weights.values()
+                for v in (spec["base"], spec["max_points"], *spec["weights"].values()))
+    plain = (lambda v: v) if whole else _plain
+    if np is not None and rows:
+        matrix = np.asarray(rows, dtype=np.float64)
+        columns = []
+        for name in names:
+            spec = weights[name]
+            w = np.zeros(len(FEATURE_NAMES))
+            for feature, weight in spec["weights"].items():
+                w[_FEATURE_INDEX[feature]] = weight
+            columns.append(np.clip(spec["base"] + matrix @ w, 0, spec["max_points"]))
+        stacked = np.stack(columns, axis=1)
+        per_component = (stacked.astype(np.int64) if whole else stacked).tolist()
+    else:
+        sparse = [[(_FEATURE_INDEX[f], w) for f, w in weights[name]["weights"].items() if w]
+                  for name in names]
+        per_component = [[min(max(weights[name]["base"] + sum(w * row[i] for i, w in terms), 0),
+                              weights[name]["max_points"])
+                          for name, terms in zip(names, sparse)]
+                         for row in rows]
+
+    scored = []
+    for values in per_component:
+        total = sum(values)
+        scored.append({
+            "total_score": plain(total),
+            "max_score": plain(max_score),
+            "grade": calculate_grade(total, max_score),
+            "components": dict(zip(names, map(plain, values))),
+        })
+    return scored
+
+
+FEATURE_CACHE_DIR = (Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache')
+                     / 'trousse' / 'cso-features')
+# Corpus matrices kept; the least recently used go first.
+FEATURE_CACHE_LIMIT = 16
+
+
+def prune_cache(cache_dir: Path, keep: int, pattern: str = '*.json') -> None:
+    """Delete all but the `keep` most recently used (mtime) entries in cache_dir."""
+    entries = []
+    for entry in cache_dir.glob(pattern):
+        try:
+            entries.append((entry.stat().st_mtime, entry))
+        except OSError:
+            continue  # removed by a concurrent prune
+    entries.sort(reverse=True)
+    for _, stale in entries[keep:]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def corpus_matrix(data: bytes, cache_dir: Optional[Path] = FEATURE_CACHE_DIR
+                  ) -> tuple[list[dict], list[list[int]]]:
+    """Records ({"line", "name"} or {"line", "error"}) and feature rows of a JSONL corpus.
+
+    Cached under cache_dir by the digest of the corpus and of this file, so a
+    second --weights run over the same corpus parses and matches nothing.
+    A hit refreshes the entry's mtime; past FEATURE_CACHE_LIMIT entries, the
+    least recently used are deleted. Raises UnicodeDecodeError if the corpus
+    is not UTF-8.
+    """
+    key = hashlib.blake2b(data + Path(__file__).read_bytes(), digest_size=16).hexdigest()
+    cache_file = cache_dir / f"{key}.json" if cache_dir is not None else None
+    if cache_file is not None:
+        try:
+            cached = json.loads(cache_file.read_text())
+            records, rows = cached["records"], cached["rows"]
+        except (OSError, ValueError, KeyError):
+            pass
+        else:
+            try:
+                os.utime(cache_file)
+            except OSError:
+                pass
+            return records, rows
+
+    records, rows = [], []
+    for lineno, line in enumerate(data.decode('utf-8').splitlines(), start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            records.append({"line": lineno, "error": f"Invalid JSON: {e}"})
+            continue
+        name = record.get("name") if isinstance(record, dict) else None
+        desc = record.get("description") if isinstance(record, dict) else None
+        if not isinstance(desc, str):
+            records.append({"line": lineno, "name": name,
+                            "error": "Record has no string 'description'"})
+            continue
+        records.append({"line": lineno, "name": name})
+        rows.append(feature_vector(desc))
+
+    if cache_file is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"records": records, "rows": rows},
+                                      separators=(',', ':')))
+            os.replace(tmp, cache_file)
+        except OSError:
+            pass
+        prune_cache(cache_dir, FEATURE_CACHE_LIMIT)
+    return records, rows
+
+
 def load_description_from_skill(skill_path: Path) -> Optional[str]:
     """Load description from a skill's SKILL.md."""
     skill_md = skill_path / 'SKILL.md'
     if not skill_md.exists():
         return None
 
-    content = skill_md.read_text()
-    if not content.startswith('---'):
+    # Imported here, not at the top: lint_skill (and the YAML it pulls in) is
+    # only needed to read a SKILL.md, and `--text` scoring should start cold
+    # in tens of milliseconds.
+    from lint_skill import extract_frontmatter
+    frontmatter, error = extract_frontmatter(skill_md.read_text())
+    if error:
         return None
+    return frontmatter.get('description', '')
+
+
+def score_to_dict(result: CSOScore) -> dict:
+    """JSON-ready form of a CSO score (--json, and each --corpus line)."""
+    return {
+        "description": result.description,
+        "total_score": result.total_score,
+        "max_score": result.max_score,
+        "grade": result.grade,
+        # Spelled out rather than asdict(): its recursive deep copy was most
+        # of the cost of a --corpus line.
+        "components": [{"name": c.name, "score": c.score, "max_points": c.max_points,
+                        "details": c.details, "suggestions": list(c.suggestions)}
+                       for c in result.components],
+        "suggestions": result.overall_suggestions
+    }
 
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not match:
-        return None
 
-    try:
-        frontmatter = yaml.safe_load(match.group(1))
-        return frontmatter.get('description', '')
-    except yaml.YAMLError:
-        return None
+# Records per task handed to a --corpus worker: one description scores in
+# tens of microseconds, so a task per record would be all pickling.
+CORPUS_BATCH = 256
+
+
+def _score_batch(batch: list[tuple[int, str | bytes]]) -> list[dict]:
+    """Score (line number, JSONL line) pairs; top-level so a pool can pickle it."""
+    scored = []
+    for lineno, line in batch:
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            scored.append({"line": lineno, "error": f"Invalid JSON: {e}"})
+            continue
+        except UnicodeDecodeError as e:
+            scored.append({"line": lineno, "error": f"Invalid UTF-8: {e}"})
+            continue
+        name = record.get("name") if isinstance(record, dict) else None
+        desc = record.get("description") if isinstance(record, dict) else None
+        if not isinstance(desc, str):
+            scored.append({"line": lineno, "name": name,
+                           "error": "Record has no string 'description'"})
+            continue
+        scored.append({"line": lineno, "name": name, **score_to_dict(score_description(desc))})
+    return scored
+
+
+def iter_score_corpus(lines: Iterable[str | bytes], workers: int = 1,
+                      batch_size: int = CORPUS_BATCH) -> Iterator[dict]:
+    """Score a JSONL stream of {name, description} records, in input order.
+
+    Reads ahead at most two batches per worker, so memory stays flat however
+    long the stream is. Blank lines are skipped; a malformed record (bad
+    JSON, or as bytes, bad UTF-8) yields an {"line", "error"} entry in its place.
+    """
+    numbered = ((n, line) for n, line in enumerate(lines, start=1) if line.strip())
+    batches = iter(lambda: list(islice(numbered, batch_size)), [])
+    if workers <= 1:
+        for batch in batches:
+            yield from _score_batch(batch)
+        return
+
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for batch in batches:
+            pending.append(pool.submit(_score_batch, batch))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
 
 
 def format_score(result: CSOScore, format_type: str = "text") -> str:
     """Format CSO score for output."""
     if format_type == "json":
-        return json.dumps({
-            "description": result.description,
-            "total_score": result.total_score,
-            "max_score": result.max_score,
-            "grade": result.grade,
-            "components": [asdict(c) for c in result.components],
-            "suggestions": result.overall_suggestions
-        }, indent=2)
+        return json.dumps(score_to_dict(result), indent=2)
 
     # Text format
     lines = [
@@ -502,6 +963,62 @@ def format_score(result: CSOScore, format_type: str = "text") -> str:
     return "\n".join(lines)
 
 
+def score_corpus(source: str, workers: int = 1, timing: bool = False,
+                 marks: Optional[list] = None) -> int:
+    """Stream --corpus results to stdout; the exit status for the run."""
+    summary = {"records": 0, "errors": 0, "grades": dict.fromkeys("ABCDF", 0)}
+    try:
+        # Bytes, decoded per record: one bad byte costs its line, not the run.
+        stream = sys.stdin.buffer if source == '-' else open(source, 'rb')
+    except OSError as e:
+        print(f"Error: Cannot read corpus: {e}")
+        return 1
+    with stream:
+        for scored in iter_score_corpus(stream, workers):
+            print(json.dumps(scored, separators=(',', ':')))
+            summary["records"] += 1
+            if "error" in scored:
+                summary["errors"] += 1
+            else:
+                summary["grades"][scored["grade"]] += 1
+    print(json.dumps({"summary": summary}, separators=(',', ':')), flush=True)
+    if timing:
+        from timing import report_timing
+        report_timing((marks or []) + [("work+output", time.perf_counter())])
+    failing = summary["errors"] + summary["grades"]["D"] + summary["grades"]["F"]
+    return 0 if failing == 0 else 1
+
+
+def rescore_corpus(source: str, weights: dict, cache_dir: Optional[Path] = FEATURE_CACHE_DIR,
+                   timing: bool = False, marks: Optional[list] = None) -> int:
+    """--corpus with --weights: NDJSON scores from the cached feature matrix."""
+    try:
+        if source == '-':
+            data = sys.stdin.buffer.read()
+        else:
+            data = Path(source).read_bytes()
+    except OSError as e:
+        print(f"Error: Cannot read corpus: {e}")
+        return 1
+    records, rows = corpus_matrix(data, cache_dir)
+    scores = iter(score_vectors(rows, weights))
+    summary = {"records": 0, "errors": 0, "grades": dict.fromkeys("ABCDF", 0)}
+    for record in records:
+        summary["records"] += 1
+        if "error" in record:
+            summary["errors"] += 1
+        else:
+            record = {**record, **next(scores)}
+            summary["grades"][record["grade"]] += 1
+        print(json.dumps(record, separators=(',', ':')))
+    print(json.dumps({"summary": summary}, separators=(',', ':')), flush=True)
+    if timing:
+        from timing import report_timing
+        report_timing((marks or []) + [("work+output", time.perf_counter())])
+    failing = summary["errors"] + summary["grades"]["D"] + summary["grades"]["F"]
+    return 0 if failing == 0 else 1
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Score skill descriptions for CSO (Claude Search Optimization)"
@@ -509,7 +1026,38 @@ def main():
     parser.add_argument("skill_path", type=Path, nargs="?", help="Path to skill directory")
     parser.add_argument("--text", type=str, help="Score raw description text")
     parser.add_argument("--json", action="store_true", help="Output as JSON")
+    parser.add_argument("--corpus", metavar="FILE",
+                        help="Score a JSONL stream of {name, description} records "
+                             "('-' for stdin), printing one NDJSON line each, then a summary")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Worker processes for --corpus (default: 1, in-process)")
+    parser.add_argument("--weights", type=Path, metavar="FILE",
+                        help="With --corpus: score from the cached feature matrix under "
+                             "these JSON weight overrides (totals and grades per component)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help=f"With --weights: rebuild the feature matrix, skipping "
+                             f"{FEATURE_CACHE_DIR}")
+    parser.add_argument("--timing", action="store_true",
+                        help="Print a startup/imports/work/output breakdown to stderr")
     args = parser.parse_args()
+    marks = [("start", _T0), ("imports", _T_IMPORTED), ("args", time.perf_counter())]
+
+    if args.weights:
+        if not args.corpus:
+            parser.error("--weights needs --corpus")
+        try:
+            weights = load_weights(args.weights)
+        except (OSError, ValueError) as e:
+            parser.error(f"--weights: {e}")
+        try:
+            status = rescore_corpus(args.corpus, weights,
+                                    None if args.no_cache else FEATURE_CACHE_DIR, args.timing, marks)
+        except UnicodeDecodeError as e:
+            parser.error(f"--corpus: not UTF-8 (byte {e.start}: {e.reason})")
+        sys.exit(status)
+
+    if args.corpus:
+        sys.exit(score_corpus(args.corpus, args.workers, args.timing, marks))
 
     if args.text:
         desc = args.text
@@ -528,9 +1076,14 @@ def main():
         sys.exit(1)
 
     result = score_description(desc)
+    marks.append(("work", time.perf_counter()))
 
     format_type = "json" if args.json else "text"
     print(format_score(result, format_type))
+    marks.append(("output", time.perf_counter()))
+    if args.timing:
+        from timing import report_timing
+        report_timing(marks)
 
     # Exit with non-zero if failing grade
     sys.exit(0 if result.grade in ('A', 'B', 'C') else 1)
@@ -0,0 +1,285 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = ["pyyaml"]
+# ///
+"""
+Skill Language Server - lint and CSO diagnostics for SKILL.md, inline.
+
+Speaks the Language Server Protocol (JSON-RPC 2.0 with Content-Length
+framing) over stdio. On didOpen and didChange it lints the editor's buffer,
+not the file on disk, and publishes every failed Check — plus the CSO score
+of the description — as a diagnostic on the line it concerns. One process
+serves the whole editing session: each skill directory is walked once on
+open and again on save, and a keystroke re-runs only the checks that read
+SKILL.md's text.
+
+Usage (point the editor's LSP client at it, for markdown files):
+    skill_lsp.py    # stdio, full-document sync
+"""
+
+import bisect
+import json
+import re
+import sys
+from pathlib import Path
+from typing import BinaryIO, Optional
+from urllib.parse import unquote, urlparse
+
+from lint_skill import Check, SkillDocument, SkillWatcher, walk_skill_stats
+from score_description import score_description
+
+# LSP DiagnosticSeverity
+SEVERITY = {"error": 1, "warning": 2, "info": 3}
+HINT = 4
+
+FRONTMATTER_KEY_RE = re.compile(r'^([A-Za-z][\w-]*):')
+
+
+def read_message(stream: BinaryIO) -> Optional[dict]:
+    """One JSON-RPC message from a Content-Length framed stream; None at EOF.
+
+    Raises ValueError for an unusable header or body, after consuming the
+    whole header block, so the caller can report it and read on.
+    """
+    length = None
+    bad_length = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.partition(b':')
+        if name.strip().lower() == b'content-length':
+            try:
+                length = int(value)
+            except ValueError:
+                bad_length = value
+    if bad_length is not None:
+        raise ValueError(f"Bad Content-Length: {bad_length!r}")
+    if length is None:
+        raise ValueError("Missing Content-Length")
+    return json.loads(stream.read(length))
+
+
+def write_message(stream: BinaryIO, payload: dict) -> None:
+    body = json.dumps(payload).encode('utf-8')
+    stream.write(f"Content-Length: {len(body)}\r\n\r\n".encode('ascii') + body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> Optional[Path]:
+    parsed = urlparse(uri)
+    return Path(unquote(parsed.path)) if parsed.scheme == 'file' else None
+
+
+def frontmatter_spans(doc: SkillDocument) -> dict[str, tuple[int, int]]:
+    """Top-level frontmatter key -> (first line, last line) of its value."""
+    if not doc.lines or doc.lines[0] != '---':
+        return {}
+    spans = {}
+    key = None
+    for i, line in enumerate(doc.lines[1:], start=1):
+        if line == '---':
+            break
+        match = FRONTMATTER_KEY_RE.match(line)
+        if match:
+            key = match.group(1)
+            spans[key] = (i, i)
+        elif key is not None and line.strip():
+            spans[key] = (spans[key][0], i)  # folded / indented continuation
+    return spans
+
+
+def _utf16(text: str) -> int:
+    """Length in UTF-16 code units — LSP's default column unit."""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def line_range(doc: SkillDocument, first: int, last: Optional[int] = None) -> dict:
+    last = first if last is None else last
+    end_text = doc.lines[last] if last < len(doc.lines) else ''
+    return {"start": {"line": first, "character": 0},
+            "end": {"line": last, "character": _utf16(end_text)}}
+
+
+def offset_range(doc: SkillDocument, start: int, end: int) -> dict:
+    """Range of content[start:end], located through doc.line_offsets."""
+    def position(offset):
+        line = bisect.bisect_right(doc.line_offsets, offset) - 1
+        column = doc.content[doc.line_offsets[line]:offset]
+        return {"line": line, "character": _utf16(column)}
+    return {"start": position(start), "end": position(end)}
+
+
+def body_start_line(doc: SkillDocument) -> int:
+    """First line after the frontmatter block (0 if there is none)."""
+    return doc.content[:len(doc.content) - len(doc.body)].count('\n')
+
+
+def is_prose(doc: SkillDocument, offset: int) -> bool:
+    """True if offset is in text the register checks read: no fence, no heading."""
+    fence = bisect.bisect_right(doc.fences, (offset, float('inf'))) - 1
+    if fence >= 0 and offset < doc.fences[fence][1]:
+        return False
+    line = bisect.bisect_right(doc.line_offsets, offset) - 1
+    return not doc.lines[line].startswith('#')
+
+
+def locate(doc: SkillDocument, check: Check, spans: dict[str, tuple[int, int]]) -> dict:
+    """The range a check is about; document-level checks sit on line 0."""
+    name = check.name
+    for key in ("name", "description"):
+        if name.startswith(key) and key in spans:
+            return line_range(doc, *spans[key])
+    if name == "line_count":
+        return line_range(doc, max(0, len(doc.lines) - 1))
+    if name == "register_opening":
+        start = body_start_line(doc)
+        first = next((i for i in range(start, len(doc.lines)) if doc.lines[i].strip()), start)
+        return line_range(doc, min(first, len(doc.lines) - 1))
+    if name == "register_caps" and ': ' in check.message:
+        word = check.message.split(': ', 1)[1].split(',')[0].strip()
+        body_offset = len(doc.content) - len(doc.body)
+        for match in re.compile(rf'\b{re.escape(word)}\b').finditer(doc.content, body_offset):
+            if is_prose(doc, match.start()):
+                return offset_range(doc, match.start(), match.end())
+    if name in ("link_broken", "path_missing") and check.message.startswith("SKILL.md: '"):
+        raw = check.message.split("'", 2)[1]
+        start = doc.content.find(raw, len(doc.content) - len(doc.body))
+        if start >= 0:
+            return offset_range(doc, start, start + len(raw))
+    return line_range(doc, 0)
+
+
+def diagnostics(doc: SkillDocument, checks: list[Check]) -> list[dict]:
+    """LSP diagnostics for the failed checks and the description's CSO score."""
+    spans = frontmatter_spans(doc)
+    found = []
+    for check in checks:
+        if check.passed:
+            continue
+        message = check.message + (f"\n-> {check.suggestion}" if check.suggestion else "")
+        found.append({"range": locate(doc, check, spans), "severity": SEVERITY[check.severity],
+                      "source": "lint_skill", "code": check.name, "message": message})
+
+    desc = (doc.frontmatter or {}).get('description')
+    if isinstance(desc, str) and desc.strip() and 'description' in spans:
+        cso = score_description(desc.strip())
+        where = line_range(doc, *spans['description'])
+        found.append({"range": where,
+                      "severity": SEVERITY["info" if cso.grade in ('A', 'B', 'C') else "warning"],
+                      "source": "cso", "code": "cso_score",
+                      "message": f"CSO score {cso.total_score}/{cso.max_score} (grade {cso.grade})"})
+        for component in cso.components:
+            for suggestion in component.suggestions:
+                found.append({"range": where, "severity": HINT, "source": "cso",
+                              "code": component.name, "message": suggestion})
+    return found
+
+
+class SkillLanguageServer:
+    """Per-document lint state and the handful of LSP methods it answers."""
+
+    def __init__(self):
+        self.watchers: dict[str, SkillWatcher] = {}  # uri -> watcher
+        self.shutdown_requested = False
+
+    def handle(self, message: dict) -> list[dict]:
+        """Messages to send in reply to one incoming message."""
+        method = message.get("method")
+        params = message.get("params") or {}
+        msg_id = message.get("id")
+
+        if method == "initialize":
+            return [{"jsonrpc": "2.0", "id": msg_id, "result": {
+                "capabilities": {"textDocumentSync": {"openClose": True, "change": 1,
+                                                      "save": {"includeText": False}}},
+                "serverInfo": {"name": "skill-lsp"},
+            }}]
+        if method == "shutdown":
+            self.shutdown_requested = True
+            return [{"jsonrpc": "2.0", "id": msg_id, "result": None}]
+        if method == "textDocument/didOpen":
+            item = params["textDocument"]
+            return self.publish(item["uri"], item["text"], rescan=True)
+        if method == "textDocument/didChange":
+            changes = params.get("contentChanges") or []
+            if changes:  # full sync: the last change carries the whole text
+                return self.publish(params["textDocument"]["uri"], changes[-1]["text"])
+            return []
+        if method == "textDocument/didSave":
+            uri = params["textDocument"]["uri"]
+            watcher = self.watchers.get(uri)
+            if watcher and watcher.doc is not None:
+                return self.publish(uri, watcher.doc.content, rescan=True)
+            return []
+        if method == "textDocument/didClose":
+            uri = params["textDocument"]["uri"]
+            if self.watchers.pop(uri, None) is None:
+                return []
+            return [self.notification(uri, [])]
+        if msg_id is not None and method is not None:
+            return [{"jsonrpc": "2.0", "id": msg_id,
+                     "error": {"code": -32601, "message": f"Method not found: {method}"}}]
+        return []  # initialized, $/ notifications, and anything else unasked for
+
+    def publish(self, uri: str, text: str, rescan: bool = False) -> list[dict]:
+        """Lint text as the SKILL.md at uri and return its diagnostics."""
+        path = uri_to_path(uri)
+        if path is None or path.name != 'SKILL.md':
+            return []
+        watcher = self.watchers.get(uri)
+        if watcher is None:
+            watcher = self.watchers[uri] = SkillWatcher(path.parent)
+            rescan = True
+        if rescan:
+            stats = walk_skill_stats(path.parent)
+            result = watcher.relint(stats, None, content=text)
+        else:
+            result = watcher.relint(watcher.stats, {'SKILL.md'}, content=text)
+        return [self.notification(uri, diagnostics(watcher.doc, result.checks))]
+
+    @staticmethod
+    def notification(uri: str, found: list[dict]) -> dict:
+        return {"jsonrpc": "2.0", "method": "textDocument/publishDiagnostics",
+                "params": {"uri": uri, "diagnostics": found}}
+
+
+def main():
+    stdin, stdout = sys.stdin.buffer, sys.stdout.buffer
+    server = SkillLanguageServer()
+    while True:
+        try:
+            message = read_message(stdin)
+        except ValueError as e:  # bad header or JSON body; the stream reads on
+            print(f"skill-lsp: unreadable message: {e!r}", file=sys.stderr)
+            write_message(stdout, {"jsonrpc": "2.0", "id": None,
+                                   "error": {"code": -32700, "message": str(e)}})
+            continue
+        if message is None:
+            break
+        if not isinstance(message, dict):
+            print(f"skill-lsp: not a JSON-RPC object: {message!r:.80}", file=sys.stderr)
+            write_message(stdout, {"jsonrpc": "2.0", "id": None,
+                                   "error": {"code": -32600, "message": "Invalid Request"}})
+            continue
+        if message.get("method") == "exit":
+            break
+        try:
+            replies = server.handle(message)
+        except Exception as e:  # one bad message must not end the session
+            print(f"skill-lsp: {message.get('method')}: {e!r}", file=sys.stderr)
+            replies = []
+            if message.get("id") is not None:
+                replies = [{"jsonrpc": "2.0", "id": message["id"],
+                            "error": {"code": -32603, "message": str(e)}}]
+        for reply in replies:
+            write_message(stdout, reply)
+    sys.exit(0 if server.shutdown_requested else 1)
+
+
+if __name__ == "__main__":
+    main()
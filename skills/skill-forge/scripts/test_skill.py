@@ -20,6 +20,9 @@ Usage:
     test_skill.py <skill-path> --scenario <name>  # Run specific scenario
 """
 
+import time
+_T0 = time.perf_counter()  # --timing: first line of the script proper
+
 import argparse
 import json
 import re
@@ -28,7 +31,9 @@ from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Optional
 
-import yaml
+from lint_skill import FRONTMATTER_RE, extract_frontmatter, report_timing
+
+_T_IMPORTED = time.perf_counter()
 
 
 @dataclass
@@ -60,19 +65,16 @@ def extract_skill_info(skill_path: Path) -> tuple[str, str, str]:
 
     content = skill_md.read_text()
 
-    # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---\n(.*)$', content, re.DOTALL)
-    if not match:
+    # Extract frontmatter (parsed once per process, shared with lint_skill)
+    match = FRONTMATTER_RE.match(content)
+    frontmatter, error = extract_frontmatter(content)
+    if not match or error:
         return "", "", content
 
-    try:
-        frontmatter = yaml.safe_load(match.group(1))
-        name = frontmatter.get('name', '')
-        description = frontmatter.get('description', '')
-        body = match.group(2)
-        return name, description, body
-    except yaml.YAMLError:
-        return "", "", content
+    name = frontmatter.get('name', '')
+    description = frontmatter.get('description', '')
+    body = content[match.end():].removeprefix('\n')
+    return name, description, body
 
 
 def extract_trigger_phrases(description: str) -> list[str]:
@@ -396,7 +398,10 @@ def main():
     parser.add_argument("--save", action="store_true", help="Save scenarios to test-scenarios/")
     parser.add_argument("--run", action="store_true", help="Print Task prompts for running tests")
     parser.add_argument("--scenario", type=str, help="Generate prompt for specific scenario")
+    parser.add_argument("--timing", action="store_true",
+                        help="Print a startup/imports/work/output breakdown to stderr")
     args = parser.parse_args()
+    marks = [("start", _T0), ("imports", _T_IMPORTED), ("args", time.perf_counter())]
 
     skill_path = args.skill_path.expanduser().resolve()
 
@@ -409,13 +414,12 @@ def main():
     except ValueError as e:
         print(f"Error: {e}")
         sys.exit(1)
+    marks.append(("work", time.perf_counter()))
 
     if args.save:
         output_dir = skill_path / 'test-scenarios'
         save_test_scenarios(suite, output_dir)
-        return
-
-    if args.run or args.scenario:
+    elif args.run or args.scenario:
         # Generate Task prompts
         if args.scenario:
             scenarios = [s for s in suite.scenarios if s.name == args.scenario]
@@ -435,11 +439,13 @@ def main():
             print("\n" + "-"*60)
 
         print("\n\nCopy the prompts above to use with Task(subagent_type='explore-opus')")
-        return
+    else:
+        # Default: print test suite
+        format_type = "json" if args.json else "text"
+        print(format_test_suite(suite, format_type))
 
-    # Default: print test suite
-    format_type = "json" if args.json else "text"
-    print(format_test_suite(suite, format_type))
+    if args.timing:
+        report_timing(marks + [("output", time.perf_counter())])
 
 
 if __name__ == "__main__":
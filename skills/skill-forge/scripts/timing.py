@@ -0,0 +1,72 @@
+#!/usr/bin/env -S uv run --script
+# /// script
+# requires-python = ">=3.11"
+# dependencies = []
+# ///
+"""
+--timing support shared by the skill-forge scripts.
+
+Standard library only, so dependency-free scripts such as scan.py can import
+it alongside the ones that need PyYAML.
+
+Usage (from a script in this directory):
+    import time
+    _T0 = time.perf_counter()  # first line of the script proper
+    ...
+    from timing import report_timing
+    report_timing([("start", _T0), ("imports", t1), ("work", t2)])
+"""
+
+import os
+import sys
+import time
+from typing import Optional
+
+
+def _process_start_age() -> Optional[float]:
+    """Seconds since this process started, or None if the OS won't say.
+
+    Linux reads the start time from /proc (one clock tick, usually 10ms,
+    of resolution). Elsewhere psutil is used when it is installed; without
+    it there is no portable source and the answer is None.
+    """
+    try:
+        with open('/proc/self/stat') as f:
+            start_ticks = int(f.read().rsplit(')', 1)[1].split()[19])
+        started = start_ticks / os.sysconf('SC_CLK_TCK')
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - started
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import psutil
+        return time.time() - psutil.Process().create_time()
+    except Exception:  # ImportError, or psutil refusing (AccessDenied etc.)
+        return None
+
+
+def process_startup_ms(t0: float) -> Optional[float]:
+    """Milliseconds from process start to perf_counter() reading t0.
+
+    Covers interpreter boot and site imports but not uv resolving the
+    script's environment beforehand — that happens in uv's own process.
+    None where the process start time is unavailable (see _process_start_age).
+    """
+    age = _process_start_age()
+    if age is None:
+        return None
+    return max(0.0, (age - (time.perf_counter() - t0)) * 1000)
+
+
+def report_timing(marks: list[tuple[str, float]], file=sys.stderr) -> None:
+    """Print a --timing breakdown: startup, then the gap before each mark.
+
+    marks starts with ("start", t0) — t0 taken on the script's first line —
+    and each later (phase, perf_counter()) closes the phase named. Startup
+    prints as "n/a" off Linux unless psutil is installed.
+    """
+    startup = process_startup_ms(marks[0][1])
+    parts = [f"startup {'n/a' if startup is None else f'~{startup:.0f}ms'}"]
+    for (_, prev), (phase, t) in zip(marks, marks[1:]):
+        parts.append(f"{phase} {(t - prev) * 1000:.1f}ms")
+    parts.append(f"(in-script {(marks[-1][1] - marks[0][1]) * 1000:.1f}ms)")
+    print("timing: " + "  ".join(parts), file=file)
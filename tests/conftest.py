@@ -12,7 +12,7 @@ REPO_ROOT = Path(__file__).parent.parent
 LINTER_PATH = REPO_ROOT / "skills" / "skill-forge" / "scripts"
 sys.path.insert(0, str(LINTER_PATH))
 
-from lint_skill import lint_skill, LintResult
+from lint_skill import lint_skill_cached, LintResult
 
 
 def discover_skills() -> list[Path]:
@@ -40,7 +40,17 @@ def pytest_generate_tests(metafunc):
         )
 
 
+@pytest.fixture(scope="session")
+def lint_cache_dir(tmp_path_factory) -> Path:
+    """One result cache for the whole session, independent of cacheprovider."""
+    return tmp_path_factory.mktemp("lint-skill")
+
+
 @pytest.fixture
-def lint_result(skill_path: Path) -> LintResult:
-    """Run the linter on a skill and return the result."""
-    return lint_skill(skill_path, follow_aliases=True)
+def lint_result(skill_path: Path, lint_cache_dir: Path) -> LintResult:
+    """Lint a skill, drawing on the content-addressed result cache.
+
+    The cache is shared across the session, so every test after the first
+    that touches an unchanged skill gets its result back without re-linting.
+    """
+    return lint_skill_cached(skill_path, follow_aliases=True, cache_dir=lint_cache_dir)
@@ -0,0 +1,121 @@
+"""Tests for the catalog conflict report (skills/skill-forge/scripts/discovery_conflicts.py).
+
+Catalogs are written to tmp dirs, and the CLI runs with HOME pointed there,
+so the machine's own ~/.claude/skills and plugin cache never join in.
+"""
+
+import json
+import math
+import os
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+from conftest import LINTER_PATH
+import discovery_conflicts as conflicts
+from lint_skill import CatalogEntry, catalog_entries
+
+SCRIPT = LINTER_PATH / "discovery_conflicts.py"
+
+
+def write_skill(root: Path, name: str, triggers: list[str]) -> None:
+    skill = root / name
+    skill.mkdir(parents=True)
+    quoted = ", ".join(f"'{t}'" for t in triggers)
+    (skill / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: Validates {name} work. Triggers on {quoted}. (user)\n"
+        f"---\n\n# {name}\n")
+
+
+def test_collisions_and_near_duplicates_across_skills(tmp_path):
+    write_skill(tmp_path, "code-review", ["review this code", "run tests"])
+    write_skill(tmp_path, "titans", ["Review my code!", "what did I miss"])
+    write_skill(tmp_path, "test-runner", ["run test", "run the suite"])
+    write_skill(tmp_path, "loner", ["deploy app", "deploy apps"])  # its own variants
+    found = conflicts.find_trigger_conflicts(catalog_entries([tmp_path]))
+    assert [(c.triggers, c.skills, c.similarity) for c in found] == [
+        (["review this code", "Review my code!"], ["code-review", "titans"], 1.0),
+        (["run tests", "run test"], ["code-review", "test-runner"], 0.7),
+    ]
+
+
+def test_signatures_do_not_depend_on_hash_seed():
+    probe = ("import discovery_conflicts as d; "
+             "print(d.minhash(d.shingles(d.normalize_trigger('review this code'))))")
+    outputs = {
+        subprocess.run([sys.executable, "-c", probe], cwd=LINTER_PATH, capture_output=True,
+                       text=True, env={**os.environ, "PYTHONHASHSEED": seed}).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
+    assert outputs.pop().strip() == str(
+        conflicts.minhash(conflicts.shingles("review code")))
+
+
+def test_cli_json_and_exit_code(tmp_path):
+    skills = tmp_path / "skills"
+    write_skill(skills, "one", ["check skill"])
+    write_skill(skills, "two", ["lint skill"])
+
+    def run():
+        return subprocess.run([sys.executable, str(SCRIPT), str(skills), "--json"],
+                              capture_output=True, text=True,
+                              env={**os.environ, "HOME": str(tmp_path),
+                                   "XDG_CACHE_HOME": str(tmp_path / "cache")})
+
+    r = run()
+    assert r.returncode == 0 and json.loads(r.stdout) == {
+        "skills": 2, "trigger_conflicts": [], "description_neighbours": {}}
+    write_skill(skills, "three", ["Check skill."])
+    r = run()
+    assert r.returncode == 1
+    assert json.loads(r.stdout)["trigger_conflicts"][0]["skills"] == ["one", "three"]
+
+
+def test_description_neighbours_match_dense_cosine():
+    random.seed(7)
+    vocab = [f"term{i}" for i in range(40)]
+    entries = [CatalogEntry(f"s{i}", Path(f"s{i}"), Path("."), 0,
+                            " ".join(random.choices(vocab, k=12))) for i in range(60)]
+    vectors = conflicts.tfidf_vectors([e.description for e in entries])
+    for vector in vectors:
+        assert math.isclose(sum(w * w for w in vector.values()), 1.0)
+
+    found = conflicts.description_neighbours(entries, threshold=0.3, top=3)
+    assert found
+    for i, entry in enumerate(entries):
+        dense = sorted(((sum(w * vectors[j].get(t, 0.0) for t, w in vectors[i].items()), j)
+                        for j in range(len(entries)) if j != i), key=lambda p: (-p[0], p[1]))
+        expected = [(entries[j].name, round(s, 3)) for s, j in dense[:3] if s >= 0.3]
+        assert found.get(entry.name, []) == expected
+
+
+def test_overlapping_descriptions_are_reported_and_cached(tmp_path):
+    skills = tmp_path / "skills"
+    for name in ("pdf-tables", "pdf-extract"):
+        (skills / name).mkdir(parents=True)
+        (skills / name / "SKILL.md").write_text(
+            f"---\nname: {name}\ndescription: Extracts tables and text from scanned PDF "
+            f"invoices into spreadsheets. Triggers on '{name}'. (user)\n---\n\n# {name}\n")
+    write_skill(skills, "deploy", ["ship it"])
+    cache = tmp_path / "cache"
+    entries = catalog_entries([skills])
+
+    found = conflicts.cached_description_neighbours(entries, cache_dir=cache)
+    assert found == {"pdf-extract": [("pdf-tables", 0.905)],
+                     "pdf-tables": [("pdf-extract", 0.905)]}
+    assert len(list(cache.iterdir())) == 1
+    (next(cache.iterdir())).write_text('{"pdf-tables": [["cached", 1.0]]}')
+    assert conflicts.cached_description_neighbours(entries, cache_dir=cache) == {
+        "pdf-tables": [("cached", 1.0)]}
+    assert conflicts.cached_description_neighbours(entries, 0.95, cache_dir=cache) == {}
+
+
+def test_neighbour_cache_keeps_the_most_recent(tmp_path, monkeypatch):
+    monkeypatch.setattr(conflicts, "NEIGHBOUR_CACHE_LIMIT", 2)
+    write_skill(tmp_path / "skills", "one", ["check skill"])
+    entries = catalog_entries([tmp_path / "skills"])
+    for threshold in (0.1, 0.2, 0.3, 0.4):
+        conflicts.cached_description_neighbours(entries, threshold, cache_dir=tmp_path / "cache")
+    assert len(list((tmp_path / "cache").iterdir())) == 2
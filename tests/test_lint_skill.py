@@ -0,0 +1,565 @@
+"""Tests for the skill linter's own machinery (skills/skill-forge/scripts/lint_skill.py).
+
+test_skills.py runs the linter over every skill in this repo; the tests here
+pin down the batch and plumbing behaviour around it, on tmp-dir fixtures
+where the expected answer is known.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from conftest import LINTER_PATH, REPO_ROOT
+import lint_skill as linter
+from lint_skill import SkillDocument, analyze_register, discover_skills, lint_all, lint_skill
+
+LINT = LINTER_PATH / "lint_skill.py"
+
+
+def make_skill(root: Path, name: str, description: str = None, body: str = "") -> Path:
+    """Write a minimal skill directory and return its path."""
+    skill = root / name
+    skill.mkdir(parents=True)
+    description = description or (
+        f"Validates {name} fixtures before any release. Triggers on "
+        f"'check {name}', 'lint {name}'. (user)"
+    )
+    (skill / "SKILL.md").write_text(
+        f"---\nname: {name}\ndescription: {description}\n---\n\n# {name}\n\n"
+        "## When to Use\n\nUse it.\n\n## When Not to Use\n\nSkip it.\n\n"
+        "## Anti-Patterns\n\n| Pattern | Problem | Fix |\n" + body
+    )
+    return skill
+
+
+class TestBatchLint:
+    def test_lint_all_matches_single_skill_runs(self):
+        root = REPO_ROOT / "skills"
+        batch = lint_all(root)
+        assert [r.skill_path for r in batch] == [
+            lint_skill(s).skill_path for s in discover_skills(root)
+        ]
+        assert [r.score for r in batch] == [lint_skill(s).score for s in discover_skills(root)]
+
+    def test_worker_pool_gives_same_results(self):
+        root = REPO_ROOT / "skills"
+        serial = lint_all(root)
+        pooled = lint_all(root, workers=2)
+        assert [(r.skill_name, r.score, r.errors) for r in serial] == \
+               [(r.skill_name, r.score, r.errors) for r in pooled]
+
+    def test_cli_aggregate_report_and_exit_code(self, tmp_path):
+        make_skill(tmp_path, "good-checker")
+        bad = make_skill(tmp_path, "bad-checker")
+        (bad / "SKILL.md").write_text("no frontmatter at all\n")
+        r = subprocess.run([sys.executable, str(LINT), "--all", str(tmp_path), "--json"],
+                           capture_output=True, text=True,
+                           env={**os.environ, "XDG_CACHE_HOME": str(tmp_path / "cache")})
+        assert r.returncode == 1
+        report = json.loads(r.stdout)
+        assert report["summary"] == {
+            "skills": 2, "passed": 1, "failed": 1,
+            "errors": report["summary"]["errors"], "warnings": report["summary"]["warnings"],
+        }
+        assert [s["skill_name"] for s in report["skills"]] == ["bad-checker", "good-checker"]
+        assert list((tmp_path / "cache" / "trousse" / "lint-skill").rglob("*.json"))
+
+    def test_cli_ndjson_streams_one_line_per_skill_then_summary(self, tmp_path):
+        for name in ("one-checker", "two-checker", "three-checker"):
+            make_skill(tmp_path, name)
+        r = subprocess.run([sys.executable, str(LINT), "--all", str(tmp_path),
+                            "--format", "ndjson", "--workers", "2", "--no-cache"],
+                           capture_output=True, text=True)
+        lines = [json.loads(line) for line in r.stdout.splitlines()]
+        assert len(lines) == 4 and r.returncode == 0
+        assert sorted(line["skill_name"] for line in lines[:3]) == \
+            ["one-checker", "three-checker", "two-checker"]
+        assert lines[3]["summary"]["skills"] == 3 and lines[3]["summary"]["failed"] == 0
+        assert lines[3]["root"] == str(tmp_path.resolve())
+
+    def test_cli_ndjson_single_skill_has_the_same_summary_line(self, tmp_path):
+        skill = make_skill(tmp_path, "one-checker")
+        r = subprocess.run([sys.executable, str(LINT), str(skill), "--format", "ndjson",
+                            "--no-cache"], capture_output=True, text=True)
+        lines = [json.loads(line) for line in r.stdout.splitlines()]
+        assert len(lines) == 2 and lines[0]["skill_name"] == "one-checker"
+        assert set(lines[1]) == {"root", "summary"}
+        assert lines[1]["root"] == str(tmp_path.resolve())
+        assert lines[1]["summary"]["skills"] == 1
+
+
+class TestSkillDocument:
+    def test_parse_splits_frontmatter_body_and_headings(self, tmp_path):
+        content = (
+            "---\nname: demo\ndescription: A demo.\n---\n# Demo\n\n"
+            "```markdown\n## When to Use\n```\n\n## Scope\ntext\n"
+        )
+        doc = SkillDocument.parse(tmp_path, content)
+        assert doc.frontmatter == {"name": "demo", "description": "A demo."}
+        assert doc.frontmatter_error is None
+        assert doc.body.startswith("\n# Demo")
+        assert "When to Use" not in doc.code_free_body
+        # Headings inside fenced blocks are examples, not structure
+        assert [(level, text) for _, level, text in doc.headings] == [(1, "Demo"), (2, "Scope")]
+        assert all(content[off:].startswith(line)
+                   for off, line in zip(doc.line_offsets, doc.lines))
+
+    def test_headings_use_the_code_free_body_fence_rule(self, tmp_path):
+        content = "# Demo\n\n- step:\n  ```\n## Example\n  ```\n## Real\n"
+        doc = SkillDocument.parse(tmp_path, content)
+        assert "Example" not in doc.code_free_body
+        assert [text for _, _, text in doc.headings] == ["Demo", "Real"]
+
+    def test_empty_references_dir_still_counts(self, tmp_path):
+        skill = tmp_path / "demo-checker"
+        skill.mkdir()
+        (skill / "SKILL.md").write_text("---\nname: demo-checker\n---\n\n# Demo\n")
+        before = linter.skill_cache_key(skill)
+        (skill / "references").mkdir()
+        doc = SkillDocument.parse(skill, (skill / "SKILL.md").read_text())
+        assert doc.has_dir("references")
+        anti = next(c for c in linter.check_structure(doc) if c.name == "section_anti_patterns")
+        assert anti.severity == "info"
+        assert linter.skill_cache_key(skill) != before
+
+    def test_files_lists_skill_directory(self, tmp_path):
+        skill = make_skill(tmp_path, "demo-checker")
+        (skill / "references").mkdir()
+        (skill / "references" / "guide.md").write_text("guide\n")
+        doc = SkillDocument.parse(skill, (skill / "SKILL.md").read_text())
+        assert doc.files == ["SKILL.md", "references/guide.md"]
+        assert doc.has_dir("references") and not doc.has_dir("scripts")
+
+    def test_one_walk_records_modes_and_prunes_junk(self, tmp_path):
+        skill = make_skill(tmp_path, "demo-checker")
+        (skill / "scripts" / "__pycache__").mkdir(parents=True)
+        (skill / "scripts" / "__pycache__" / "run.cpython-311.pyc").write_bytes(b"")
+        (skill / "scripts" / "run.py").write_text("#!/usr/bin/env python3\n")
+        os.chmod(skill / "scripts" / "run.py", 0o644)
+        doc = SkillDocument.parse(skill, (skill / "SKILL.md").read_text())
+        assert doc.files == ["SKILL.md", "scripts/run.py"]
+        assert not doc.tree["scripts/run.py"] & 0o111
+        assert [c.name for c in linter.check_resources(doc)] == ["script_executable"]
+
+    def test_walk_stats_only_files_checks_read(self, tmp_path):
+        skill = make_skill(tmp_path, "demo-checker")
+        for rel in ("assets/logo.png", "assets/example_asset.txt", "scripts/run.py"):
+            (skill / rel).parent.mkdir(exist_ok=True)
+            (skill / rel).write_text("x\n")
+        stats = linter.walk_skill_stats(skill)
+        assert stats["assets/logo.png"] is None
+        assert all(stats[rel] is not None for rel in
+                   ("SKILL.md", "assets/example_asset.txt", "scripts/run.py"))
+        assert linter.walk_skill_files(skill)["assets/logo.png"] == 0
+
+        watcher = linter.SkillWatcher(skill)
+        watcher.relint(stats)
+        (skill / "assets" / "icon.svg").write_text("<svg/>\n")
+        assert watcher.changed_since(linter.walk_skill_stats(skill)) == {"assets/icon.svg"}
+
+    def test_template_check_reads_only_the_head(self, tmp_path):
+        skill = make_skill(tmp_path, "demo-checker")
+        (skill / "assets").mkdir()
+        (skill / "assets" / "example_asset.txt").write_text(
+            "x" * linter.TEMPLATE_READ_LIMIT + "TODO\n")
+        (skill / "scripts").mkdir()
+        (skill / "scripts" / "example.py").write_text("# TODO: replace\n")
+        doc = SkillDocument.parse(skill, (skill / "SKILL.md").read_text())
+        flagged = [c.message for c in linter.check_resources(doc) if c.name == "template_files"]
+        assert flagged == ["Template file not customized: scripts/example.py"]
+
+
+class TestLintCache:
+    def test_hit_skips_linting(self, tmp_path, monkeypatch):
+        skill = make_skill(tmp_path / "skills", "cache-checker")
+        first = linter.lint_skill_cached(skill, cache_dir=tmp_path / "cache")
+        linter._result_memo.clear()  # force the disk layer
+
+        def boom(*args, **kwargs):
+            raise AssertionError("cache hit should not re-lint")
+        monkeypatch.setattr(linter, "lint_skill", boom)
+        second = linter.lint_skill_cached(skill, cache_dir=tmp_path / "cache")
+        assert second == first
+
+    def test_disk_cache_keeps_the_most_recent(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(linter, "CACHE_LIMIT", 2)
+        monkeypatch.setattr(linter, "_pruned_cache_dirs", set())
+        cache = tmp_path / "cache"
+        skill = make_skill(tmp_path / "skills", "cache-checker")
+        md = skill / "SKILL.md"
+        for i in range(4):
+            md.write_text(md.read_text() + f"edit {i}\n")
+            linter.lint_skill_cached(skill, cache_dir=cache)
+            linter._pruned_cache_dirs.clear()  # as if each lint were its own run
+        assert len(list(cache.glob("*/*.json"))) == 2
+
+    def test_key_covers_content_modes_and_alias_target(self, tmp_path):
+        root = tmp_path / "skills"
+        target = make_skill(root, "target-checker")
+        alias = root / "alias-checker"
+        alias.mkdir()
+        (alias / "SKILL.md").write_text(
+            "---\nname: alias-checker\ndescription: Alias for target-checker\n---\n")
+        (target / "scripts").mkdir()
+        script = target / "scripts" / "run.py"
+        script.write_text("#!/usr/bin/env python3\n")
+
+        keys = {linter.skill_cache_key(target)}
+        alias_keys = {linter.skill_cache_key(alias)}
+        os.chmod(script, 0o755)                      # mode change
+        keys.add(linter.skill_cache_key(target))
+        alias_keys.add(linter.skill_cache_key(alias))  # alias follows its target
+        (target / "SKILL.md").write_text((target / "SKILL.md").read_text() + "\nmore\n")
+        keys.add(linter.skill_cache_key(target))
+        assert len(keys) == 3
+        assert len(alias_keys) == 2
+
+
+def make_alias(root: Path, name: str, target: str) -> Path:
+    alias = root / name
+    alias.mkdir(parents=True)
+    (alias / "SKILL.md").write_text(f"---\nname: {name}\ndescription: Alias for {target}\n---\n")
+    return alias
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t.invalid", *args],
+                   cwd=repo, check=True, capture_output=True)
+
+
+class TestChangedOnly:
+    def test_changed_skills_and_their_aliases(self, tmp_path):
+        make_skill(tmp_path, "edited-checker")
+        make_skill(tmp_path, "quiet-checker")
+        make_alias(tmp_path, "alias-checker", "edited-checker")
+        make_alias(tmp_path, "double-alias-checker", "alias-checker")
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-qm", "one")
+        assert linter.changed_skills(tmp_path) == []
+
+        refs = tmp_path / "edited-checker" / "references"
+        refs.mkdir()
+        (refs / "guide.md").write_text("untracked, still counts\n")
+        assert [p.name for p in linter.changed_skills(tmp_path)] == \
+            ["alias-checker", "double-alias-checker", "edited-checker"]
+
+        r = subprocess.run([sys.executable, str(LINT), "--changed", str(tmp_path),
+                            "--format", "ndjson", "--no-cache"], capture_output=True, text=True)
+        names = [json.loads(line).get("skill_name") for line in r.stdout.splitlines()]
+        assert "quiet-checker" not in names and len(names) == 4
+
+    def test_non_ascii_paths_are_not_quoted_away(self, tmp_path):
+        make_skill(tmp_path, "edited-checker")
+        make_skill(tmp_path, "quiet-checker")
+        _git(tmp_path, "init", "-q")
+        _git(tmp_path, "add", ".")
+        _git(tmp_path, "commit", "-qm", "one")
+        refs = tmp_path / "edited-checker" / "references"
+        refs.mkdir()
+        (refs / "résumé.md").write_text("committed, then edited\n")
+        _git(tmp_path, "add", ".")
+        assert [p.name for p in linter.changed_skills(tmp_path)] == ["edited-checker"]
+        assert refs / "résumé.md" in linter.git_changed_paths(tmp_path)
+
+    def test_unknown_base_fails(self, tmp_path):
+        make_skill(tmp_path, "edited-checker")
+        _git(tmp_path, "init", "-q")
+        with pytest.raises(ValueError, match="Unknown git ref"):
+            linter.changed_skills(tmp_path, "no-such-ref")
+
+
+class TestSkillIndex:
+    def test_resolves_siblings_then_globals_then_newest_plugin(self, tmp_path):
+        cache = tmp_path / "cache"
+        for version in ("1.8.7", "1.66.0"):
+            make_skill(cache / "market" / "kit" / version / "skills", "far-checker",
+                       body=f"version {version}\n")
+        roots = linter.plugin_skill_roots(cache)
+        assert roots == [cache / "market" / "kit" / "1.66.0" / "skills"]
+
+        home = tmp_path / "home-skills"
+        make_skill(home, "near-checker")
+        local = make_skill(tmp_path / "skills", "near-checker").parent
+        index = linter.SkillIndex([home, *roots])
+        assert index.resolve("near-checker", local) == local / "near-checker"
+        assert index.resolve("far-checker", local) == roots[0] / "far-checker"
+        assert index.resolve("no-such-checker", local) is None
+
+    def test_global_roots_discovered_only_on_a_local_miss(self, tmp_path, monkeypatch):
+        calls = []
+        monkeypatch.setattr(linter, "plugin_skill_roots", lambda: calls.append(1) or [])
+        skill = make_skill(tmp_path, "plain-checker")
+        index = linter.SkillIndex()
+        lint_skill(skill, index=index)
+        assert index.resolve("plain-checker", tmp_path) == skill and calls == []
+        assert index.resolve("no-such-checker", tmp_path) is None and calls == [1]
+        index.resolve("other-checker", tmp_path)
+        assert calls == [1]
+
+    def test_alias_and_target_share_one_lint(self, tmp_path, monkeypatch):
+        root = tmp_path / "skills"
+        make_skill(root, "target-checker")
+        make_alias(root, "alias-checker", "target-checker")
+        parses = []
+        real_parse = linter.SkillDocument.parse
+        monkeypatch.setattr(linter.SkillDocument, "parse",
+                            lambda skill_dir, content: parses.append(skill_dir.name)
+                            or real_parse(skill_dir, content))
+        alias_result, target_result = lint_all(root)
+        assert parses.count("target-checker") == 1
+        assert alias_result.skill_name == "alias-checker -> target-checker"
+        assert alias_result.score == target_result.score
+
+    def test_streaming_keeps_only_alias_targets(self, tmp_path):
+        root = tmp_path / "skills"
+        for i in range(30):
+            make_skill(root, f"stream{i:02}-checker")
+        make_alias(root, "zz-alias-checker", "stream00-checker")
+        linter._result_memo.clear()
+        index = linter.SkillIndex(global_roots=[], keep_results=False)
+        for skill in discover_skills(root):
+            linter._lint_one(skill, True, tmp_path / "cache", None, index)
+        assert linter._result_memo == {}
+        assert [path.name for path, *_ in index.results] == ["stream00-checker"]
+
+    def test_loop_detected_on_resolved_paths(self, tmp_path):
+        root = tmp_path / "skills"
+        first = make_alias(root, "first-checker", "second-checker")
+        make_alias(root, "second-checker", "first-checker")
+        result = lint_skill(first, index=linter.SkillIndex([]))
+        loop = [c for c in result.checks if c.name == "alias_loop"]
+        assert loop and loop[0].message.endswith("first-checker -> second-checker -> first-checker")
+
+
+class TestLinks:
+    def test_links_resolve_against_the_file_set_one_level_deep(self, tmp_path):
+        skill = make_skill(tmp_path, "link-checker", body=(
+            "See [guide](references/guide.md#setup), `scripts/run.py`, "
+            "[site](https://example.com) and [gone](references/gone.md).\n"
+            "Run `scripts/init_skill.py` from skill-creator.\n"))
+        (skill / "references").mkdir()
+        (skill / "references" / "guide.md").write_text(
+            "Back to [other](other.md) and [script](../scripts/run.py).\n")
+        (skill / "scripts").mkdir()
+        (skill / "scripts" / "run.py").write_text("#!/usr/bin/env python3\n")
+        doc = SkillDocument.parse(skill, (skill / "SKILL.md").read_text())
+        failed = {(c.name, c.severity, c.message) for c in linter.check_links(doc)}
+        assert failed == {
+            ("link_broken", "warning", "SKILL.md: 'references/gone.md' not found in skill"),
+            ("link_broken", "warning",
+             "references/guide.md: 'other.md' not found in skill (-> references/other.md)"),
+            ("path_missing", "info", "SKILL.md: 'scripts/init_skill.py' not found in skill"),
+        }
+
+    def test_reference_edit_changes_cache_key(self, tmp_path):
+        skill = make_skill(tmp_path, "link-checker")
+        (skill / "references").mkdir()
+        guide = skill / "references" / "guide.md"
+        guide.write_text("[a](a.md)\n")
+        before = linter.skill_cache_key(skill)
+        guide.write_text("[b](b.md)\n")
+        assert linter.skill_cache_key(skill) != before
+
+
+class TestContextCost:
+    def test_estimate_is_memoized_by_content(self):
+        text = "Run `lint_skill.py --all` before release.\n"
+        assert linter.estimate_tokens(text) == linter.estimate_tokens(text) > 0
+        assert linter.estimate_tokens("x" * 40) == 10
+        assert len(linter._token_memo) >= 2
+
+    def test_content_memos_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(linter, "MEMO_LIMIT", 3)
+        for i in range(10):
+            linter.estimate_tokens(f"buffer {i}")
+            linter.extract_frontmatter(f"---\nname: n{i}\n---\n")
+        assert len(linter._token_memo) <= 3 and len(linter._frontmatter_memo) <= 3
+        assert linter.extract_frontmatter("---\nname: n9\n---\n")[0] == {"name": "n9"}
+
+    def test_worst_path_follows_reference_links(self, tmp_path):
+        skill = make_skill(tmp_path, "cost-checker", body=(
+            "See [a](references/a.md) or [b](references/b.md).\n"))
+        refs = skill / "references"
+        refs.mkdir()
+        (refs / "a.md").write_text("Then [c](c.md).\n" + "word " * 100)
+        (refs / "b.md").write_text("Back to [a](a.md).\n" + "word " * 10)
+        (refs / "c.md").write_text("Back to [b](b.md).\n" + "word " * 300)
+        cost = linter.context_cost(SkillDocument.parse(skill, (skill / "SKILL.md").read_text()))
+        assert cost.worst_path == ["references/a.md", "references/c.md", "references/b.md"]
+        assert cost.worst_path_tokens == cost.body + sum(cost.references.values())
+
+    def test_heavy_body_with_thin_references_is_flagged(self, tmp_path):
+        skill = make_skill(tmp_path, "cost-checker", body="detail " * 5000)
+        checks = {c.name: c for c in lint_skill(skill).checks}
+        assert checks["context_heavy_body"].severity == "info"
+        (skill / "references").mkdir()
+        (skill / "references" / "more.md").write_text("detail " * 4000)
+        assert "context_cost" in {c.name for c in lint_skill(skill).checks}
+
+
+class TestCatalog:
+    def test_ranks_descriptions_once_per_skill_across_roots(self, tmp_path):
+        local = tmp_path / "skills"
+        make_skill(local, "short-checker", description="Checks short things. (user)")
+        make_skill(local, "long-checker", description=(
+            "Validates long-checker fixtures before any release, at length. Triggers on "
+            "'check long', 'lint long', 'verify long'. (user)"))
+        home = tmp_path / "home-skills"
+        home.mkdir()
+        (home / "long-checker").symlink_to(local / "long-checker")
+        make_skill(home, "home-checker")
+        entries = linter.catalog_entries([local, home])
+        assert [e.name for e in entries] == ["long-checker", "home-checker", "short-checker"]
+        assert entries[0].root == local
+
+    def test_budget_warning(self, tmp_path):
+        make_skill(tmp_path, "one-checker")
+        entries = linter.catalog_entries([tmp_path])
+        assert "WARNING" not in linter.format_catalog(entries, budget=1000)
+        assert "WARNING" in linter.format_catalog(entries, budget=entries[0].tokens - 1)
+        report = json.loads(linter.format_catalog(entries, budget=1, format_type="json"))
+        assert report["over_budget"] and report["tokens"] == entries[0].tokens
+
+
+class TestCheckRegistry:
+    def test_only_and_skip_select_registered_checks(self, tmp_path):
+        skill = make_skill(tmp_path, "registry-checker")
+        structural = linter.select_checks(only=["structure", "resources"])
+        result = lint_skill(skill, checks=structural)
+        assert not any(c.name.startswith(("register_", "description_")) for c in result.checks)
+        assert set(result.timings) == {"parse", "structure", "resources"}
+        assert [s.name for s in linter.select_checks(skip=["register"])] == \
+            ["frontmatter", "name", "description", "structure", "resources", "links",
+             "context"]
+        with pytest.raises(ValueError, match="bogus"):
+            linter.select_checks(only=["bogus"])
+
+    def test_selection_is_part_of_the_cache_key(self, tmp_path):
+        skill = make_skill(tmp_path, "registry-checker")
+        structural = linter.select_checks(only=["structure"])
+        assert linter.skill_cache_key(skill) != linter.skill_cache_key(skill, checks=structural)
+        full = linter.lint_skill_cached(skill, cache_dir=None)
+        partial = linter.lint_skill_cached(skill, cache_dir=None, checks=structural)
+        assert len(partial.checks) < len(full.checks)
+
+    def test_cli_json_reports_timings(self, tmp_path):
+        skill = make_skill(tmp_path, "registry-checker")
+        r = subprocess.run([sys.executable, str(LINT), str(skill), "--json", "--no-cache",
+                            "--skip", "register"], capture_output=True, text=True)
+        timings = json.loads(r.stdout)["timings"]
+        assert "register" not in timings and "description" in timings
+
+
+class TestWatch:
+    def test_relint_reruns_only_affected_checks(self, tmp_path):
+        skill = make_skill(tmp_path, "watch-checker")
+        calls = []
+        specs = [
+            linter.CheckSpec("body-probe", lambda doc: calls.append("body") or [],
+                             frozenset({"body"})),
+            linter.CheckSpec("files-probe", lambda doc: calls.append("files") or [],
+                             frozenset({"files"})),
+        ]
+        watcher = linter.SkillWatcher(skill, specs)
+        watcher.relint(linter.walk_skill_stats(skill))
+        assert calls == ["body", "files"]
+
+        (skill / "references").mkdir()
+        (skill / "references" / "guide.md").write_text("guide\n")
+        stats = linter.walk_skill_stats(skill)
+        changed = watcher.changed_since(stats)
+        assert changed == {"references/guide.md"}
+        watcher.relint(stats, changed)
+        assert calls == ["body", "files", "files"]
+        assert watcher.doc.has_dir("references")
+
+    def test_watch_prints_only_status_changes(self, tmp_path):
+        skill = make_skill(tmp_path, "watch-checker")
+        lines, stop = [], threading.Event()
+        thread = threading.Thread(target=linter.watch, args=(skill,), kwargs=dict(
+            interval=0.02, debounce=0.05, out=lines.append, stop=stop))
+        thread.start()
+        try:
+            deadline = time.monotonic() + 5
+            while len(lines) < 2 and thread.is_alive() and time.monotonic() < deadline:
+                stop.wait(0.01)
+            assert len(lines) >= 2, f"watch never reported its first lint: {lines!r}"
+            md = skill / "SKILL.md"
+            md.write_text(md.read_text().replace("name: watch-checker", "name: other-name"))
+            deadline = time.monotonic() + 5
+            while len(lines) <= 2 and thread.is_alive() and time.monotonic() < deadline:
+                stop.wait(0.02)
+        finally:
+            stop.set()
+            thread.join()
+        report = "\n".join(lines[2:])
+        assert re.search(r"SKILL.md: score \d+ -> \d+ \(FAIL\)", report)
+        assert "[name_dir_match] Name 'other-name'" in report
+        assert "register_" not in report            # unchanged checks stay quiet
+
+    def test_status_ignores_counts_in_messages(self):
+        def result(*checks):
+            return linter.LintResult("p", "p", True, checks=[linter.Check(*c) for c in checks])
+        old = result(("register_caps", False, "ALL CAPS words: 3", "warning"),
+                     ("line_count", False, "520 lines", "warning"),
+                     ("name_dir_match", False, "Name 'x' differs", "error"))
+        new = result(("register_caps", False, "ALL CAPS words: 4", "warning"),
+                     ("line_count", False, "530 lines", "error"),
+                     ("name_dir_match", True, "Name matches", "info"))
+        assert linter.status_changes(old, new) == [
+            "  error   [line_count] 530 lines",
+            "  fixed   [name_dir_match] Name 'x' differs",
+        ]
+
+
+class TestRegisterAnalysis:
+    def test_one_pass_counts_words_and_phrases(self):
+        text = (
+            "Use the API. Do not guess; you must\nnot skip. Never STOP, "
+            "always VERIFY the JSON's shape. Don't panic. Do, not."
+        )
+        m = analyze_register(text)
+        assert m.emphatic_caps == ["STOP", "VERIFY"]    # API, JSON are abbreviations
+        assert m.negations == 4     # do not, must\nnot (wrapped), never, don't
+        assert m.positives == 3     # use, always, verify
+        assert m.opening_threats == ["never", "do not", "must not"]
+
+    def test_headings_excluded_from_body_counts(self):
+        m = analyze_register("# NEVER EVER\n\nPlain, calm text.\n")
+        assert m.emphatic_caps == [] and m.negations == 0
+        assert m.opening_threats == []
+
+
+class TestColdStart:
+    def test_text_scoring_skips_yaml_and_reports_timing(self):
+        """score_description --text must not pay for lint_skill or PyYAML."""
+        probe = (
+            "import sys; sys.argv = ['score_description.py', '--text', 'Validates x.', '--timing']\n"
+            "import runpy\n"
+            "try: runpy.run_path('score_description.py', run_name='__main__')\n"
+            "except SystemExit: pass\n"
+            "print('yaml' in sys.modules, file=sys.stderr)\n"
+        )
+        r = subprocess.run([sys.executable, "-c", probe], cwd=LINTER_PATH,
+                           capture_output=True, text=True)
+        lines = r.stderr.strip().splitlines()
+        assert lines[0].startswith("timing: startup ")
+        assert "work " in lines[0] and "output " in lines[0]
+        assert lines[-1] == "False"
+
+    def test_startup_is_na_without_proc_or_psutil(self, monkeypatch, capsys):
+        import timing
+        def no_proc(*args, **kwargs):
+            raise FileNotFoundError("/proc/self/stat")
+        monkeypatch.setattr(timing, "open", no_proc, raising=False)
+        monkeypatch.setitem(sys.modules, "psutil", None)   # import psutil -> ImportError
+        timing.report_timing([("start", 0.0), ("work", 0.5)], file=sys.stdout)
+        assert capsys.readouterr().out.startswith("timing: startup n/a  work 500.0ms")
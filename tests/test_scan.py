@@ -102,3 +102,140 @@ def test_inert_categories_warn(tmp_path):
     r = run_scan(str(tmp_path), home=tmp_path)
     assert "categories inert" in r.stderr
     assert "person_names" in r.stderr
+
+
+def test_pathological_file_is_capped_not_listed(tmp_path):
+    """A generated fixture full of emails must not print every match: past the
+    per-category cap, matches are counted and summarised instead."""
+    emails = "\n".join(f"user{i}@mail.io" for i in range(500))
+    (tmp_path / "fixture.txt").write_text(emails + "\n")
+    cfg = tmp_path / "cfg.json"
+    cfg.write_text(json.dumps({"max_findings_per_category": 10}))
+    r = run_scan(str(tmp_path), "--config", str(cfg), home=tmp_path)
+    assert r.returncode == 0
+    assert "Findings: 10 total" in r.stdout
+    assert "490 more matches of email in fixture.txt" in r.stdout
+
+
+def test_cap_never_hides_a_secret(tmp_path):
+    """Secrets are scanned last; a file already full of lower-risk matches
+    must still list the secret and its location, not just count it."""
+    nested = tmp_path / "a" / "fixture.md"
+    nested.parent.mkdir()
+    emails = "\n".join(f"user{i}@mail.io" for i in range(300))
+    nested.write_text(f"{emails}\nkey {FAKE_SECRET} here\n")
+    r = run_scan(str(tmp_path), "--risk", "high", home=tmp_path)
+    assert r.returncode == 1
+    assert "HIGH: 1  MEDIUM: 0  LOW: 0" in r.stdout
+    assert "[secret] fixture.md:301" in r.stdout
+
+    r = run_scan(str(tmp_path), home=tmp_path)
+    assert "Findings: 51 total (+250 capped)" in r.stdout
+    assert "HIGH: 1  MEDIUM: 0  LOW: 50 (+250 capped)" in r.stdout
+    assert "250 more matches of email in a/fixture.md" in r.stdout
+
+
+def _git(repo, *args):
+    subprocess.run(["git", "-c", "user.name=t", "-c", "user.email=t@t.invalid",
+                    *args], cwd=repo, check=True, capture_output=True)
+
+
+def test_since_ref_scans_only_changed_files(tmp_path):
+    """--since-ref looks at the commits since REF plus the working tree, and
+    `last` resumes from the commit the previous scan recorded."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    (repo / "old.md").write_text("nothing sensitive here\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "one")
+    full = run_scan(str(repo), home=tmp_path)
+    assert "Files scanned: 1" in full.stdout
+
+    (repo / "new.md").write_text(f"key {FAKE_SECRET} here\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "two")
+    (repo / "draft.md").write_text("uncommitted, still scanned\n")
+    r = run_scan(str(repo), "--since-ref", "last", home=tmp_path)
+    assert "Files scanned: 2" in r.stdout       # new.md + draft.md, not old.md
+    assert r.returncode == 1
+
+    # The run above recorded HEAD; with nothing committed since, only the
+    # working-tree file is left, and an empty delta is not a scanner failure.
+    (repo / "draft.md").unlink()
+    again = run_scan(str(repo), "--since-ref", "last", home=tmp_path)
+    assert "Files scanned: 0" in again.stdout
+    assert again.returncode == 0
+
+
+def test_explicit_since_ref_is_not_recorded_as_scanned(tmp_path):
+    """A scan from an arbitrary ref never saw the history before it, so
+    `last` must not resume from its HEAD."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    (repo / "old.md").write_text(f"key {FAKE_SECRET} here\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "one")
+    (repo / "new.md").write_text("nothing sensitive here\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "two")
+    partial = run_scan(str(repo), "--since-ref", "HEAD~1", home=tmp_path)
+    assert "Files scanned: 1" in partial.stdout
+    assert not (tmp_path / ".claude" / "sharing-scan-state.json").exists()
+
+    r = run_scan(str(repo), "--since-ref", "last", home=tmp_path)
+    assert "no recorded scan" in r.stderr
+    assert "Files scanned: 2" in r.stdout
+    assert r.returncode == 1
+
+
+def test_since_ref_sees_non_ascii_file_names(tmp_path):
+    """git quotes non-ASCII paths unless asked for -z; a quoted name matches
+    no file, and a secret in it would be skipped."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    (repo / "a.md").write_text("clean\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "one")
+    (repo / "café.md").write_text(f"key {FAKE_SECRET} here\n")
+    r = run_scan(str(repo), "--since-ref", "HEAD", home=tmp_path)
+    assert "Files scanned: 1" in r.stdout
+    assert "[secret] café.md:1" in r.stdout
+    assert r.returncode == 1
+
+
+def test_since_ref_unknown_ref_fails_loudly(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q")
+    (repo / "a.md").write_text("clean\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-qm", "one")
+    r = run_scan(str(repo), "--since-ref", "no-such-ref", home=tmp_path)
+    assert r.returncode == 2
+    assert "Unknown git ref" in r.stdout
+
+
+def test_exclude_globs_match_names_and_trailing_paths(tmp_path):
+    """Globs without '/' match file names; globs with '/' match the tail of
+    the root-relative path; excluded dir names prune at any depth."""
+    for rel in ("docs/guide.md", "notes.txt", "keep/docs.md",
+                "a/node_modules/pkg/index.js", "SKILL.md"):
+        f = tmp_path / "tree" / rel
+        f.parent.mkdir(parents=True, exist_ok=True)
+        f.write_text(f"key {FAKE_SECRET} here\n")
+    cfg = tmp_path / "cfg.json"
+    cfg.write_text(json.dumps({"exclude_files": ["docs/*.md", "*.txt"]}))
+    r = run_scan(str(tmp_path / "tree"), "--config", str(cfg), home=tmp_path)
+    assert "Files scanned: 2" in r.stdout        # keep/docs.md + SKILL.md
+
+
+def test_timing_uses_the_shared_report(tmp_path):
+    (tmp_path / "a.md").write_text("clean\n")
+    r = run_scan(str(tmp_path), "--timing", home=tmp_path)
+    assert r.returncode == 0
+    line = r.stderr.strip().splitlines()[-1]
+    assert line.startswith("timing: startup ")
+    assert "work " in line and "output " in line
@@ -0,0 +1,192 @@
+"""Tests for the CSO description scorer (skills/skill-forge/scripts/score_description.py).
+
+The shared description analysis, corpus streaming and the feature-vector
+re-scoring path, on generated descriptions and tmp-dir corpora.
+"""
+
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from conftest import LINTER_PATH, REPO_ROOT
+import lint_skill as linter
+from lint_skill import SkillDocument
+
+
+class TestDescriptionFeatures:
+    def test_lint_and_score_share_one_analysis(self):
+        from score_description import describe, score_description
+        desc = "Helps with release checks before any deploy. Triggers on 'ship it'. (user)"
+        describe.cache_clear()
+        checks = {c.name: c for c in linter.check_description(
+            SkillDocument.parse(Path("/tmp"), f"---\nname: x\ndescription: {desc}\n---\n"))}
+        components = {c.name: c for c in score_description(desc).components}
+        assert describe.cache_info().misses == 1
+        assert checks["description_triggers"].message == "Has 1 trigger phrase(s) in quotes"
+        assert checks["description_vague"].message == "'Helps with' is vague"
+        assert components["specificity"].suggestions == ["Remove or replace: 'helps with' is vague"]
+        assert components["timing_gates"].details.startswith("Specific lifecycle context")
+
+    def test_needle_prefilter_matches_plain_search(self):
+        """Skipping patterns whose needle is absent never changes what matches."""
+        import random
+        import score_description as sd
+        words = ("Provides A WAY to HELPS WITH ſimply juſt İnvoke KIT can be used 3-Step "
+                 "ensures PREVENTS workflow frameworkflow (detail) a: b 12 Guides may be "
+                 "various general basically assists template method").split()
+        rng = random.Random(7)
+        tables = [("methods", sd.METHOD_PATTERNS, re.IGNORECASE),
+                  ("values", sd.VALUE_PATTERNS, re.IGNORECASE),
+                  ("vague", sd.VAGUE_PATTERNS, re.IGNORECASE),
+                  ("specifics", sd.SPECIFIC_PATTERNS, 0)]
+        for _ in range(2000):
+            desc = " ".join(rng.choice(words) for _ in range(rng.randint(0, 12)))
+            features = sd.describe(desc)
+            for field_name, table, flags in tables:
+                expected = [label for pattern, _, label in table
+                            if re.search(pattern, desc, flags)]
+                assert sorted(getattr(features, field_name)) == sorted(expected), desc
+
+
+class TestCorpusScoring:
+    RECORDS = [{"name": f"skill-{i}",
+                "description": f"Validates {i} fixtures before release. Triggers on 'check {i}'."}
+               for i in range(5)]
+
+    def test_pool_keeps_input_order(self):
+        from score_description import iter_score_corpus, score_description
+        lines = [json.dumps(r) + "\n" for r in self.RECORDS]
+        scored = list(iter_score_corpus(lines, workers=2, batch_size=2))
+        assert [s["name"] for s in scored] == [r["name"] for r in self.RECORDS]
+        assert [s["total_score"] for s in scored] == \
+            [score_description(r["description"]).total_score for r in self.RECORDS]
+
+    def test_cli_streams_ndjson_from_stdin(self):
+        stdin = json.dumps(self.RECORDS[0]) + "\n\nnot json\n" + json.dumps({"name": "x"}) + "\n"
+        r = subprocess.run([sys.executable, str(LINTER_PATH / "score_description.py"),
+                            "--corpus", "-"], input=stdin, capture_output=True, text=True)
+        lines = [json.loads(line) for line in r.stdout.splitlines()]
+        assert lines[0]["name"] == "skill-0" and lines[0]["components"]
+        assert lines[1]["line"] == 3 and "Invalid JSON" in lines[1]["error"]
+        assert lines[2]["error"] == "Record has no string 'description'"
+        assert lines[3]["summary"]["records"] == 3 and lines[3]["summary"]["errors"] == 2
+        assert r.returncode == 1
+
+    def test_bad_utf8_costs_only_its_line(self, tmp_path):
+        corpus = tmp_path / "corpus.jsonl"
+        good = json.dumps(self.RECORDS[0]).encode()
+        corpus.write_bytes(good + b"\n" + b'{"name": "\xff"}\n' + good + b"\n")
+        r = subprocess.run([sys.executable, str(LINTER_PATH / "score_description.py"),
+                            "--corpus", str(corpus)], capture_output=True, text=True)
+        lines = [json.loads(line) for line in r.stdout.splitlines()]
+        assert [line.get("name") for line in lines[:3:2]] == ["skill-0", "skill-0"]
+        assert lines[1]["line"] == 2 and lines[1]["error"].startswith("Invalid UTF-8")
+        assert lines[3]["summary"] == {"records": 3, "errors": 1,
+                                       "grades": lines[3]["summary"]["grades"]}
+
+
+class TestFeatureVectors:
+    @staticmethod
+    def descriptions():
+        import random
+        words = ("Validates guides before any first when after during 'check it' \"run it\" "
+                 "MUST mandatory required always triggers on 4-step workflow ensures prevents "
+                 "helps with simply (detail) a: 12 — Use orchestrates tracks manages").split()
+        rng = random.Random(3)
+        found = [linter.extract_frontmatter(p.read_text())[0]["description"]
+                 for p in sorted((REPO_ROOT / "skills").glob("*/SKILL.md"))]
+        return found + [" ".join(rng.choice(words) for _ in range(rng.randint(1, 150)))
+                        for _ in range(500)]
+
+    @pytest.mark.parametrize("use_numpy", [False, True])
+    def test_default_weights_reproduce_scalar_scores(self, use_numpy):
+        import score_description as sd
+        if use_numpy:
+            pytest.importorskip("numpy")
+        descs = self.descriptions()
+        vectors = sd.score_vectors([sd.feature_vector(d) for d in descs], use_numpy=use_numpy)
+        for desc, vector in zip(descs, vectors):
+            scalar = sd.score_description(desc)
+            assert vector == {
+                "total_score": scalar.total_score, "max_score": scalar.max_score,
+                "grade": scalar.grade,
+                "components": {c.name: c.score for c in scalar.components},
+            }, desc
+
+    @pytest.mark.parametrize("use_numpy", [False, True])
+    def test_fractional_weights_match_the_formula(self, use_numpy):
+        import score_description as sd
+        if use_numpy:
+            pytest.importorskip("numpy")
+        weights = {name: {**spec, "base": spec["base"] + 0.5,
+                          "weights": {f: w * 0.75 for f, w in spec["weights"].items()}}
+                   for name, spec in sd.DEFAULT_WEIGHTS.items()}
+        rows = [sd.feature_vector(d) for d in self.descriptions()]
+        for row, got in zip(rows, sd.score_vectors(rows, weights, use_numpy=use_numpy)):
+            expected = {}
+            for name, spec in weights.items():
+                raw = spec["base"] + sum(w * row[sd.FEATURE_NAMES.index(f)]
+                                         for f, w in spec["weights"].items())
+                expected[name] = min(max(raw, 0), spec["max_points"])
+            assert got["components"] == pytest.approx(expected, abs=0.005)
+            assert got["total_score"] == pytest.approx(sum(expected.values()), abs=0.01)
+            assert got["grade"] == sd.calculate_grade(sum(expected.values()), got["max_score"])
+
+    @pytest.mark.parametrize("overrides, named", [
+        ([1, 2], "Expected an object"),
+        ({"length": 5}, "length: expected an object"),
+        ({"length": {"base": "2"}}, "length.base"),
+        ({"length": {"max_points": True}}, "length.max_points"),
+        ({"length": {"weights": [1]}}, "length.weights"),
+        ({"length": {"weights": {"triggers": "x"}}}, "length.weights.triggers"),
+        ({"length": {"scale": 2}}, "unknown key: scale"),
+    ])
+    def test_malformed_weights_are_usage_errors(self, tmp_path, overrides, named):
+        import score_description as sd
+        weights = tmp_path / "weights.json"
+        weights.write_text(json.dumps(overrides))
+        with pytest.raises(ValueError, match=re.escape(named)):
+            sd.load_weights(weights)
+        r = subprocess.run([sys.executable, str(LINTER_PATH / "score_description.py"),
+                            "--corpus", "-", "--weights", str(weights)],
+                           input="", capture_output=True, text=True)
+        assert r.returncode == 2 and named in r.stderr and "Traceback" not in r.stderr
+
+    def test_weights_file_rescores_cached_matrix(self, tmp_path):
+        corpus = tmp_path / "corpus.jsonl"
+        corpus.write_text(json.dumps({"name": "a", "description":
+                                      "Validates x before y. Triggers on 'a', 'b'."}) + "\n")
+        weights = tmp_path / "weights.json"
+        weights.write_text(json.dumps({"trigger_phrases": {"weights": {"triggers": 1}}}))
+        cmd = [sys.executable, str(LINTER_PATH / "score_description.py"),
+               "--corpus", str(corpus), "--weights", str(weights)]
+        env = {**os.environ, "XDG_CACHE_HOME": str(tmp_path / "cache")}
+        first = subprocess.run(cmd, capture_output=True, text=True, env=env)
+        assert json.loads(first.stdout.splitlines()[0])["components"]["trigger_phrases"] == 2
+        assert len(list((tmp_path / "cache" / "trousse" / "cso-features").iterdir())) == 1
+        assert subprocess.run(cmd, capture_output=True, text=True, env=env).stdout == first.stdout
+
+        weights.write_text(json.dumps({"length": {"weights": {"bogus": 1}}}))
+        r = subprocess.run(cmd, capture_output=True, text=True, env=env)
+        assert r.returncode == 2 and "bogus" in r.stderr
+
+        corpus.write_bytes(b'{"name": "\xff", "description": "x"}\n')
+        weights.write_text("{}")
+        r = subprocess.run(cmd, capture_output=True, text=True, env=env)
+        assert r.returncode == 2 and "not UTF-8" in r.stderr
+
+    def test_feature_cache_keeps_the_most_recent(self, tmp_path, monkeypatch):
+        import score_description as sd
+        monkeypatch.setattr(sd, "FEATURE_CACHE_LIMIT", 2)
+        corpora = [json.dumps({"name": str(i), "description": f"d {i}"}).encode()
+                   for i in range(4)]
+        for data in corpora:
+            sd.corpus_matrix(data, tmp_path)
+        assert len(list(tmp_path.glob("*.json"))) == 2
+        newest = max(tmp_path.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        assert json.loads(newest.read_text())["records"] == [{"line": 1, "name": "3"}]
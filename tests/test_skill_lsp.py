@@ -0,0 +1,111 @@
+"""Tests for the SKILL.md language server (skills/skill-forge/scripts/skill_lsp.py).
+
+The server is driven as an editor would drive it: a subprocess speaking
+Content-Length framed JSON-RPC over stdio.
+"""
+
+import json
+import subprocess
+import sys
+
+from conftest import LINTER_PATH
+from lint_skill import SkillDocument, check_register
+from skill_lsp import diagnostics, read_message
+
+SERVER = LINTER_PATH / "skill_lsp.py"
+
+
+class Session:
+    def __init__(self):
+        self.proc = subprocess.Popen([sys.executable, str(SERVER)],
+                                     stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+    def send(self, method, params=None, msg_id=None):
+        message = {"jsonrpc": "2.0", "method": method, "params": params or {}}
+        if msg_id is not None:
+            message["id"] = msg_id
+        body = json.dumps(message).encode()
+        self.proc.stdin.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        self.proc.stdin.flush()
+
+    def receive(self):
+        return read_message(self.proc.stdout)
+
+
+def test_buffer_diagnostics_on_open_and_change(tmp_path):
+    skill = tmp_path / "lsp-checker"
+    skill.mkdir()
+    uri = (skill / "SKILL.md").as_uri()      # never written: the buffer is the source
+    text = ("---\nname: wrong-name\ndescription: Validates skills before release. "
+            "Triggers on 'lint my skill'. (user)\n---\n\n# Checker\n")
+    session = Session()
+    try:
+        session.send("initialize", {"capabilities": {}}, msg_id=1)
+        init = session.receive()
+        assert init["result"]["capabilities"]["textDocumentSync"]["change"] == 1
+
+        session.send("textDocument/didOpen", {"textDocument": {
+            "uri": uri, "languageId": "markdown", "version": 1, "text": text}})
+        published = session.receive()
+        assert published["method"] == "textDocument/publishDiagnostics"
+        by_code = {d["code"]: d for d in published["params"]["diagnostics"]}
+        assert by_code["name_dir_match"]["range"]["start"]["line"] == 1
+        assert by_code["name_dir_match"]["severity"] == 1
+        assert by_code["cso_score"]["range"]["start"]["line"] == 2
+
+        session.send("textDocument/didChange", {
+            "textDocument": {"uri": uri, "version": 2},
+            "contentChanges": [{"text": text.replace("wrong-name", "lsp-checker")}]})
+        codes = {d["code"] for d in session.receive()["params"]["diagnostics"]}
+        assert "name_dir_match" not in codes and "cso_score" in codes
+
+        session.send("textDocument/definition", {}, msg_id=2)
+        assert session.receive()["error"]["code"] == -32601
+
+        session.send("shutdown", msg_id=3)
+        assert session.receive() == {"jsonrpc": "2.0", "id": 3, "result": None}
+        session.send("exit")
+        assert session.proc.wait(timeout=10) == 0
+    finally:
+        session.proc.kill()
+
+
+def test_unreadable_message_does_not_end_the_session():
+    session = Session()
+    try:
+        for body in (b"{not json", b"[1, 2]"):
+            session.proc.stdin.write(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        session.proc.stdin.write(b"Content-Length: \xff\r\n\r\n")
+        session.proc.stdin.flush()
+        assert session.receive()["error"]["code"] == -32700
+        assert session.receive()["error"]["code"] == -32600
+        assert session.receive()["error"]["code"] == -32700
+        session.send("shutdown", msg_id=1)
+        assert session.receive() == {"jsonrpc": "2.0", "id": 1, "result": None}
+        session.send("exit")
+        assert session.proc.wait(timeout=10) == 0
+    finally:
+        session.proc.kill()
+
+
+def test_header_without_content_length_is_an_error_not_eof():
+    session = Session()
+    try:
+        session.proc.stdin.write(b"Content-Type: application/vscode-jsonrpc\r\n\r\n")
+        session.proc.stdin.flush()
+        assert session.receive()["error"]["code"] == -32700
+        session.send("shutdown", msg_id=1)
+        assert session.receive() == {"jsonrpc": "2.0", "id": 1, "result": None}
+        session.send("exit")
+        assert session.proc.wait(timeout=10) == 0
+    finally:
+        session.proc.kill()
+
+
+def test_caps_diagnostic_skips_fences_and_headings(tmp_path):
+    text = ("---\nname: caps\n---\n\n# NEVER Mind\n\n```\nNEVER run this\n```\n\n"
+            "Always do it. NEVER skip, MUST run, ALWAYS check, NEVER guess, STOP early, ONLY once.\n")
+    doc = SkillDocument.parse(tmp_path, text)
+    caps = [d for d in diagnostics(doc, check_register(doc)) if d["code"] == "register_caps"]
+    assert caps[0]["range"] == {"start": {"line": 10, "character": 14},
+                                "end": {"line": 10, "character": 19}}
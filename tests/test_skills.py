@@ -17,6 +17,8 @@ from pathlib import Path
 
 import pytest
 
+from lint_skill import SkillDocument, check_links
+
 
 class TestSkillStructure:
     """CSO linter validation — structural quality."""
@@ -63,46 +65,19 @@ class TestReferencedFiles:
         assert not missing, f"Missing reference files: {missing}"
 
     def test_referenced_paths_exist(self, skill_path: Path):
-        """Reference paths mentioned in SKILL.md should exist.
+        """Links and references/ paths in SKILL.md and its references resolve.
 
-        Only checks references/ paths (definitionally skill-local).
-        scripts/ paths are not checked — they often refer to
-        external tools (accomplis, skill-creator, etc.).
+        Runs lint_skill's check_links, which also follows one level into
+        references/*.md. Missing scripts/ and assets/ paths are only info
+        there — they often refer to external tools (accomplis,
+        skill-creator, etc.) — so only broken links fail this test.
         """
-        skill_md = skill_path / "SKILL.md"
-        content = skill_md.read_text()
-
-        # Find markdown links to references/ files
-        # Pattern: [text](references/foo.md) or `references/foo.md`
-        ref_patterns = [
-            r'\]\(references/[\w.-]+\.md\)',  # markdown links
-            r'`references/[\w.-]+\.md`',       # backtick references
-            r'(?<![`\w])references/[\w.-]+\.md(?![`\w])',  # bare references
-        ]
-
-        refs = []
-        for pattern in ref_patterns:
-            matches = re.findall(pattern, content)
-            for m in matches:
-                # Extract just the path
-                path = re.search(r'references/[\w.-]+\.md', m)
-                if path:
-                    refs.append(path.group())
-
-        # Deduplicate and filter template/example patterns
-        refs = list(set(refs))
-        template_patterns = ['api_reference.md', 'example']
-        refs = [r for r in refs if not any(t in r for t in template_patterns)]
-
-        missing = []
-        for ref in refs:
-            ref_path = skill_path / ref
-            if not ref_path.exists():
-                missing.append(ref)
+        doc = SkillDocument.parse(skill_path, (skill_path / "SKILL.md").read_text())
+        broken = [c.message for c in check_links(doc) if c.name == "link_broken"]
 
-        assert not missing, (
+        assert not broken, (
             f"Referenced files don't exist:\n"
-            + "\n".join(f"  - {r}" for r in missing)
+            + "\n".join(f"  - {m}" for m in broken)
         )
 
 